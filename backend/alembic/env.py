@@ -9,6 +9,8 @@ from app.core.config import settings
 from app.core.database import Base
 import app.modules.customers.models  # noqa: F401
 import app.modules.dashboard.models  # noqa: F401
+import app.modules.documents.models  # noqa: F401
+import app.modules.reports.models  # noqa: F401
 
 config = context.config
 
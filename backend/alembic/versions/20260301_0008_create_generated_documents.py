@@ -0,0 +1,53 @@
+"""create generated documents catalog table
+
+Revision ID: 20260301_0008
+Revises: 20260227_0007
+Create Date: 2026-03-01 10:00:00
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20260301_0008"
+down_revision = "20260227_0007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "generated_documents",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("customer_id", sa.Integer(), nullable=True),
+        sa.Column("template_key", sa.String(length=40), nullable=True),
+        sa.Column("object_key", sa.String(length=512), nullable=False),
+        sa.Column("size_bytes", sa.BigInteger(), nullable=True),
+        sa.Column("generated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(["customer_id"], ["customers.id"], ondelete="SET NULL"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("object_key"),
+    )
+    op.create_index("ix_generated_documents_generated_at_id", "generated_documents", ["generated_at", "id"], unique=False)
+    op.create_index(
+        "ix_generated_documents_customer_generated_at_id",
+        "generated_documents",
+        ["customer_id", "generated_at", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_generated_documents_template_generated_at_id",
+        "generated_documents",
+        ["template_key", "generated_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_generated_documents_template_generated_at_id", table_name="generated_documents")
+    op.drop_index("ix_generated_documents_customer_generated_at_id", table_name="generated_documents")
+    op.drop_index("ix_generated_documents_generated_at_id", table_name="generated_documents")
+    op.drop_table("generated_documents")
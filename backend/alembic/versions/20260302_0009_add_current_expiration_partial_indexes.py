@@ -0,0 +1,55 @@
+"""add partial indexes for current document expirations and active customers
+
+Revision ID: 20260302_0009
+Revises: 20260301_0008
+Create Date: 2026-03-02 09:30:00
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20260302_0009"
+down_revision = "20260301_0008"
+branch_labels = None
+depends_on = None
+
+CURRENT_EXPIRATION_INDEXES = (
+    ("ix_nj_driver_licenses_current_expiration", "nj_driver_licenses"),
+    ("ix_brazil_driver_licenses_current_expiration", "brazil_driver_licenses"),
+    ("ix_passports_current_expiration", "passports"),
+)
+
+
+def upgrade() -> None:
+    # Predicates use the same `IS true` form the ORM emits for `.is_(True)` filters so the planner matches them.
+    # CONCURRENTLY keeps the document tables writable while the indexes build; it cannot run in a transaction.
+    with op.get_context().autocommit_block():
+        for index_name, table_name in CURRENT_EXPIRATION_INDEXES:
+            op.create_index(
+                index_name,
+                table_name,
+                ["expiration_date"],
+                unique=False,
+                postgresql_where=sa.text("active IS true AND is_current IS true AND expiration_date IS NOT NULL"),
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        op.create_index(
+            "ix_customers_active_id",
+            "customers",
+            ["id"],
+            unique=False,
+            postgresql_where=sa.text("active IS true"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_customers_active_id", table_name="customers", postgresql_concurrently=True, if_exists=True)
+        for index_name, table_name in reversed(CURRENT_EXPIRATION_INDEXES):
+            op.drop_index(index_name, table_name=table_name, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,50 @@
+"""create report jobs table
+
+Revision ID: 20260303_0010
+Revises: 20260302_0009
+Create Date: 2026-03-03 10:00:00
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20260303_0010"
+down_revision = "20260302_0009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "report_jobs",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("report_key", sa.String(length=80), nullable=False),
+        sa.Column("report_format", sa.String(length=10), nullable=False),
+        sa.Column("params_key", sa.String(length=255), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("object_key", sa.String(length=512), nullable=True),
+        sa.Column("file_name", sa.String(length=255), nullable=True),
+        sa.Column("content_type", sa.String(length=100), nullable=True),
+        sa.Column("size_bytes", sa.BigInteger(), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_report_jobs_lookup",
+        "report_jobs",
+        ["report_key", "report_format", "params_key", "created_at"],
+        unique=False,
+    )
+    op.create_index("ix_report_jobs_status", "report_jobs", ["status"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_report_jobs_status", table_name="report_jobs")
+    op.drop_index("ix_report_jobs_lookup", table_name="report_jobs")
+    op.drop_table("report_jobs")
@@ -0,0 +1,73 @@
+"""add trigram-indexed search columns to customers
+
+Revision ID: 20260304_0011
+Revises: 20260303_0010
+Create Date: 2026-03-04 09:00:00
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20260304_0011"
+down_revision = "20260303_0010"
+branch_labels = None
+depends_on = None
+
+SEARCH_TEXT_SQL = (
+    "immutable_unaccent(lower("
+    "first_name || ' ' || last_name"
+    " || ' ' || coalesce(email, '')"
+    " || ' ' || coalesce(instagram_handle, '')"
+    "))"
+)
+PHONE_DIGITS_SQL = "regexp_replace(coalesce(phone_number, ''), '[^0-9]', '', 'g')"
+
+TRIGRAM_INDEXES = (
+    ("ix_customers_search_text_trgm", "search_text"),
+    ("ix_customers_phone_digits_trgm", "phone_digits"),
+)
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute("CREATE EXTENSION IF NOT EXISTS unaccent WITH SCHEMA public")
+    # unaccent() is only STABLE (its dictionary can change), so generated columns and indexes need an
+    # IMMUTABLE wrapper that pins the dictionary explicitly.
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION immutable_unaccent(text) RETURNS text
+        LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT
+        AS $$ SELECT public.unaccent('public.unaccent'::regdictionary, $1) $$
+        """
+    )
+    op.add_column("customers", sa.Column("search_text", sa.Text(), sa.Computed(SEARCH_TEXT_SQL, persisted=True)))
+    op.add_column(
+        "customers",
+        sa.Column("phone_digits", sa.String(length=30), sa.Computed(PHONE_DIGITS_SQL, persisted=True)),
+    )
+
+    with op.get_context().autocommit_block():
+        for index_name, column_name in TRIGRAM_INDEXES:
+            op.create_index(
+                index_name,
+                "customers",
+                [column_name],
+                unique=False,
+                postgresql_using="gin",
+                postgresql_ops={column_name: "gin_trgm_ops"},
+                postgresql_where=sa.text("active IS true"),
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index_name, _ in reversed(TRIGRAM_INDEXES):
+            op.drop_index(index_name, table_name="customers", postgresql_concurrently=True, if_exists=True)
+    op.drop_column("customers", "phone_digits")
+    op.drop_column("customers", "search_text")
+    op.execute("DROP FUNCTION IF EXISTS immutable_unaccent(text)")
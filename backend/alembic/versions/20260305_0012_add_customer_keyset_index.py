@@ -0,0 +1,42 @@
+"""add keyset pagination index for the customer list
+
+Revision ID: 20260305_0012
+Revises: 20260304_0011
+Create Date: 2026-03-05 09:00:00
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20260305_0012"
+down_revision = "20260304_0011"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Serves both ORDER BY created_at DESC, id DESC and the (created_at, id) < cursor seek with a backward
+    # index scan over active customers only.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_customers_active_created_at_id",
+            "customers",
+            ["created_at", "id"],
+            unique=False,
+            postgresql_where=sa.text("active IS true"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_customers_active_created_at_id",
+            table_name="customers",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
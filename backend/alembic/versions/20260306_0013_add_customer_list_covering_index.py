@@ -0,0 +1,72 @@
+"""replace the customer keyset index with a covering list index
+
+Revision ID: 20260306_0013
+Revises: 20260305_0012
+Create Date: 2026-03-06 09:00:00
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20260306_0013"
+down_revision = "20260305_0012"
+branch_labels = None
+depends_on = None
+
+# Same key and predicate as ix_customers_active_created_at_id, plus every column of the list projection, so
+# unfiltered list pages (OFFSET or cursor) are answered by an index-only scan without touching the heap.
+LIST_INCLUDE_COLUMNS = [
+    "first_name",
+    "middle_name",
+    "last_name",
+    "suffix",
+    "customer_photo_object_key",
+    "phone_number",
+    "email",
+    "date_of_birth",
+    "has_left_country",
+    "has_no_ssn",
+    "active",
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_customers_active_list",
+            "customers",
+            ["created_at", "id"],
+            unique=False,
+            postgresql_include=LIST_INCLUDE_COLUMNS,
+            postgresql_where=sa.text("active IS true"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_customers_active_created_at_id",
+            table_name="customers",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_customers_active_created_at_id",
+            "customers",
+            ["created_at", "id"],
+            unique=False,
+            postgresql_where=sa.text("active IS true"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_customers_active_list",
+            table_name="customers",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,27 @@
+"""add owner and heartbeat columns to report jobs
+
+Revision ID: 20260307_0014
+Revises: 20260306_0013
+Create Date: 2026-03-07 09:00:00
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20260307_0014"
+down_revision = "20260306_0013"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("report_jobs", sa.Column("worker_id", sa.String(length=120), nullable=True))
+    op.add_column("report_jobs", sa.Column("heartbeat_at", sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("report_jobs", "heartbeat_at")
+    op.drop_column("report_jobs", "worker_id")
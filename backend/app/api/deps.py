@@ -3,12 +3,13 @@ from __future__ import annotations
 from collections.abc import Generator
 
 import jwt
-from fastapi import HTTPException, Request, status
+from fastapi import Header, HTTPException, Request, status
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
 from app.core.database import SessionLocal
 from app.core.security import AuthUser, decode_access_token
+from app.deps.minio.minio_objects import ObjectReadOptions
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -27,3 +28,15 @@ def get_current_user(request: Request) -> AuthUser:
         return decode_access_token(token)
     except jwt.PyJWTError as exc:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid authentication token") from exc
+
+
+def get_object_read_options(
+    range_header: str | None = Header(default=None, alias="Range"),
+    if_none_match: str | None = Header(default=None),
+    if_modified_since: str | None = Header(default=None),
+) -> ObjectReadOptions:
+    return ObjectReadOptions(
+        byte_range=range_header,
+        if_none_match=if_none_match,
+        if_modified_since=if_modified_since,
+    )
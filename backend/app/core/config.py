@@ -15,9 +15,31 @@ class Settings(BaseSettings):
     MINIO_ROOT_PASSWORD: str
     MINIO_BUCKET: str
     MINIO_SECURE: bool = False
+    MINIO_REGION: str | None = None
     MINIO_STARTUP_STRICT: bool = False
+    MINIO_POOL_CONNECTIONS: int = 4
+    MINIO_POOL_MAXSIZE: int = 32
+    MINIO_POOL_BLOCK: bool = False
+    MINIO_CONNECT_TIMEOUT_SECONDS: float = 5.0
+    MINIO_READ_TIMEOUT_SECONDS: float = 60.0
+    MINIO_MAX_RETRIES: int = 3
+    MINIO_RETRY_BACKOFF_SECONDS: float = 0.2
+    MINIO_TCP_KEEPALIVE: bool = True
+    MINIO_STREAM_CHUNK_SIZE: int = 64 * 1024
+    STORED_OBJECT_CACHE_MAX_AGE_SECONDS: int = 7 * 24 * 60 * 60
+    MINIO_PRESIGNED_DOWNLOADS: bool = False
+    MINIO_PRESIGNED_URL_EXPIRE_SECONDS: int = 300
+    MINIO_PRESIGNED_PUBLIC_BASE_URL: str = "/storage"
+    MINIO_PRESIGNED_UPLOAD_EXPIRE_SECONDS: int = 600
     DOCUMENTS_DIR: str = "../documents"
     GENERATED_DOCUMENTS_PREFIX: str = "generated-documents"
+    DASHBOARD_SUMMARY_CACHE_TTL_SECONDS: int = 60
+    REPORTS_PREFIX: str = "reports"
+    REPORT_JOB_WORKERS: int = 2
+    REPORT_JOB_REUSE_SECONDS: int = 15 * 60
+    REPORT_JOB_RETENTION_SECONDS: int = 24 * 60 * 60
+    REPORT_JOB_HEARTBEAT_SECONDS: int = 30
+    REPORT_JOB_STALE_SECONDS: int = 2 * 60
     JWT_SECRET_KEY: str
     JWT_ALGORITHM: str = "HS256"
     JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int = 480
@@ -1,10 +1,68 @@
+import os
+import socket
+from threading import Lock
+
+import certifi
+import urllib3
 from minio import Minio
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
+
 from app.core.config import settings
 
+_client: Minio | None = None
+_client_lock = Lock()
+
+
 def get_minio_client() -> Minio:
+    # One client per process: Minio is thread-safe and reusing its PoolManager
+    # keeps TCP/TLS connections alive between requests.
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = _build_minio_client()
+    return _client
+
+
+def reset_minio_client() -> None:
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client._http.clear()
+        _client = None
+
+
+def _build_minio_client() -> Minio:
     return Minio(
         settings.MINIO_ENDPOINT,
         access_key=settings.MINIO_ROOT_USER,
         secret_key=settings.MINIO_ROOT_PASSWORD,
         secure=settings.MINIO_SECURE,
+        region=settings.MINIO_REGION,
+        http_client=_build_http_client(),
+    )
+
+
+def _build_http_client() -> urllib3.PoolManager:
+    socket_options = list(HTTPConnection.default_socket_options)
+    if settings.MINIO_TCP_KEEPALIVE:
+        socket_options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+
+    return urllib3.PoolManager(
+        num_pools=settings.MINIO_POOL_CONNECTIONS,
+        maxsize=settings.MINIO_POOL_MAXSIZE,
+        block=settings.MINIO_POOL_BLOCK,
+        timeout=urllib3.Timeout(
+            connect=settings.MINIO_CONNECT_TIMEOUT_SECONDS,
+            read=settings.MINIO_READ_TIMEOUT_SECONDS,
+        ),
+        retries=Retry(
+            total=settings.MINIO_MAX_RETRIES,
+            backoff_factor=settings.MINIO_RETRY_BACKOFF_SECONDS,
+            status_forcelist=[500, 502, 503, 504],
+        ),
+        socket_options=socket_options,
+        cert_reqs="CERT_REQUIRED",
+        ca_certs=os.environ.get("SSL_CERT_FILE") or certifi.where(),
     )
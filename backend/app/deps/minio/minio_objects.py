@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime, parsedate_to_datetime
+import re
+from typing import Literal
+from urllib.parse import urlsplit
+
+from minio.datatypes import Object, PostPolicy
+from minio.error import S3Error
+from urllib3 import BaseHTTPResponse
+
+from app.core.config import settings
+from app.deps.minio.minio_client import get_minio_client
+
+_SINGLE_BYTE_RANGE = re.compile(r"^bytes=(\d+-\d*|-\d+)$")
+
+ContentDisposition = Literal["inline", "attachment"]
+
+
+class ObjectRangeNotSatisfiableError(ValueError):
+    def __init__(self, message: str, object_size: int | None = None) -> None:
+        super().__init__(message)
+        self.object_size = object_size
+
+
+class ObjectNotModifiedError(ValueError):
+    def __init__(self, etag: str | None, last_modified: str | None) -> None:
+        super().__init__("Not modified")
+        self.etag = etag
+        self.last_modified = last_modified
+
+
+@dataclass(frozen=True)
+class ObjectReadOptions:
+    byte_range: str | None = None
+    if_none_match: str | None = None
+    if_modified_since: str | None = None
+
+    @property
+    def is_conditional(self) -> bool:
+        return bool(self.if_none_match or self.if_modified_since)
+
+
+@dataclass(frozen=True)
+class PresignedObject:
+    object_key: str
+    file_name: str
+    url: str
+
+
+@dataclass
+class StoredObject:
+    object_key: str
+    file_name: str
+    content_type: str
+    content_length: int | None
+    response: BaseHTTPResponse
+    disposition: ContentDisposition = "inline"
+    content_range: str | None = None
+    etag: str | None = None
+    last_modified: str | None = None
+    _closed: bool = field(default=False, init=False, repr=False)
+
+    @property
+    def is_partial(self) -> bool:
+        return self.content_range is not None
+
+    def iter_chunks(self) -> Iterator[bytes]:
+        try:
+            yield from self.response.stream(settings.MINIO_STREAM_CHUNK_SIZE)
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self.response.close()
+        self.response.release_conn()
+
+
+def _object_size(object_key: str, stat: Object | None) -> int | None:
+    # A 416 must report the current length (Content-Range: bytes */size); reuse the conditional HEAD if any.
+    if stat is None:
+        try:
+            stat = get_minio_client().stat_object(settings.MINIO_BUCKET, object_key)
+        except S3Error:
+            return None
+    return stat.size
+
+
+def open_stored_object(
+    object_key: str,
+    *,
+    file_name: str,
+    read_options: ObjectReadOptions | None = None,
+    disposition: ContentDisposition = "inline",
+) -> StoredObject | PresignedObject:
+    if settings.MINIO_PRESIGNED_DOWNLOADS:
+        return presign_stored_object(object_key, file_name=file_name, disposition=disposition)
+
+    # Unconditional reads are a single GET: content type/length come from the response headers.
+    # Conditional reads check validators with a HEAD first so a 304 never touches the object body.
+    # The caller owns the returned response until iter_chunks() is exhausted or close() is called.
+    options = read_options or ObjectReadOptions()
+    client = get_minio_client()
+
+    stat: Object | None = None
+    if options.is_conditional:
+        stat = client.stat_object(settings.MINIO_BUCKET, object_key)
+        etag = format_etag(stat.etag)
+        last_modified = format_http_date(stat.last_modified)
+        if is_not_modified(
+            etag=etag,
+            last_modified=stat.last_modified,
+            if_none_match=options.if_none_match,
+            if_modified_since=options.if_modified_since,
+        ):
+            raise ObjectNotModifiedError(etag=etag, last_modified=last_modified)
+
+    request_headers = {}
+    normalized_range = normalize_byte_range(options.byte_range)
+    if normalized_range:
+        request_headers["Range"] = normalized_range
+
+    try:
+        response = client.get_object(
+            settings.MINIO_BUCKET,
+            object_key,
+            request_headers=request_headers or None,
+        )
+    except S3Error as exc:
+        if (exc.code or "") == "InvalidRange":
+            raise ObjectRangeNotSatisfiableError(
+                f"Requested range not satisfiable: {options.byte_range}",
+                object_size=_object_size(object_key, stat),
+            ) from exc
+        raise
+
+    headers = response.headers
+    raw_length = headers.get("Content-Length") or ""
+    return StoredObject(
+        object_key=object_key,
+        file_name=file_name,
+        content_type=(headers.get("Content-Type") or "application/octet-stream").strip(),
+        content_length=int(raw_length) if raw_length.isdigit() else None,
+        response=response,
+        disposition=disposition,
+        content_range=headers.get("Content-Range") if response.status == 206 else None,
+        etag=format_etag(headers.get("ETag")),
+        last_modified=headers.get("Last-Modified"),
+    )
+
+
+def presign_stored_object(
+    object_key: str,
+    *,
+    file_name: str,
+    disposition: ContentDisposition = "inline",
+) -> PresignedObject:
+    # Signing is local (no MinIO round-trip once the bucket region is known). The browser then
+    # fetches the bytes from MinIO through the nginx /storage/ proxy, which also serves Range and 304s.
+    url = get_minio_client().presigned_get_object(
+        settings.MINIO_BUCKET,
+        object_key,
+        expires=timedelta(seconds=settings.MINIO_PRESIGNED_URL_EXPIRE_SECONDS),
+        response_headers={
+            "response-content-disposition": f'{disposition}; filename="{file_name}"',
+            "response-cache-control": f"private, max-age={settings.MINIO_PRESIGNED_URL_EXPIRE_SECONDS}",
+        },
+    )
+    return PresignedObject(object_key=object_key, file_name=file_name, url=to_public_presigned_url(url))
+
+
+def presign_upload_policy(
+    object_key: str,
+    *,
+    content_type: str,
+    max_size_bytes: int,
+) -> tuple[str, dict[str, str], datetime]:
+    # Browser-based POST upload: MinIO itself enforces the exact key, content type and size limit,
+    # so the bytes never pass through an API worker.
+    expires_at = datetime.now(UTC) + timedelta(seconds=settings.MINIO_PRESIGNED_UPLOAD_EXPIRE_SECONDS)
+    policy = PostPolicy(settings.MINIO_BUCKET, expires_at)
+    policy.add_equals_condition("key", object_key)
+    policy.add_equals_condition("Content-Type", content_type)
+    policy.add_content_length_range_condition(1, max_size_bytes)
+    form_fields = get_minio_client().presigned_post_policy(policy)
+    form_fields["key"] = object_key
+    form_fields["Content-Type"] = content_type
+    upload_url = f"{settings.MINIO_PRESIGNED_PUBLIC_BASE_URL.rstrip('/')}/{settings.MINIO_BUCKET}"
+    return upload_url, form_fields, expires_at
+
+
+def to_public_presigned_url(url: str) -> str:
+    # The signature covers the path and the internal Host header (which nginx restores), not the URL prefix.
+    parts = urlsplit(url)
+    base = settings.MINIO_PRESIGNED_PUBLIC_BASE_URL.rstrip("/")
+    return f"{base}{parts.path}?{parts.query}"
+
+
+def normalize_byte_range(value: str | None) -> str | None:
+    # Only a single byte range is forwarded; anything else is ignored and the full object is served (RFC 9110).
+    if not value:
+        return None
+    candidate = value.strip().replace(" ", "")
+    if not _SINGLE_BYTE_RANGE.match(candidate):
+        return None
+    start, _, end = candidate.removeprefix("bytes=").partition("-")
+    if start and end and int(end) < int(start):
+        return None
+    return candidate
+
+
+def format_etag(value: str | None) -> str | None:
+    if not value:
+        return None
+    return '"' + value.strip().removeprefix("W/").strip('"') + '"'
+
+
+def format_http_date(value: datetime | None) -> str | None:
+    if value is None:
+        return None
+    return format_datetime(value, usegmt=True)
+
+
+def is_not_modified(
+    *,
+    etag: str | None,
+    last_modified: datetime | None,
+    if_none_match: str | None,
+    if_modified_since: str | None,
+) -> bool:
+    # If-None-Match takes precedence over If-Modified-Since (RFC 9110 section 13.2.2).
+    if if_none_match:
+        if etag is None:
+            return False
+        candidates = {item.strip().removeprefix("W/") for item in if_none_match.split(",")}
+        return "*" in candidates or etag in candidates
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            return False
+        return last_modified.replace(microsecond=0) <= since
+    return False
@@ -7,13 +7,18 @@ from fastapi.responses import JSONResponse
 from app.api.deps import get_current_user
 from app.api.router import api_router
 from app.core.config import settings
+from app.deps.minio.minio_client import reset_minio_client
 from app.deps.minio.minio_init import init_minio_bucket
+from app.modules.reports.jobs import shutdown_report_job_workers, start_report_job_heartbeat
 from app.utils.health import check_database, check_minio
 
 @asynccontextmanager
 async def lifespan(_: FastAPI):
     init_minio_bucket(strict=settings.MINIO_STARTUP_STRICT)
+    start_report_job_heartbeat()
     yield
+    shutdown_report_job_workers()
+    reset_minio_client()
 
 app = FastAPI(
     title=settings.APP_NAME,
@@ -19,3 +19,7 @@ class CustomerPhotoNotFoundError(ValueError):
 
 class CustomerDocumentFileNotFoundError(ValueError):
     pass
+
+
+class InvalidCustomerCursorError(ValueError):
+    pass
@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import date
 from typing import TYPE_CHECKING
 
-from sqlalchemy import CheckConstraint, Date, Enum, Index, Integer, Numeric, String, Text
+from sqlalchemy import CheckConstraint, Computed, Date, Enum, Index, Integer, Numeric, String, Text, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -11,6 +11,17 @@ from app.core.database import Base
 from .enums import Gender
 from .mixins import TimestampMixin
 
+# Lower-cased, accent-free haystack for the customer search box. immutable_unaccent() is created by the
+# 20260304_0011 migration (unaccent itself is only STABLE and cannot back a generated column).
+CUSTOMER_SEARCH_TEXT_SQL = (
+    "immutable_unaccent(lower("
+    "first_name || ' ' || last_name"
+    " || ' ' || coalesce(email, '')"
+    " || ' ' || coalesce(instagram_handle, '')"
+    "))"
+)
+CUSTOMER_PHONE_DIGITS_SQL = "regexp_replace(coalesce(phone_number, ''), '[^0-9]', '', 'g')"
+
 if TYPE_CHECKING:
     from .address import CustomerAddress
     from .brazil_driver_license import BrazilDriverLicense
@@ -36,6 +47,40 @@ class Customer(TimestampMixin, Base):
             name="ck_customers_height_inches_range",
         ),
         Index("ix_customers_name_lookup", "last_name", "first_name"),
+        Index("ix_customers_active_id", "id", postgresql_where=text("active IS true")),
+        Index(
+            "ix_customers_active_list",
+            "created_at",
+            "id",
+            postgresql_include=[
+                "first_name",
+                "middle_name",
+                "last_name",
+                "suffix",
+                "customer_photo_object_key",
+                "phone_number",
+                "email",
+                "date_of_birth",
+                "has_left_country",
+                "has_no_ssn",
+                "active",
+            ],
+            postgresql_where=text("active IS true"),
+        ),
+        Index(
+            "ix_customers_search_text_trgm",
+            "search_text",
+            postgresql_using="gin",
+            postgresql_ops={"search_text": "gin_trgm_ops"},
+            postgresql_where=text("active IS true"),
+        ),
+        Index(
+            "ix_customers_phone_digits_trgm",
+            "phone_digits",
+            postgresql_using="gin",
+            postgresql_ops={"phone_digits": "gin_trgm_ops"},
+            postgresql_where=text("active IS true"),
+        ),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
@@ -56,6 +101,8 @@ class Customer(TimestampMixin, Base):
     weight_lbs: Mapped[float | None] = mapped_column(Numeric(5, 2))
     height_feet: Mapped[int | None] = mapped_column(Integer)
     height_inches: Mapped[int | None] = mapped_column(Integer)
+    search_text: Mapped[str | None] = mapped_column(Text, Computed(CUSTOMER_SEARCH_TEXT_SQL, persisted=True))
+    phone_digits: Mapped[str | None] = mapped_column(String(30), Computed(CUSTOMER_PHONE_DIGITS_SQL, persisted=True))
 
     addresses: Mapped[list[CustomerAddress]] = relationship(
         back_populates="customer",
@@ -8,10 +8,12 @@ from sqlalchemy import (
     Date,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
     UniqueConstraint,
+    text,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -29,6 +31,11 @@ class NJDriverLicense(TimestampMixin, Base):
             "expiration_date IS NULL OR issue_date IS NULL OR expiration_date >= issue_date",
             name="ck_nj_dl_dates_valid",
         ),
+        Index(
+            "ix_nj_driver_licenses_current_expiration",
+            "expiration_date",
+            postgresql_where=text("active IS true AND is_current IS true AND expiration_date IS NOT NULL"),
+        ),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
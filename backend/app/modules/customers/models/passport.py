@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import date
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, CheckConstraint, Date, ForeignKey, Integer, String, Text
+from sqlalchemy import Boolean, CheckConstraint, Date, ForeignKey, Index, Integer, String, Text, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -21,6 +21,11 @@ class Passport(TimestampMixin, Base):
             "expiration_date IS NULL OR issue_date IS NULL OR expiration_date >= issue_date",
             name="ck_passports_dates_valid",
         ),
+        Index(
+            "ix_passports_current_expiration",
+            "expiration_date",
+            postgresql_where=text("active IS true AND is_current IS true AND expiration_date IS NOT NULL"),
+        ),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
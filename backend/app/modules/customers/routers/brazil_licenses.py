@@ -1,15 +1,19 @@
 from __future__ import annotations
 
 from fastapi import APIRouter, Depends, File, HTTPException, Query, Response, UploadFile, status
-from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_db
+from app.api.deps import get_db, get_object_read_options
+from app.deps.minio.minio_objects import ObjectNotModifiedError, ObjectReadOptions
+from app.modules.customers.errors import CustomerDocumentFileNotFoundError
 from app.modules.customers.schemas import (
     BrazilDriverLicenseCreate,
     BrazilDriverLicenseRead,
     BrazilDriverLicenseUpdate,
+    StagedDocumentConfirmRequest,
     StagedDocumentFileResponse,
+    StagedDocumentUploadRequest,
+    StagedDocumentUploadTicket,
 )
 from app.modules.customers.services.brazil_licenses import (
     create_brazil_license,
@@ -21,6 +25,9 @@ from app.modules.customers.services.brazil_licenses import (
     update_brazil_license,
 )
 from app.modules.customers.services.document_files import (
+    MAX_DOCUMENT_FILE_SIZE_BYTES,
+    confirm_staged_document_upload,
+    create_staged_document_upload,
     delete_brazil_license_document_file,
     delete_staged_document_file,
     get_brazil_license_document_file,
@@ -28,8 +35,15 @@ from app.modules.customers.services.document_files import (
     upload_staged_document_file,
     upload_brazil_license_document_file,
 )
+from app.utils.object_response import (
+    REVALIDATE_CACHE_CONTROL,
+    immutable_cache_control,
+    not_modified_response,
+    stored_object_response,
+)
+from app.utils.uploads import spool_upload
 
-from .helpers import raise_not_found
+from .helpers import raise_not_found, raise_record_write_error
 
 router = APIRouter()
 BR_DOC_TYPE = "brazil-license"
@@ -57,7 +71,7 @@ def create_brazil_license_route(
     try:
         return create_brazil_license(db=db, customer_id=customer_id, payload=payload)
     except Exception as exc:  # noqa: BLE001
-        raise_not_found(exc)
+        raise_record_write_error(db, exc)
 
 
 @router.patch("/{customer_id}/brazil-driver-licenses/{license_id}", response_model=BrazilDriverLicenseRead)
@@ -70,7 +84,7 @@ def update_brazil_license_route(
     try:
         return update_brazil_license(db=db, customer_id=customer_id, license_id=license_id, payload=payload)
     except Exception as exc:  # noqa: BLE001
-        raise_not_found(exc)
+        raise_record_write_error(db, exc)
 
 
 @router.post(
@@ -87,7 +101,7 @@ def renew_brazil_license_route(
     try:
         return renew_brazil_license(db=db, customer_id=customer_id, license_id=license_id, payload=payload)
     except Exception as exc:  # noqa: BLE001
-        raise_not_found(exc)
+        raise_record_write_error(db, exc)
 
 
 @router.post("/{customer_id}/brazil-driver-licenses/staged-file", response_model=StagedDocumentFileResponse)
@@ -96,11 +110,12 @@ async def upload_brazil_license_staged_file_route(
     file: UploadFile = File(...),
 ) -> StagedDocumentFileResponse:
     try:
-        payload = await file.read()
+        upload = await spool_upload(file, max_bytes=MAX_DOCUMENT_FILE_SIZE_BYTES)
         object_key, content_type, file_name = upload_staged_document_file(
             customer_id=customer_id,
             doc_type=BR_DOC_TYPE,
-            payload=payload,
+            payload=upload.stream,
+            size=upload.size,
             file_name=file.filename,
             content_type=file.content_type,
         )
@@ -109,17 +124,53 @@ async def upload_brazil_license_staged_file_route(
         raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc)) from exc
 
 
+@router.post("/{customer_id}/brazil-driver-licenses/staged-file/upload-ticket", response_model=StagedDocumentUploadTicket)
+def create_brazil_license_staged_upload_ticket_route(
+    customer_id: int,
+    payload: StagedDocumentUploadRequest,
+) -> StagedDocumentUploadTicket:
+    try:
+        return create_staged_document_upload(
+            customer_id=customer_id,
+            doc_type=BR_DOC_TYPE,
+            file_name=payload.file_name,
+            content_type=payload.content_type,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc)) from exc
+
+
+@router.post("/{customer_id}/brazil-driver-licenses/staged-file/confirm", response_model=StagedDocumentFileResponse)
+def confirm_brazil_license_staged_upload_route(
+    customer_id: int,
+    payload: StagedDocumentConfirmRequest,
+) -> StagedDocumentFileResponse:
+    try:
+        object_key, content_type, file_name = confirm_staged_document_upload(
+            customer_id=customer_id,
+            doc_type=BR_DOC_TYPE,
+            object_key=payload.object_key,
+        )
+        return StagedDocumentFileResponse(object_key=object_key, content_type=content_type, file_name=file_name)
+    except CustomerDocumentFileNotFoundError as exc:
+        raise_not_found(exc)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc)) from exc
+
+
 @router.get("/{customer_id}/brazil-driver-licenses/staged-file")
-def get_brazil_license_staged_file_route(customer_id: int, object_key: str = Query(...)) -> StreamingResponse:
+def get_brazil_license_staged_file_route(
+    customer_id: int,
+    object_key: str = Query(...),
+    read_options: ObjectReadOptions = Depends(get_object_read_options),
+) -> Response:
     try:
-        payload, content_type, file_name = get_staged_document_file(customer_id=customer_id, doc_type=BR_DOC_TYPE, object_key=object_key)
+        stored = get_staged_document_file(customer_id=customer_id, doc_type=BR_DOC_TYPE, object_key=object_key, read_options=read_options)
+    except ObjectNotModifiedError as exc:
+        return not_modified_response(exc, cache_control=immutable_cache_control())
     except Exception as exc:  # noqa: BLE001
         raise_not_found(exc)
-    return StreamingResponse(
-        iter([payload]),
-        media_type=content_type,
-        headers={"Content-Disposition": f'inline; filename="{file_name}"', "Cache-Control": "no-store"},
-    )
+    return stored_object_response(stored, cache_control=immutable_cache_control())
 
 
 @router.delete("/{customer_id}/brazil-driver-licenses/staged-file", status_code=status.HTTP_204_NO_CONTENT)
@@ -171,12 +222,13 @@ async def upload_brazil_license_file_route(
     db: Session = Depends(get_db),
 ) -> BrazilDriverLicenseRead:
     try:
-        payload = await file.read()
+        upload = await spool_upload(file, max_bytes=MAX_DOCUMENT_FILE_SIZE_BYTES)
         return upload_brazil_license_document_file(
             db=db,
             customer_id=customer_id,
             license_id=license_id,
-            payload=payload,
+            payload=upload.stream,
+            size=upload.size,
             file_name=file.filename,
             content_type=file.content_type,
         )
@@ -187,16 +239,19 @@ async def upload_brazil_license_file_route(
 
 
 @router.get("/{customer_id}/brazil-driver-licenses/{license_id}/file")
-def get_brazil_license_file_route(customer_id: int, license_id: int, db: Session = Depends(get_db)) -> StreamingResponse:
+def get_brazil_license_file_route(
+    customer_id: int,
+    license_id: int,
+    db: Session = Depends(get_db),
+    read_options: ObjectReadOptions = Depends(get_object_read_options),
+) -> Response:
     try:
-        payload, content_type, file_name = get_brazil_license_document_file(db=db, customer_id=customer_id, license_id=license_id)
+        stored = get_brazil_license_document_file(db=db, customer_id=customer_id, license_id=license_id, read_options=read_options)
+    except ObjectNotModifiedError as exc:
+        return not_modified_response(exc, cache_control=REVALIDATE_CACHE_CONTROL)
     except Exception as exc:  # noqa: BLE001
         raise_not_found(exc)
-    return StreamingResponse(
-        iter([payload]),
-        media_type=content_type,
-        headers={"Content-Disposition": f'inline; filename="{file_name}"', "Cache-Control": "no-store"},
-    )
+    return stored_object_response(stored, cache_control=REVALIDATE_CACHE_CONTROL)
 
 
 @router.delete("/{customer_id}/brazil-driver-licenses/{license_id}/file", response_model=BrazilDriverLicenseRead)
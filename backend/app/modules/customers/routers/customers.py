@@ -1,14 +1,16 @@
 from __future__ import annotations
 
 from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, Response, UploadFile, status
-from fastapi.responses import StreamingResponse
 from pydantic import ValidationError
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_db
+from app.api.deps import get_db, get_object_read_options
+from app.deps.minio.minio_objects import ObjectNotModifiedError, ObjectReadOptions
+from app.modules.customers.errors import InvalidCustomerCursorError
 from app.modules.customers.schemas import (
     BrazilDriverLicenseCreate,
+    CustomerCountMode,
     CustomerCreate,
     CustomerListResponse,
     CustomerRead,
@@ -28,6 +30,14 @@ from app.modules.customers.services import (
     update_customer,
 )
 from app.modules.customers.services.create_customer_with_initial_document_use_case import InitialDocumentKind
+from app.modules.customers.services.document_files import MAX_DOCUMENT_FILE_SIZE_BYTES
+from app.modules.customers.services.photos import MAX_PHOTO_SIZE_BYTES
+from app.utils.object_response import (
+    REVALIDATE_CACHE_CONTROL,
+    not_modified_response,
+    stored_object_response,
+)
+from app.utils.uploads import spool_upload
 
 from .helpers import raise_customer_integrity_error, raise_not_found
 
@@ -40,8 +50,13 @@ def list_customers_route(
     page: int = Query(default=1, ge=1),
     size: int = Query(default=20, ge=1, le=100),
     search: str | None = Query(default=None),
+    cursor: str | None = Query(default=None, min_length=1),
+    count: CustomerCountMode = Query(default="exact"),
 ) -> CustomerListResponse:
-    return list_customers(db=db, page=page, size=size, search=search)
+    try:
+        return list_customers(db=db, page=page, size=size, search=search, cursor=cursor, count=count)
+    except InvalidCustomerCursorError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
 
 
 @router.get("/{customer_id}", response_model=CustomerRead)
@@ -86,13 +101,14 @@ async def create_customer_with_document_route(
                 detail="Invalid document_kind. Use 'nj_driver_license', 'brazil_driver_license' or 'passport'.",
             )
 
-        payload = await file.read()
+        upload = await spool_upload(file, max_bytes=MAX_DOCUMENT_FILE_SIZE_BYTES)
         return create_customer_with_initial_document(
             db=db,
             customer_payload=customer_data,
             document_kind=kind_value,
             document_payload=parsed_document_payload,
-            file_payload=payload,
+            file_payload=upload.stream,
+            file_size=upload.size,
             file_name=file.filename,
             content_type=file.content_type,
         )
@@ -134,11 +150,12 @@ async def upload_customer_photo_route(
     db: Session = Depends(get_db),
 ) -> CustomerRead:
     try:
-        payload = await file.read()
+        upload = await spool_upload(file, max_bytes=MAX_PHOTO_SIZE_BYTES)
         return upload_customer_photo(
             db=db,
             customer_id=customer_id,
-            payload=payload,
+            payload=upload.stream,
+            size=upload.size,
             file_name=file.filename,
             content_type=file.content_type,
         )
@@ -159,15 +176,16 @@ def delete_customer_photo_route(customer_id: int, db: Session = Depends(get_db))
 
 
 @router.get("/{customer_id}/photo")
-def get_customer_photo_route(customer_id: int, db: Session = Depends(get_db)) -> StreamingResponse:
+def get_customer_photo_route(
+    customer_id: int,
+    db: Session = Depends(get_db),
+    read_options: ObjectReadOptions = Depends(get_object_read_options),
+) -> Response:
     try:
         customer = get_customer_or_404(db=db, customer_id=customer_id)
-        payload, content_type, file_name = get_customer_photo(customer)
+        stored = get_customer_photo(customer, read_options=read_options)
+    except ObjectNotModifiedError as exc:
+        return not_modified_response(exc, cache_control=REVALIDATE_CACHE_CONTROL)
     except Exception as exc:  # noqa: BLE001
         raise_not_found(exc)
-
-    return StreamingResponse(
-        iter([payload]),
-        media_type=content_type,
-        headers={"Content-Disposition": f'inline; filename="{file_name}"', "Cache-Control": "no-store"},
-    )
+    return stored_object_response(stored, cache_control=REVALIDATE_CACHE_CONTROL)
@@ -4,6 +4,7 @@ from fastapi import HTTPException, status
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from app.deps.minio.minio_objects import ObjectRangeNotSatisfiableError
 from app.modules.customers.errors import (
     CustomerNotFoundError,
     CustomerDocumentFileNotFoundError,
@@ -11,23 +12,34 @@ from app.modules.customers.errors import (
     LicenseNotFoundError,
     PassportNotFoundError,
 )
+from app.utils.object_response import range_not_satisfiable_error
+
+NOT_FOUND_ERRORS = (
+    CustomerNotFoundError,
+    CustomerPhotoNotFoundError,
+    CustomerDocumentFileNotFoundError,
+    LicenseNotFoundError,
+    PassportNotFoundError,
+)
 
 
 def raise_not_found(exc: Exception) -> None:
-    if isinstance(
-        exc,
-        (
-            CustomerNotFoundError,
-            CustomerPhotoNotFoundError,
-            CustomerDocumentFileNotFoundError,
-            LicenseNotFoundError,
-            PassportNotFoundError,
-        ),
-    ):
+    if isinstance(exc, ObjectRangeNotSatisfiableError):
+        raise range_not_satisfiable_error(exc) from exc
+    if isinstance(exc, NOT_FOUND_ERRORS):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
     raise exc
 
 
+def raise_record_write_error(db: Session, exc: Exception) -> None:
+    # Anything a write service rejects that is not a missing record (e.g. a staged document file that fails
+    # validation) is the client's input, so it is a 422 rather than a 500.
+    db.rollback()
+    if isinstance(exc, ValueError) and not isinstance(exc, NOT_FOUND_ERRORS):
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc)) from exc
+    raise_not_found(exc)
+
+
 def raise_customer_integrity_error(db: Session, exc: IntegrityError) -> None:
     db.rollback()
     detail = "Invalid customer data."
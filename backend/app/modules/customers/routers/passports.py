@@ -1,11 +1,20 @@
 from __future__ import annotations
 
 from fastapi import APIRouter, Depends, File, HTTPException, Query, Response, UploadFile, status
-from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_db
-from app.modules.customers.schemas import PassportCreate, PassportRead, PassportUpdate, StagedDocumentFileResponse
+from app.api.deps import get_db, get_object_read_options
+from app.deps.minio.minio_objects import ObjectNotModifiedError, ObjectReadOptions
+from app.modules.customers.errors import CustomerDocumentFileNotFoundError
+from app.modules.customers.schemas import (
+    PassportCreate,
+    PassportRead,
+    PassportUpdate,
+    StagedDocumentConfirmRequest,
+    StagedDocumentFileResponse,
+    StagedDocumentUploadRequest,
+    StagedDocumentUploadTicket,
+)
 from app.modules.customers.services.passports import (
     create_passport,
     delete_passport,
@@ -16,6 +25,9 @@ from app.modules.customers.services.passports import (
     update_passport,
 )
 from app.modules.customers.services.document_files import (
+    MAX_DOCUMENT_FILE_SIZE_BYTES,
+    confirm_staged_document_upload,
+    create_staged_document_upload,
     delete_passport_document_file,
     delete_staged_document_file,
     get_passport_document_file,
@@ -23,8 +35,15 @@ from app.modules.customers.services.document_files import (
     upload_staged_document_file,
     upload_passport_document_file,
 )
+from app.utils.object_response import (
+    REVALIDATE_CACHE_CONTROL,
+    immutable_cache_control,
+    not_modified_response,
+    stored_object_response,
+)
+from app.utils.uploads import spool_upload
 
-from .helpers import raise_not_found
+from .helpers import raise_not_found, raise_record_write_error
 
 router = APIRouter()
 PASSPORT_DOC_TYPE = "passport"
@@ -52,7 +71,7 @@ def create_passport_route(
     try:
         return create_passport(db=db, customer_id=customer_id, payload=payload)
     except Exception as exc:  # noqa: BLE001
-        raise_not_found(exc)
+        raise_record_write_error(db, exc)
 
 
 @router.patch("/{customer_id}/passports/{passport_id}", response_model=PassportRead)
@@ -65,7 +84,7 @@ def update_passport_route(
     try:
         return update_passport(db=db, customer_id=customer_id, passport_id=passport_id, payload=payload)
     except Exception as exc:  # noqa: BLE001
-        raise_not_found(exc)
+        raise_record_write_error(db, exc)
 
 
 @router.post("/{customer_id}/passports/{passport_id}/renew", response_model=PassportRead, status_code=status.HTTP_201_CREATED)
@@ -78,7 +97,7 @@ def renew_passport_route(
     try:
         return renew_passport(db=db, customer_id=customer_id, passport_id=passport_id, payload=payload)
     except Exception as exc:  # noqa: BLE001
-        raise_not_found(exc)
+        raise_record_write_error(db, exc)
 
 
 @router.post("/{customer_id}/passports/staged-file", response_model=StagedDocumentFileResponse)
@@ -87,11 +106,12 @@ async def upload_passport_staged_file_route(
     file: UploadFile = File(...),
 ) -> StagedDocumentFileResponse:
     try:
-        payload = await file.read()
+        upload = await spool_upload(file, max_bytes=MAX_DOCUMENT_FILE_SIZE_BYTES)
         object_key, content_type, file_name = upload_staged_document_file(
             customer_id=customer_id,
             doc_type=PASSPORT_DOC_TYPE,
-            payload=payload,
+            payload=upload.stream,
+            size=upload.size,
             file_name=file.filename,
             content_type=file.content_type,
         )
@@ -100,17 +120,53 @@ async def upload_passport_staged_file_route(
         raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc)) from exc
 
 
+@router.post("/{customer_id}/passports/staged-file/upload-ticket", response_model=StagedDocumentUploadTicket)
+def create_passport_staged_upload_ticket_route(
+    customer_id: int,
+    payload: StagedDocumentUploadRequest,
+) -> StagedDocumentUploadTicket:
+    try:
+        return create_staged_document_upload(
+            customer_id=customer_id,
+            doc_type=PASSPORT_DOC_TYPE,
+            file_name=payload.file_name,
+            content_type=payload.content_type,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc)) from exc
+
+
+@router.post("/{customer_id}/passports/staged-file/confirm", response_model=StagedDocumentFileResponse)
+def confirm_passport_staged_upload_route(
+    customer_id: int,
+    payload: StagedDocumentConfirmRequest,
+) -> StagedDocumentFileResponse:
+    try:
+        object_key, content_type, file_name = confirm_staged_document_upload(
+            customer_id=customer_id,
+            doc_type=PASSPORT_DOC_TYPE,
+            object_key=payload.object_key,
+        )
+        return StagedDocumentFileResponse(object_key=object_key, content_type=content_type, file_name=file_name)
+    except CustomerDocumentFileNotFoundError as exc:
+        raise_not_found(exc)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc)) from exc
+
+
 @router.get("/{customer_id}/passports/staged-file")
-def get_passport_staged_file_route(customer_id: int, object_key: str = Query(...)) -> StreamingResponse:
+def get_passport_staged_file_route(
+    customer_id: int,
+    object_key: str = Query(...),
+    read_options: ObjectReadOptions = Depends(get_object_read_options),
+) -> Response:
     try:
-        payload, content_type, file_name = get_staged_document_file(customer_id=customer_id, doc_type=PASSPORT_DOC_TYPE, object_key=object_key)
+        stored = get_staged_document_file(customer_id=customer_id, doc_type=PASSPORT_DOC_TYPE, object_key=object_key, read_options=read_options)
+    except ObjectNotModifiedError as exc:
+        return not_modified_response(exc, cache_control=immutable_cache_control())
     except Exception as exc:  # noqa: BLE001
         raise_not_found(exc)
-    return StreamingResponse(
-        iter([payload]),
-        media_type=content_type,
-        headers={"Content-Disposition": f'inline; filename="{file_name}"', "Cache-Control": "no-store"},
-    )
+    return stored_object_response(stored, cache_control=immutable_cache_control())
 
 
 @router.delete("/{customer_id}/passports/staged-file", status_code=status.HTTP_204_NO_CONTENT)
@@ -158,12 +214,13 @@ async def upload_passport_file_route(
     db: Session = Depends(get_db),
 ) -> PassportRead:
     try:
-        payload = await file.read()
+        upload = await spool_upload(file, max_bytes=MAX_DOCUMENT_FILE_SIZE_BYTES)
         return upload_passport_document_file(
             db=db,
             customer_id=customer_id,
             passport_id=passport_id,
-            payload=payload,
+            payload=upload.stream,
+            size=upload.size,
             file_name=file.filename,
             content_type=file.content_type,
         )
@@ -174,16 +231,19 @@ async def upload_passport_file_route(
 
 
 @router.get("/{customer_id}/passports/{passport_id}/file")
-def get_passport_file_route(customer_id: int, passport_id: int, db: Session = Depends(get_db)) -> StreamingResponse:
+def get_passport_file_route(
+    customer_id: int,
+    passport_id: int,
+    db: Session = Depends(get_db),
+    read_options: ObjectReadOptions = Depends(get_object_read_options),
+) -> Response:
     try:
-        payload, content_type, file_name = get_passport_document_file(db=db, customer_id=customer_id, passport_id=passport_id)
+        stored = get_passport_document_file(db=db, customer_id=customer_id, passport_id=passport_id, read_options=read_options)
+    except ObjectNotModifiedError as exc:
+        return not_modified_response(exc, cache_control=REVALIDATE_CACHE_CONTROL)
     except Exception as exc:  # noqa: BLE001
         raise_not_found(exc)
-    return StreamingResponse(
-        iter([payload]),
-        media_type=content_type,
-        headers={"Content-Disposition": f'inline; filename="{file_name}"', "Cache-Control": "no-store"},
-    )
+    return stored_object_response(stored, cache_control=REVALIDATE_CACHE_CONTROL)
 
 
 @router.delete("/{customer_id}/passports/{passport_id}/file", response_model=PassportRead)
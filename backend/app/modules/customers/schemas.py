@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from datetime import date, datetime
 from decimal import Decimal
+from typing import Literal
 
 from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
@@ -151,6 +152,24 @@ class StagedDocumentFileResponse(BaseModel):
     content_type: str
 
 
+class StagedDocumentUploadRequest(BaseModel):
+    file_name: str | None = Field(default=None, max_length=255)
+    content_type: str | None = Field(default=None, max_length=120)
+
+
+class StagedDocumentUploadTicket(BaseModel):
+    object_key: str
+    upload_url: str
+    form_fields: dict[str, str]
+    content_type: str
+    max_size_bytes: int
+    expires_at: datetime
+
+
+class StagedDocumentConfirmRequest(BaseModel):
+    object_key: str = Field(min_length=1, max_length=255)
+
+
 class PassportRead(PassportBase, ORMModel):
     id: int
     customer_id: int
@@ -228,22 +247,30 @@ class CustomerRead(CustomerBase, ORMModel):
 
 
 class CustomerListItem(ORMModel):
+    # Built from the CUSTOMER_LIST_COLUMNS projection, which the ix_customers_active_list index covers; adding a
+    # field here means adding it to both. Emails were validated on write, so they are not re-validated per row.
     id: int
     first_name: str
     middle_name: str | None = None
-    customer_photo_object_key: str | None = None
     last_name: str
+    suffix: str | None = None
+    customer_photo_object_key: str | None = None
     phone_number: str | None = None
-    instagram_handle: str | None = None
-    email: EmailStr | None = None
+    email: str | None = None
     date_of_birth: date
+    has_left_country: bool
+    has_no_ssn: bool
     active: bool
     created_at: datetime
-    updated_at: datetime
+
+
+CustomerCountMode = Literal["exact", "estimate", "none"]
 
 
 class CustomerListResponse(BaseModel):
     items: list[CustomerListItem]
-    total: int
+    total: int | None
+    total_is_estimate: bool = False
     page: int
     size: int
+    next_cursor: str | None = None
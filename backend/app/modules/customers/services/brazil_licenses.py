@@ -6,6 +6,7 @@ from sqlalchemy.orm import Session
 from app.modules.customers.errors import LicenseNotFoundError
 from app.modules.customers.models import BrazilDriverLicense
 from app.modules.customers.schemas import BrazilDriverLicenseCreate, BrazilDriverLicenseUpdate
+from app.modules.dashboard.summary_cache import invalidate_dashboard_summary
 
 from .customers import get_customer_or_404
 from .document_files import finalize_staged_document_file_for_brazil_license
@@ -47,14 +48,19 @@ def create_brazil_license(db: Session, customer_id: int, payload: BrazilDriverLi
         **payload.model_dump(exclude={"staged_document_file_object_key"}),
     )
     db.add(license_obj)
-    db.commit()
+    db.flush()
     if payload.staged_document_file_object_key:
-        license_obj.document_file_object_key = finalize_staged_document_file_for_brazil_license(
-            customer_id=customer_id,
-            license_id=license_obj.id,
-            staged_object_key=payload.staged_document_file_object_key,
-        )
-        db.commit()
+        try:
+            license_obj.document_file_object_key = finalize_staged_document_file_for_brazil_license(
+                customer_id=customer_id,
+                license_id=license_obj.id,
+                staged_object_key=payload.staged_document_file_object_key,
+            )
+        except ValueError:
+            db.rollback()
+            raise
+    db.commit()
+    invalidate_dashboard_summary()
     db.refresh(license_obj)
     return license_obj
 
@@ -72,6 +78,7 @@ def update_brazil_license(
     if payload.is_current:
         clear_current_flags(db, model=BrazilDriverLicense, customer_id=customer_id, except_id=license_id)
     db.commit()
+    invalidate_dashboard_summary()
     db.refresh(license_obj)
     return license_obj
 
@@ -88,14 +95,19 @@ def renew_brazil_license(
     data["is_current"] = True
     new_license = BrazilDriverLicense(customer_id=customer_id, **data)
     db.add(new_license)
-    db.commit()
+    db.flush()
     if payload.staged_document_file_object_key:
-        new_license.document_file_object_key = finalize_staged_document_file_for_brazil_license(
-            customer_id=customer_id,
-            license_id=new_license.id,
-            staged_object_key=payload.staged_document_file_object_key,
-        )
-        db.commit()
+        try:
+            new_license.document_file_object_key = finalize_staged_document_file_for_brazil_license(
+                customer_id=customer_id,
+                license_id=new_license.id,
+                staged_object_key=payload.staged_document_file_object_key,
+            )
+        except ValueError:
+            db.rollback()
+            raise
+    db.commit()
+    invalidate_dashboard_summary()
     db.refresh(new_license)
     return new_license
 
@@ -105,12 +117,14 @@ def deactivate_brazil_license(db: Session, customer_id: int, license_id: int) ->
     license_obj.active = False
     license_obj.is_current = False
     db.commit()
+    invalidate_dashboard_summary()
 
 
 def delete_brazil_license(db: Session, customer_id: int, license_id: int) -> None:
     license_obj = get_brazil_license_or_404(db, customer_id, license_id)
     db.delete(license_obj)
     db.commit()
+    invalidate_dashboard_summary()
 
 
 def get_brazil_license_or_404(db: Session, customer_id: int, license_id: int) -> BrazilDriverLicense:
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Literal
+from typing import BinaryIO, Literal
 
 from sqlalchemy.orm import Session
 
@@ -28,7 +28,8 @@ def create_customer_with_initial_document(
     customer_payload: CustomerCreate,
     document_kind: InitialDocumentKind,
     document_payload: InitialDocumentPayload,
-    file_payload: bytes,
+    file_payload: BinaryIO,
+    file_size: int,
     file_name: str | None,
     content_type: str | None,
 ) -> Customer:
@@ -48,6 +49,7 @@ def create_customer_with_initial_document(
             customer_id=customer.id,
             license_id=license_id,
             payload=file_payload,
+            size=file_size,
             file_name=file_name,
             content_type=content_type,
         )
@@ -58,6 +60,7 @@ def create_customer_with_initial_document(
             customer_id=customer.id,
             license_id=license_id,
             payload=file_payload,
+            size=file_size,
             file_name=file_name,
             content_type=content_type,
         )
@@ -68,6 +71,7 @@ def create_customer_with_initial_document(
             customer_id=customer.id,
             passport_id=passport_id,
             payload=file_payload,
+            size=file_size,
             file_name=file_name,
             content_type=content_type,
         )
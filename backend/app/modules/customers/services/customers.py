@@ -1,51 +1,174 @@
 from __future__ import annotations
 
-from sqlalchemy import func, or_, select
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
+from hashlib import sha256
+import re
+
+from sqlalchemy import ColumnElement, Row, Text, case, func, literal, or_, select, text, tuple_
 from sqlalchemy.orm import Session
 
-from app.modules.customers.errors import CustomerNotFoundError
+from app.modules.customers.errors import CustomerNotFoundError, InvalidCustomerCursorError
 from app.modules.customers.models import BrazilDriverLicense, Customer, CustomerAddress, NJDriverLicense, Passport
 from app.modules.customers.schemas import (
     CustomerAddressCreate,
+    CustomerCountMode,
     CustomerCreate,
+    CustomerListItem,
     CustomerListResponse,
     CustomerUpdate,
     NJDriverLicenseCreate,
 )
+from app.modules.dashboard.summary_cache import invalidate_dashboard_summary
 
 from .shared import get_customer_query
 
+PHONE_SEARCH_PATTERN = re.compile(r"[\d\s()+.-]+")
+MIN_PHONE_SEARCH_DIGITS = 3
+SEARCH_COUNT_CAP = 1000
+ACTIVE_CUSTOMERS_INDEX = "ix_customers_active_id"
+CURSOR_FINGERPRINT_LENGTH = 12
+
+# Only what the list screen renders: no SSN ciphertext, search columns or physical description per row.
+CUSTOMER_LIST_COLUMNS = (
+    Customer.id,
+    Customer.first_name,
+    Customer.middle_name,
+    Customer.last_name,
+    Customer.suffix,
+    Customer.customer_photo_object_key,
+    Customer.phone_number,
+    Customer.email,
+    Customer.date_of_birth,
+    Customer.has_left_country,
+    Customer.has_no_ssn,
+    Customer.active,
+    Customer.created_at,
+)
+
 
 def list_customers(
     db: Session,
     page: int = 1,
     size: int = 20,
     search: str | None = None,
+    cursor: str | None = None,
+    count: CustomerCountMode = "exact",
 ) -> CustomerListResponse:
     conditions = [Customer.active.is_(True)]
-    if search:
-        term = f"%{search.strip()}%"
-        conditions.append(
-            or_(
-                Customer.first_name.ilike(term),
-                Customer.last_name.ilike(term),
-                Customer.email.ilike(term),
-                Customer.phone_number.ilike(term),
-                Customer.instagram_handle.ilike(term),
-            )
-        )
+    sort_keys: list[ColumnElement] = [Customer.created_at, Customer.id]
+    stmt = select(*CUSTOMER_LIST_COLUMNS)
+    term = (search or "").strip()
+    if term:
+        match, rank = _customer_search(term)
+        conditions.append(match)
+        sort_keys.insert(0, rank)
+        stmt = stmt.add_columns(rank.label("search_rank"))
+
+    total, total_is_estimate = _count_customers(db, conditions, count, searching=bool(term))
+
+    stmt = stmt.where(*conditions)
+    if cursor:
+        # Keyset pagination: seek past the last row of the previous page instead of skipping OFFSET rows, so
+        # every page costs the same however deep the client scrolls.
+        stmt = stmt.where(tuple_(*sort_keys) < tuple_(*_decode_cursor(cursor, term)))
+    elif page > 1:
+        stmt = stmt.offset((page - 1) * size)
+    # One extra row tells us whether another page exists without a second query.
+    stmt = stmt.order_by(*(key.desc() for key in sort_keys)).limit(size + 1)
+    rows = list(db.execute(stmt).all())
+
+    next_cursor = _encode_cursor(rows[size - 1], term) if len(rows) > size else None
+    items = [CustomerListItem.model_validate(row._mapping) for row in rows[:size]]
+    return CustomerListResponse(
+        items=items,
+        total=total,
+        total_is_estimate=total_is_estimate,
+        page=page,
+        size=size,
+        next_cursor=next_cursor,
+    )
+
+
+def _count_customers(
+    db: Session,
+    conditions: list[ColumnElement[bool]],
+    count: CustomerCountMode,
+    *,
+    searching: bool,
+) -> tuple[int | None, bool]:
+    if count == "none":
+        return None, False
+    if count == "estimate":
+        if not searching:
+            estimate = _estimate_active_customers(db)
+            if estimate is not None:
+                return estimate, True
+        else:
+            # Counting every fuzzy match can cost more than the page itself; stop once the answer is "a lot".
+            capped = select(Customer.id).where(*conditions).limit(SEARCH_COUNT_CAP + 1).subquery()
+            matched = db.scalar(select(func.count()).select_from(capped)) or 0
+            return min(matched, SEARCH_COUNT_CAP), matched > SEARCH_COUNT_CAP
+    return db.scalar(select(func.count(Customer.id)).where(*conditions)) or 0, False
 
-    total = db.scalar(select(func.count(Customer.id)).where(*conditions)) or 0
 
-    stmt = (
-        select(Customer)
-        .where(*conditions)
-        .order_by(Customer.created_at.desc())
-        .offset((page - 1) * size)
-        .limit(size)
+def _estimate_active_customers(db: Session) -> int | None:
+    # The planner's row estimate for the partial active-customers index is kept fresh by autovacuum/ANALYZE and
+    # reads in constant time; -1 means the index has never been analyzed, so fall back to an exact count.
+    if db.get_bind().dialect.name != "postgresql":
+        return None
+    reltuples = db.scalar(
+        text("SELECT reltuples FROM pg_class WHERE oid = to_regclass(:index_name)"),
+        {"index_name": ACTIVE_CUSTOMERS_INDEX},
     )
-    items = list(db.scalars(stmt).all())
-    return CustomerListResponse(items=items, total=total, page=page, size=size)
+    if reltuples is None or reltuples < 0:
+        return None
+    return int(reltuples)
+
+
+def _encode_cursor(row: Row, term: str) -> str:
+    ranks = [repr(float(row.search_rank))] if term else []
+    raw = "|".join([_search_fingerprint(term), *ranks, row.created_at.isoformat(), str(row.id)])
+    return urlsafe_b64encode(raw.encode("ascii")).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str, term: str) -> tuple[float | datetime | int, ...]:
+    try:
+        raw = urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("ascii")
+        fingerprint, *parts = raw.split("|")
+        # The rank a cursor seeks on only means something for the search it came from.
+        if fingerprint != _search_fingerprint(term) or len(parts) != (3 if term else 2):
+            raise ValueError("cursor does not match the requested listing")
+        *raw_ranks, raw_created_at, raw_id = parts
+        return (*(float(value) for value in raw_ranks), datetime.fromisoformat(raw_created_at), int(raw_id))
+    except ValueError as exc:
+        raise InvalidCustomerCursorError("Invalid pagination cursor") from exc
+
+
+def _search_fingerprint(term: str) -> str:
+    # The term is already stripped and the SQL lower-cases it, so case is the only difference that is safe to ignore.
+    return sha256(term.lower().encode("utf-8")).hexdigest()[:CURSOR_FINGERPRINT_LENGTH]
+
+
+def _customer_search(term: str) -> tuple[ColumnElement[bool], ColumnElement[float]]:
+    # search_text is the lower-cased, unaccented name/email/instagram text behind a GIN trigram index, so both the
+    # substring LIKE and the fuzzy word-similarity operator (<%) are index scans instead of a table scan.
+    needle = func.immutable_unaccent(func.lower(term), type_=Text)
+    pattern = literal("%") + func.immutable_unaccent(func.lower(_escape_like(term)), type_=Text) + literal("%")
+    matches = [Customer.search_text.like(pattern, escape="\\"), needle.op("<%", is_comparison=True)(Customer.search_text)]
+    rank: ColumnElement[float] = func.word_similarity(needle, Customer.search_text)
+
+    # Phone-looking terms match on digits only, so "(973) 555-01" finds "973.555.0123".
+    digits = re.sub(r"\D", "", term)
+    if len(digits) >= MIN_PHONE_SEARCH_DIGITS and PHONE_SEARCH_PATTERN.fullmatch(term):
+        phone_match = Customer.phone_digits.like(f"%{digits}%")
+        matches.append(phone_match)
+        rank = case((phone_match, 1.0), else_=rank)
+    return or_(*matches), rank
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
 
 
 def get_customer_or_404(db: Session, customer_id: int) -> Customer:
@@ -78,6 +201,7 @@ def create_customer(db: Session, payload: CustomerCreate) -> Customer:
 
     db.add(customer)
     db.commit()
+    invalidate_dashboard_summary()
     db.refresh(customer)
     return get_customer_or_404(db, customer.id)
 
@@ -92,6 +216,7 @@ def update_customer(db: Session, customer_id: int, payload: CustomerUpdate) -> C
         _sync_customer_addresses(customer, payload.addresses)
 
     db.commit()
+    invalidate_dashboard_summary()
     db.refresh(customer)
     return get_customer_or_404(db, customer.id)
 
@@ -100,6 +225,7 @@ def deactivate_customer(db: Session, customer_id: int) -> None:
     customer = get_customer_or_404(db, customer_id)
     customer.active = False
     db.commit()
+    invalidate_dashboard_summary()
 
 
 def _build_nj_license_from_create(payload: NJDriverLicenseCreate) -> NJDriverLicense:
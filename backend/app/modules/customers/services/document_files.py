@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime
-from io import BytesIO
 from pathlib import Path
 import re
+from typing import BinaryIO
 from uuid import uuid4
 
 from minio.commonconfig import CopySource
@@ -13,8 +13,16 @@ from sqlalchemy.orm import Session
 
 from app.core.config import settings
 from app.deps.minio.minio_client import get_minio_client
+from app.deps.minio.minio_objects import (
+    ObjectReadOptions,
+    PresignedObject,
+    StoredObject,
+    open_stored_object,
+    presign_upload_policy,
+)
 from app.modules.customers.errors import CustomerDocumentFileNotFoundError, LicenseNotFoundError, PassportNotFoundError
 from app.modules.customers.models import BrazilDriverLicense, NJDriverLicense, Passport
+from app.modules.customers.schemas import StagedDocumentUploadTicket
 
 ALLOWED_DOCUMENT_FILE_CONTENT_TYPES = {
     "image/jpeg",
@@ -34,7 +42,8 @@ def upload_nj_license_document_file(
     db: Session,
     customer_id: int,
     license_id: int,
-    payload: bytes,
+    payload: BinaryIO,
+    size: int,
     file_name: str | None,
     content_type: str | None,
 ) -> NJDriverLicense:
@@ -44,6 +53,7 @@ def upload_nj_license_document_file(
         customer_id=customer_id,
         record_id=license_id,
         payload=payload,
+        size=size,
         file_name=file_name,
         content_type=content_type,
     )
@@ -57,7 +67,8 @@ def upload_brazil_license_document_file(
     db: Session,
     customer_id: int,
     license_id: int,
-    payload: bytes,
+    payload: BinaryIO,
+    size: int,
     file_name: str | None,
     content_type: str | None,
 ) -> BrazilDriverLicense:
@@ -67,6 +78,7 @@ def upload_brazil_license_document_file(
         customer_id=customer_id,
         record_id=license_id,
         payload=payload,
+        size=size,
         file_name=file_name,
         content_type=content_type,
     )
@@ -80,7 +92,8 @@ def upload_passport_document_file(
     db: Session,
     customer_id: int,
     passport_id: int,
-    payload: bytes,
+    payload: BinaryIO,
+    size: int,
     file_name: str | None,
     content_type: str | None,
 ) -> Passport:
@@ -90,6 +103,7 @@ def upload_passport_document_file(
         customer_id=customer_id,
         record_id=passport_id,
         payload=payload,
+        size=size,
         file_name=file_name,
         content_type=content_type,
     )
@@ -103,27 +117,30 @@ def get_nj_license_document_file(
     db: Session,
     customer_id: int,
     license_id: int,
-) -> tuple[bytes, str, str]:
+    read_options: ObjectReadOptions | None = None,
+) -> StoredObject | PresignedObject:
     license_obj = _get_nj_license_or_404(db=db, customer_id=customer_id, license_id=license_id)
-    return _download_document_file(license_obj.document_file_object_key)
+    return _open_document_file(license_obj.document_file_object_key, read_options=read_options)
 
 
 def get_brazil_license_document_file(
     db: Session,
     customer_id: int,
     license_id: int,
-) -> tuple[bytes, str, str]:
+    read_options: ObjectReadOptions | None = None,
+) -> StoredObject | PresignedObject:
     license_obj = _get_brazil_license_or_404(db=db, customer_id=customer_id, license_id=license_id)
-    return _download_document_file(license_obj.document_file_object_key)
+    return _open_document_file(license_obj.document_file_object_key, read_options=read_options)
 
 
 def get_passport_document_file(
     db: Session,
     customer_id: int,
     passport_id: int,
-) -> tuple[bytes, str, str]:
+    read_options: ObjectReadOptions | None = None,
+) -> StoredObject | PresignedObject:
     passport = _get_passport_or_404(db=db, customer_id=customer_id, passport_id=passport_id)
-    return _download_document_file(passport.document_file_object_key)
+    return _open_document_file(passport.document_file_object_key, read_options=read_options)
 
 
 def delete_nj_license_document_file(db: Session, customer_id: int, license_id: int) -> NJDriverLicense:
@@ -158,17 +175,13 @@ def _upload_document_file(
     owner_prefix: str,
     customer_id: int,
     record_id: int,
-    payload: bytes,
+    payload: BinaryIO,
+    size: int,
     file_name: str | None,
     content_type: str | None,
 ) -> str:
     safe_content_type = _resolve_content_type(file_name=file_name, content_type=content_type)
-    if safe_content_type not in ALLOWED_DOCUMENT_FILE_CONTENT_TYPES:
-        raise ValueError("Unsupported file type. Use image (JPG/PNG/WEBP/HEIC/HEIF) or PDF.")
-    if not payload:
-        raise ValueError("Document payload is empty.")
-    if len(payload) > MAX_DOCUMENT_FILE_SIZE_BYTES:
-        raise ValueError("Document file is too large. Maximum allowed is 20MB.")
+    _validate_document_file(content_type=safe_content_type, size=size)
 
     object_key = _build_document_object_key(
         owner_prefix=owner_prefix,
@@ -182,8 +195,8 @@ def _upload_document_file(
         client.put_object(
             bucket_name=settings.MINIO_BUCKET,
             object_name=object_key,
-            data=BytesIO(payload),
-            length=len(payload),
+            data=payload,
+            length=size,
             content_type=safe_content_type,
         )
     except S3Error as exc:
@@ -195,17 +208,13 @@ def upload_staged_document_file(
     *,
     customer_id: int,
     doc_type: str,
-    payload: bytes,
+    payload: BinaryIO,
+    size: int,
     file_name: str | None,
     content_type: str | None,
 ) -> tuple[str, str, str]:
     safe_content_type = _resolve_content_type(file_name=file_name, content_type=content_type)
-    if safe_content_type not in ALLOWED_DOCUMENT_FILE_CONTENT_TYPES:
-        raise ValueError("Unsupported file type. Use image (JPG/PNG/WEBP/HEIC/HEIF) or PDF.")
-    if not payload:
-        raise ValueError("Document payload is empty.")
-    if len(payload) > MAX_DOCUMENT_FILE_SIZE_BYTES:
-        raise ValueError("Document file is too large. Maximum allowed is 20MB.")
+    _validate_document_file(content_type=safe_content_type, size=size)
 
     object_key = _build_staged_document_object_key(
         customer_id=customer_id,
@@ -218,8 +227,8 @@ def upload_staged_document_file(
         client.put_object(
             bucket_name=settings.MINIO_BUCKET,
             object_name=object_key,
-            data=BytesIO(payload),
-            length=len(payload),
+            data=payload,
+            length=size,
             content_type=safe_content_type,
         )
     except S3Error as exc:
@@ -227,9 +236,66 @@ def upload_staged_document_file(
     return object_key, safe_content_type, Path(object_key).name
 
 
-def get_staged_document_file(customer_id: int, doc_type: str, object_key: str) -> tuple[bytes, str, str]:
+def create_staged_document_upload(
+    *,
+    customer_id: int,
+    doc_type: str,
+    file_name: str | None,
+    content_type: str | None,
+) -> StagedDocumentUploadTicket:
+    safe_content_type = _resolve_content_type(file_name=file_name, content_type=content_type)
+    if safe_content_type not in ALLOWED_DOCUMENT_FILE_CONTENT_TYPES:
+        raise ValueError("Unsupported file type. Use image (JPG/PNG/WEBP/HEIC/HEIF) or PDF.")
+
+    object_key = _build_staged_document_object_key(
+        customer_id=customer_id,
+        doc_type=doc_type,
+        file_name=file_name,
+        content_type=safe_content_type,
+    )
+    try:
+        upload_url, form_fields, expires_at = presign_upload_policy(
+            object_key,
+            content_type=safe_content_type,
+            max_size_bytes=MAX_DOCUMENT_FILE_SIZE_BYTES,
+        )
+    except S3Error as exc:
+        raise ValueError("Could not prepare document upload right now. Please try again.") from exc
+    return StagedDocumentUploadTicket(
+        object_key=object_key,
+        upload_url=upload_url,
+        form_fields=form_fields,
+        content_type=safe_content_type,
+        max_size_bytes=MAX_DOCUMENT_FILE_SIZE_BYTES,
+        expires_at=expires_at,
+    )
+
+
+def confirm_staged_document_upload(*, customer_id: int, doc_type: str, object_key: str) -> tuple[str, str, str]:
+    _assert_staged_key(customer_id=customer_id, doc_type=doc_type, object_key=object_key)
+    client = get_minio_client()
+    try:
+        stat = client.stat_object(settings.MINIO_BUCKET, object_key)
+    except S3Error as exc:
+        raise CustomerDocumentFileNotFoundError(f"Staged document file not found: {object_key}") from exc
+
+    content_type = (getattr(stat, "content_type", None) or "").strip().lower()
+    try:
+        _validate_document_file(content_type=content_type, size=getattr(stat, "size", None) or 0)
+    except ValueError:
+        _delete_document_file(object_key)
+        raise
+    return object_key, content_type, Path(object_key).name
+
+
+def get_staged_document_file(
+    customer_id: int,
+    doc_type: str,
+    object_key: str,
+    read_options: ObjectReadOptions | None = None,
+) -> StoredObject | PresignedObject:
     _assert_staged_key(customer_id=customer_id, doc_type=doc_type, object_key=object_key)
-    return _download_document_file(object_key)
+    return _open_document_file(object_key, read_options=read_options)
 
 
 def delete_staged_document_file(customer_id: int, doc_type: str, object_key: str) -> None:
@@ -297,6 +363,8 @@ def _finalize_staged_document_file(
         content_type = (getattr(stat, "content_type", None) or "application/octet-stream").strip().lower()
     except S3Error as exc:
         raise CustomerDocumentFileNotFoundError(f"Staged document file not found: {staged_object_key}") from exc
+    # Staged files may have been uploaded straight to MinIO, so re-check them before promoting.
+    _validate_document_file(content_type=content_type, size=getattr(stat, "size", None) or 0)
 
     final_key = _build_document_object_key(
         owner_prefix=owner_prefix,
@@ -317,26 +385,25 @@ def _finalize_staged_document_file(
     return final_key
 
 
-def _download_document_file(object_key: str | None) -> tuple[bytes, str, str]:
+def _open_document_file(object_key: str | None, read_options: ObjectReadOptions | None = None) -> StoredObject | PresignedObject:
     if not object_key:
         raise CustomerDocumentFileNotFoundError("No document file uploaded")
     if not (object_key.startswith(f"{DOC_FILES_PREFIX}/") or object_key.startswith(f"{STAGED_DOC_FILES_PREFIX}/")):
         raise CustomerDocumentFileNotFoundError("Unsupported document file path")
 
-    client = get_minio_client()
-    response = None
     try:
-        stat = client.stat_object(settings.MINIO_BUCKET, object_key)
-        content_type = (getattr(stat, "content_type", None) or "application/octet-stream").strip()
-        response = client.get_object(settings.MINIO_BUCKET, object_key)
-        payload = response.read()
+        return open_stored_object(object_key, file_name=Path(object_key).name, read_options=read_options)
     except S3Error as exc:
         raise CustomerDocumentFileNotFoundError(f"Document file not found: {object_key}") from exc
-    finally:
-        if response is not None:
-            response.close()
-            response.release_conn()
-    return payload, content_type, Path(object_key).name
+
+
+def _validate_document_file(*, content_type: str, size: int) -> None:
+    if content_type not in ALLOWED_DOCUMENT_FILE_CONTENT_TYPES:
+        raise ValueError("Unsupported file type. Use image (JPG/PNG/WEBP/HEIC/HEIF) or PDF.")
+    if size <= 0:
+        raise ValueError("Document payload is empty.")
+    if size > MAX_DOCUMENT_FILE_SIZE_BYTES:
+        raise ValueError("Document file is too large. Maximum allowed is 20MB.")
 
 
 def _delete_document_file(object_key: str | None) -> None:
@@ -6,6 +6,7 @@ from sqlalchemy.orm import Session, selectinload
 from app.modules.customers.errors import LicenseNotFoundError
 from app.modules.customers.models import NJDriverLicense, NJDriverLicenseEndorsement, NJDriverLicenseRestriction
 from app.modules.customers.schemas import NJDriverLicenseCreate, NJDriverLicenseUpdate
+from app.modules.dashboard.summary_cache import invalidate_dashboard_summary
 
 from .customers import get_customer_or_404
 from .document_files import finalize_staged_document_file_for_nj_license
@@ -43,14 +44,21 @@ def create_nj_license(db: Session, customer_id: int, payload: NJDriverLicenseCre
     license_obj = _build_nj_license_from_create(payload)
     license_obj.customer_id = customer_id
     db.add(license_obj)
-    db.commit()
+    # Flush only for the id: the staged file is checked and promoted before the single commit, so a rejected
+    # file rolls the license back instead of leaving it saved without its document.
+    db.flush()
     if payload.staged_document_file_object_key:
-        license_obj.document_file_object_key = finalize_staged_document_file_for_nj_license(
-            customer_id=customer_id,
-            license_id=license_obj.id,
-            staged_object_key=payload.staged_document_file_object_key,
-        )
-        db.commit()
+        try:
+            license_obj.document_file_object_key = finalize_staged_document_file_for_nj_license(
+                customer_id=customer_id,
+                license_id=license_obj.id,
+                staged_object_key=payload.staged_document_file_object_key,
+            )
+        except ValueError:
+            db.rollback()
+            raise
+    db.commit()
+    invalidate_dashboard_summary()
     db.refresh(license_obj)
     return get_nj_license_or_404(db, customer_id, license_obj.id)
 
@@ -76,6 +84,7 @@ def update_nj_license(
         clear_current_flags(db, model=NJDriverLicense, customer_id=customer_id, except_id=license_id)
 
     db.commit()
+    invalidate_dashboard_summary()
     db.refresh(license_obj)
     return get_nj_license_or_404(db, customer_id, license_obj.id)
 
@@ -93,14 +102,19 @@ def renew_nj_license(
     new_license.customer_id = customer_id
     new_license.is_current = True
     db.add(new_license)
-    db.commit()
+    db.flush()
     if payload.staged_document_file_object_key:
-        new_license.document_file_object_key = finalize_staged_document_file_for_nj_license(
-            customer_id=customer_id,
-            license_id=new_license.id,
-            staged_object_key=payload.staged_document_file_object_key,
-        )
-        db.commit()
+        try:
+            new_license.document_file_object_key = finalize_staged_document_file_for_nj_license(
+                customer_id=customer_id,
+                license_id=new_license.id,
+                staged_object_key=payload.staged_document_file_object_key,
+            )
+        except ValueError:
+            db.rollback()
+            raise
+    db.commit()
+    invalidate_dashboard_summary()
     db.refresh(new_license)
     return get_nj_license_or_404(db, customer_id, new_license.id)
 
@@ -110,12 +124,14 @@ def deactivate_nj_license(db: Session, customer_id: int, license_id: int) -> Non
     license_obj.active = False
     license_obj.is_current = False
     db.commit()
+    invalidate_dashboard_summary()
 
 
 def delete_nj_license(db: Session, customer_id: int, license_id: int) -> None:
     license_obj = get_nj_license_or_404(db, customer_id, license_id)
     db.delete(license_obj)
     db.commit()
+    invalidate_dashboard_summary()
 
 
 def get_nj_license_or_404(db: Session, customer_id: int, license_id: int) -> NJDriverLicense:
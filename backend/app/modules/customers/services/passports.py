@@ -6,6 +6,7 @@ from sqlalchemy.orm import Session
 from app.modules.customers.errors import PassportNotFoundError
 from app.modules.customers.models import Passport
 from app.modules.customers.schemas import PassportCreate, PassportUpdate
+from app.modules.dashboard.summary_cache import invalidate_dashboard_summary
 
 from .customers import get_customer_or_404
 from .document_files import finalize_staged_document_file_for_passport
@@ -40,14 +41,19 @@ def create_passport(db: Session, customer_id: int, payload: PassportCreate) -> P
         clear_current_flags(db, model=Passport, customer_id=customer_id)
     passport = Passport(customer_id=customer_id, **payload.model_dump(exclude={"staged_document_file_object_key"}))
     db.add(passport)
-    db.commit()
+    db.flush()
     if payload.staged_document_file_object_key:
-        passport.document_file_object_key = finalize_staged_document_file_for_passport(
-            customer_id=customer_id,
-            passport_id=passport.id,
-            staged_object_key=payload.staged_document_file_object_key,
-        )
-        db.commit()
+        try:
+            passport.document_file_object_key = finalize_staged_document_file_for_passport(
+                customer_id=customer_id,
+                passport_id=passport.id,
+                staged_object_key=payload.staged_document_file_object_key,
+            )
+        except ValueError:
+            db.rollback()
+            raise
+    db.commit()
+    invalidate_dashboard_summary()
     db.refresh(passport)
     return passport
 
@@ -60,6 +66,7 @@ def update_passport(db: Session, customer_id: int, passport_id: int, payload: Pa
     if payload.is_current:
         clear_current_flags(db, model=Passport, customer_id=customer_id, except_id=passport_id)
     db.commit()
+    invalidate_dashboard_summary()
     db.refresh(passport)
     return passport
 
@@ -71,14 +78,19 @@ def renew_passport(db: Session, customer_id: int, passport_id: int, payload: Pas
     data["is_current"] = True
     new_passport = Passport(customer_id=customer_id, **data)
     db.add(new_passport)
-    db.commit()
+    db.flush()
     if payload.staged_document_file_object_key:
-        new_passport.document_file_object_key = finalize_staged_document_file_for_passport(
-            customer_id=customer_id,
-            passport_id=new_passport.id,
-            staged_object_key=payload.staged_document_file_object_key,
-        )
-        db.commit()
+        try:
+            new_passport.document_file_object_key = finalize_staged_document_file_for_passport(
+                customer_id=customer_id,
+                passport_id=new_passport.id,
+                staged_object_key=payload.staged_document_file_object_key,
+            )
+        except ValueError:
+            db.rollback()
+            raise
+    db.commit()
+    invalidate_dashboard_summary()
     db.refresh(new_passport)
     return new_passport
 
@@ -88,12 +100,14 @@ def deactivate_passport(db: Session, customer_id: int, passport_id: int) -> None
     passport.active = False
     passport.is_current = False
     db.commit()
+    invalidate_dashboard_summary()
 
 
 def delete_passport(db: Session, customer_id: int, passport_id: int) -> None:
     passport = get_passport_or_404(db, customer_id, passport_id)
     db.delete(passport)
     db.commit()
+    invalidate_dashboard_summary()
 
 
 def get_passport_or_404(db: Session, customer_id: int, passport_id: int) -> Passport:
@@ -5,6 +5,7 @@ from io import BytesIO
 import logging
 from pathlib import Path
 import re
+from typing import BinaryIO
 from uuid import uuid4
 
 from minio.error import S3Error
@@ -13,6 +14,7 @@ from sqlalchemy.orm import Session
 
 from app.core.config import settings
 from app.deps.minio.minio_client import get_minio_client
+from app.deps.minio.minio_objects import ObjectReadOptions, PresignedObject, StoredObject, open_stored_object
 from app.modules.customers.errors import CustomerPhotoNotFoundError
 from app.modules.customers.models import Customer
 
@@ -46,7 +48,8 @@ else:
 def upload_customer_photo(
     db: Session,
     customer_id: int,
-    payload: bytes,
+    payload: BinaryIO,
+    size: int,
     file_name: str | None,
     content_type: str | None,
 ) -> Customer:
@@ -56,9 +59,9 @@ def upload_customer_photo(
         raise ValueError("HEIC/HEIF upload support is unavailable right now. Use JPG, PNG, or WEBP.")
     if safe_content_type not in ALLOWED_PHOTO_CONTENT_TYPES:
         raise ValueError("Unsupported file type. Use JPG, PNG, WEBP, HEIC, or HEIF.")
-    if not payload:
+    if size <= 0:
         raise ValueError("Photo payload is empty.")
-    if len(payload) > MAX_PHOTO_SIZE_BYTES:
+    if size > MAX_PHOTO_SIZE_BYTES:
         raise ValueError("Photo is too large. Maximum allowed is 5MB.")
 
     optimized_payload, optimized_content_type = _transcode_to_webp(payload, source_content_type=safe_content_type)
@@ -85,27 +88,17 @@ def upload_customer_photo(
     return customer
 
 
-def get_customer_photo(customer: Customer) -> tuple[bytes, str, str]:
+def get_customer_photo(customer: Customer, read_options: ObjectReadOptions | None = None) -> StoredObject | PresignedObject:
     object_key = customer.customer_photo_object_key
     if not object_key:
         raise CustomerPhotoNotFoundError(f"Customer {customer.id} has no photo")
     if not object_key.startswith(f"{PHOTO_PREFIX}/"):
         raise CustomerPhotoNotFoundError("Unsupported photo path")
 
-    client = get_minio_client()
-    response = None
     try:
-        stat = client.stat_object(settings.MINIO_BUCKET, object_key)
-        content_type = (getattr(stat, "content_type", None) or "application/octet-stream").strip()
-        response = client.get_object(settings.MINIO_BUCKET, object_key)
-        payload = response.read()
+        return open_stored_object(object_key, file_name=Path(object_key).name, read_options=read_options)
     except S3Error as exc:
         raise CustomerPhotoNotFoundError(f"Photo not found: {object_key}") from exc
-    finally:
-        if response is not None:
-            response.close()
-            response.release_conn()
-    return payload, content_type, Path(object_key).name
 
 
 def delete_customer_photo(db: Session, customer_id: int) -> Customer:
@@ -177,9 +170,9 @@ def _resolve_content_type(file_name: str | None, content_type: str | None) -> st
     return candidate
 
 
-def _transcode_to_webp(payload: bytes, source_content_type: str) -> tuple[bytes, str]:
+def _transcode_to_webp(payload: BinaryIO, source_content_type: str) -> tuple[bytes, str]:
     try:
-        with Image.open(BytesIO(payload)) as original:
+        with Image.open(payload) as original:
             image = ImageOps.exif_transpose(original)
             width, height = image.size
             largest = max(width, height)
@@ -7,9 +7,17 @@ from app.api.deps import get_db
 from app.modules.dashboard.schemas import (
     DashboardPendingListResponse,
     DashboardSummaryResponse,
+    DocumentKind,
+    NotificationBatchUpdateRequest,
     NotificationUpdateRequest,
 )
-from app.modules.dashboard.service import get_dashboard_summary, list_prioritized_pending, set_notification_status
+from app.modules.dashboard.service import (
+    DEFAULT_DAYS_OVERDUE,
+    get_dashboard_summary,
+    list_prioritized_pending,
+    set_notification_status,
+    set_notification_statuses,
+)
 
 router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 
@@ -24,8 +32,21 @@ def pending_route(
     db: Session = Depends(get_db),
     days_ahead: int = Query(default=30, ge=0, le=365),
     include_notified: bool = Query(default=True),
+    document_type: list[DocumentKind] | None = Query(default=None),
+    days_overdue: int = Query(default=DEFAULT_DAYS_OVERDUE, ge=0, le=3650),
+    all_overdue: bool = Query(default=False),
+    offset: int = Query(default=0, ge=0),
+    limit: int = Query(default=200, ge=1, le=1000),
 ) -> DashboardPendingListResponse:
-    return list_prioritized_pending(db=db, days_ahead=days_ahead, include_notified=include_notified)
+    return list_prioritized_pending(
+        db=db,
+        days_ahead=days_ahead,
+        include_notified=include_notified,
+        document_types=document_type,
+        days_overdue=None if all_overdue else days_overdue,
+        offset=offset,
+        limit=limit,
+    )
 
 
 @router.post("/pending/notify", status_code=status.HTTP_204_NO_CONTENT)
@@ -39,3 +60,9 @@ def pending_notify_route(payload: NotificationUpdateRequest, db: Session = Depen
         notified=payload.notified,
     )
     return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+@router.post("/pending/notify/batch", status_code=status.HTTP_204_NO_CONTENT)
+def pending_notify_batch_route(payload: NotificationBatchUpdateRequest, db: Session = Depends(get_db)) -> Response:
+    set_notification_statuses(db=db, updates=payload.items)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import date, datetime
 from typing import Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class DashboardSummaryResponse(BaseModel):
@@ -40,3 +40,7 @@ class NotificationUpdateRequest(BaseModel):
     source_document_id: int
     expiration_date: date
     notified: bool
+
+
+class NotificationBatchUpdateRequest(BaseModel):
+    items: list[NotificationUpdateRequest] = Field(min_length=1, max_length=500)
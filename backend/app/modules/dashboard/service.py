@@ -1,9 +1,17 @@
 from __future__ import annotations
 
-from app.modules.dashboard.services import get_dashboard_summary, list_prioritized_pending, set_notification_status
+from app.modules.dashboard.services import (
+    DEFAULT_DAYS_OVERDUE,
+    get_dashboard_summary,
+    list_prioritized_pending,
+    set_notification_status,
+    set_notification_statuses,
+)
 
 __all__ = [
+    "DEFAULT_DAYS_OVERDUE",
     "get_dashboard_summary",
     "list_prioritized_pending",
     "set_notification_status",
+    "set_notification_statuses",
 ]
@@ -1,9 +1,11 @@
-from .notifications import set_notification_status
-from .pending import list_prioritized_pending
+from .notifications import set_notification_status, set_notification_statuses
+from .pending import DEFAULT_DAYS_OVERDUE, list_prioritized_pending
 from .summary import get_dashboard_summary
 
 __all__ = [
+    "DEFAULT_DAYS_OVERDUE",
     "get_dashboard_summary",
     "list_prioritized_pending",
     "set_notification_status",
+    "set_notification_statuses",
 ]
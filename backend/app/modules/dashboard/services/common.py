@@ -1,46 +1,70 @@
 from __future__ import annotations
 
-from datetime import UTC, date, datetime
+from collections.abc import Collection
+from datetime import UTC, date, datetime, time, timedelta
 
-from sqlalchemy import func, select
+from sqlalchemy import String, Subquery, cast, func, literal, select, union_all
 from sqlalchemy.orm import Session
 
-from app.core.config import settings
-from app.deps.minio.minio_client import get_minio_client
-from app.modules.customers.models import Customer
+from app.modules.customers.models import BrazilDriverLicense, Customer, NJDriverLicense, Passport
+from app.modules.dashboard.schemas import DocumentKind
+from app.modules.documents.models import GeneratedDocument
 
 
 def utc_today() -> date:
     return datetime.now(UTC).date()
 
 
-def count_generated_documents_today() -> int:
-    date_token = datetime.now(UTC).strftime("%Y%m%d_")
-    prefix = settings.GENERATED_DOCUMENTS_PREFIX
-    client = get_minio_client()
-    count = 0
-    try:
-        for item in client.list_objects(settings.MINIO_BUCKET, prefix=prefix, recursive=True):
-            object_name = getattr(item, "object_name", "")
-            if f"_{date_token}" in object_name:
-                count += 1
-    except Exception:
-        return 0
-    return count
-
-
-def count_expiring_for_model(db: Session, *, model: type, start: date, end: date) -> int:
+def count_generated_documents_today(db: Session) -> int:
+    day_start = datetime.combine(utc_today(), time.min, tzinfo=UTC)
     return (
         db.scalar(
-            select(func.count(model.id))
-            .join(Customer, Customer.id == model.customer_id)
-            .where(
-                Customer.active.is_(True),
-                model.active.is_(True),
-                model.is_current.is_(True),
-                model.expiration_date.is_not(None),
-                model.expiration_date.between(start, end),
+            select(func.count(GeneratedDocument.id)).where(
+                GeneratedDocument.generated_at >= day_start,
+                GeneratedDocument.generated_at < day_start + timedelta(days=1),
             )
         )
         or 0
     )
+
+
+EXPIRING_DOCUMENT_MODELS: tuple[tuple[DocumentKind, type], ...] = (
+    ("nj_driver_license", NJDriverLicense),
+    ("brazil_driver_license", BrazilDriverLicense),
+    ("passport", Passport),
+)
+
+
+def expiring_documents_subquery(
+    *,
+    end: date,
+    start: date | None = None,
+    document_types: Collection[DocumentKind] | None = None,
+) -> Subquery:
+    # Current, active documents of active customers across the selected document models, as one UNION ALL.
+    selects = []
+    for document_type, model in EXPIRING_DOCUMENT_MODELS:
+        if document_types and document_type not in document_types:
+            continue
+        conditions = [
+            Customer.active.is_(True),
+            model.active.is_(True),
+            model.is_current.is_(True),
+            model.expiration_date.is_not(None),
+            model.expiration_date <= end,
+        ]
+        if start is not None:
+            conditions.append(model.expiration_date >= start)
+        selects.append(
+            select(
+                cast(literal(document_type), String(40)).label("document_type"),
+                model.id.label("source_document_id"),
+                Customer.id.label("customer_id"),
+                Customer.first_name.label("first_name"),
+                Customer.last_name.label("last_name"),
+                model.expiration_date.label("expiration_date"),
+            )
+            .join(Customer, Customer.id == model.customer_id)
+            .where(*conditions)
+        )
+    return union_all(*selects).subquery("expiring_documents")
@@ -2,11 +2,12 @@ from __future__ import annotations
 
 from datetime import UTC, date, datetime
 
-from sqlalchemy import select
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 
 from app.modules.dashboard.models import ExpirationNotification
-from app.modules.dashboard.schemas import DocumentKind
+from app.modules.dashboard.schemas import DocumentKind, NotificationUpdateRequest
 
 
 def set_notification_status(
@@ -17,21 +18,48 @@ def set_notification_status(
     expiration_date: date,
     notified: bool,
 ) -> None:
-    stmt = select(ExpirationNotification).where(
-        ExpirationNotification.document_type == document_type,
-        ExpirationNotification.source_document_id == source_document_id,
+    set_notification_statuses(
+        db,
+        [
+            NotificationUpdateRequest(
+                customer_id=customer_id,
+                document_type=document_type,
+                source_document_id=source_document_id,
+                expiration_date=expiration_date,
+                notified=notified,
+            )
+        ],
     )
-    record = db.scalar(stmt)
-    if record is None:
-        record = ExpirationNotification(
-            customer_id=customer_id,
-            document_type=document_type,
-            source_document_id=source_document_id,
-            expiration_date=expiration_date,
-        )
-        db.add(record)
-
-    record.customer_id = customer_id
-    record.expiration_date = expiration_date
-    record.notified_at = datetime.now(UTC) if notified else None
+
+
+def set_notification_statuses(db: Session, updates: list[NotificationUpdateRequest]) -> int:
+    # ON CONFLICT cannot touch the same row twice in one statement; the last update per document wins.
+    latest = {(item.document_type, item.source_document_id): item for item in updates}
+    if not latest:
+        return 0
+
+    now = datetime.now(UTC)
+    stmt = insert(ExpirationNotification).values(
+        [
+            {
+                "customer_id": item.customer_id,
+                "document_type": item.document_type,
+                "source_document_id": item.source_document_id,
+                "expiration_date": item.expiration_date,
+                "notified_at": now if item.notified else None,
+            }
+            for item in latest.values()
+        ]
+    )
+    stmt = stmt.on_conflict_do_update(
+        constraint="uq_expiration_notifications_document_ref",
+        set_={
+            "customer_id": stmt.excluded.customer_id,
+            "expiration_date": stmt.excluded.expiration_date,
+            "notified_at": stmt.excluded.notified_at,
+            "updated_at": func.now(),
+        },
+    )
+    db.execute(stmt)
     db.commit()
+    return len(latest)
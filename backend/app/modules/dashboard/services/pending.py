@@ -1,125 +1,100 @@
 from __future__ import annotations
 
-from datetime import date, timedelta
+from datetime import timedelta
 
-from sqlalchemy import select, tuple_
+from sqlalchemy import Select, and_, func, select
 from sqlalchemy.orm import Session
 
-from app.modules.customers.models import BrazilDriverLicense, Customer, NJDriverLicense, Passport
 from app.modules.dashboard.models import ExpirationNotification
 from app.modules.dashboard.schemas import DashboardPendingItem, DashboardPendingListResponse, DocumentKind
 
-from .common import utc_today
+from .common import expiring_documents_subquery, utc_today
+
+# Documents that expired longer ago than this are left out unless the caller asks for the whole history
+# (days_overdue=None); it also bounds the window counts, which see every row of the filtered set.
+DEFAULT_DAYS_OVERDUE = 365
 
 
 def list_prioritized_pending(
     db: Session,
     days_ahead: int = 30,
     include_notified: bool = True,
+    document_types: list[DocumentKind] | None = None,
+    days_overdue: int | None = DEFAULT_DAYS_OVERDUE,
+    offset: int = 0,
+    limit: int = 200,
 ) -> DashboardPendingListResponse:
     today = utc_today()
     horizon = today + timedelta(days=max(days_ahead, 0))
+    start = today - timedelta(days=days_overdue) if days_overdue is not None else None
+
+    expiring = expiring_documents_subquery(start=start, end=horizon, document_types=document_types)
+    notified = ExpirationNotification.notified_at.is_not(None)
+    conditions = []
+    if not include_notified:
+        conditions.append(ExpirationNotification.notified_at.is_(None))
 
-    items = (
-        _list_expiring_for_model(
-            db=db,
-            model=NJDriverLicense,
-            document_type="nj_driver_license",
-            today=today,
-            horizon=horizon,
+    # Window counts are evaluated over the whole filtered set before LIMIT/OFFSET, so one statement
+    # returns the page and the totals.
+    stmt = (
+        select(
+            expiring,
+            ExpirationNotification.notified_at,
+            func.count().over().label("total"),
+            func.count().filter(notified).over().label("notified_count"),
         )
-        + _list_expiring_for_model(
-            db=db,
-            model=BrazilDriverLicense,
-            document_type="brazil_driver_license",
-            today=today,
-            horizon=horizon,
+        .outerjoin(
+            ExpirationNotification,
+            and_(
+                ExpirationNotification.document_type == expiring.c.document_type,
+                ExpirationNotification.source_document_id == expiring.c.source_document_id,
+            ),
         )
-        + _list_expiring_for_model(
-            db=db,
-            model=Passport,
-            document_type="passport",
-            today=today,
-            horizon=horizon,
+        .where(*conditions)
+        .order_by(
+            notified,
+            expiring.c.expiration_date,
+            expiring.c.document_type,
+            expiring.c.source_document_id,
         )
+        .offset(offset)
+        .limit(limit)
     )
+    rows = db.execute(stmt).all()
 
-    if not items:
-        return DashboardPendingListResponse(items=[], total=0, pending_count=0, notified_count=0)
+    if rows:
+        total = rows[0].total
+        notified_count = rows[0].notified_count
+    elif offset > 0:
+        total, notified_count = _count_pending(db, stmt)
+    else:
+        total = notified_count = 0
 
-    keys = [(item.document_type, item.source_document_id) for item in items]
-    tracker_stmt = select(ExpirationNotification).where(
-        tuple_(ExpirationNotification.document_type, ExpirationNotification.source_document_id).in_(keys)
-    )
-    trackers = db.scalars(tracker_stmt).all()
-    tracker_map = {(tracker.document_type, tracker.source_document_id): tracker for tracker in trackers}
-
-    enriched: list[DashboardPendingItem] = []
-    for item in items:
-        tracker = tracker_map.get((item.document_type, item.source_document_id))
-        notified = tracker is not None and tracker.notified_at is not None
-        if not include_notified and notified:
-            continue
-        enriched.append(
-            DashboardPendingItem(
-                customer_id=item.customer_id,
-                customer_name=item.customer_name,
-                document_type=item.document_type,
-                source_document_id=item.source_document_id,
-                expiration_date=item.expiration_date,
-                days_until_expiration=item.days_until_expiration,
-                notified=notified,
-                notified_at=tracker.notified_at if tracker else None,
-            )
+    items = [
+        DashboardPendingItem(
+            customer_id=row.customer_id,
+            customer_name=f"{row.first_name} {row.last_name}".strip(),
+            document_type=row.document_type,
+            source_document_id=row.source_document_id,
+            expiration_date=row.expiration_date,
+            days_until_expiration=(row.expiration_date - today).days,
+            notified=row.notified_at is not None,
+            notified_at=row.notified_at,
         )
-
-    pending_count = sum(1 for item in enriched if not item.notified)
-    notified_count = sum(1 for item in enriched if item.notified)
-    enriched.sort(key=lambda item: (item.notified, item.days_until_expiration, item.expiration_date))
+        for row in rows
+    ]
     return DashboardPendingListResponse(
-        items=enriched,
-        total=len(enriched),
-        pending_count=pending_count,
+        items=items,
+        total=total,
+        pending_count=total - notified_count,
         notified_count=notified_count,
     )
 
 
-def _list_expiring_for_model(
-    db: Session,
-    *,
-    model: type,
-    document_type: DocumentKind,
-    today: date,
-    horizon: date,
-) -> list[DashboardPendingItem]:
-    stmt = (
-        select(
-            Customer.id,
-            Customer.first_name,
-            Customer.last_name,
-            model.id,
-            model.expiration_date,
-        )
-        .join(Customer, Customer.id == model.customer_id)
-        .where(
-            Customer.active.is_(True),
-            model.active.is_(True),
-            model.is_current.is_(True),
-            model.expiration_date.is_not(None),
-            model.expiration_date <= horizon,
-        )
-    )
-    rows = db.execute(stmt).all()
-    return [
-        DashboardPendingItem(
-            customer_id=row[0],
-            customer_name=f"{row[1]} {row[2]}".strip(),
-            document_type=document_type,
-            source_document_id=row[3],
-            expiration_date=row[4],
-            days_until_expiration=(row[4] - today).days,
-            notified=False,
-            notified_at=None,
-        )
-        for row in rows
-    ]
+def _count_pending(db: Session, stmt: Select) -> tuple[int, int]:
+    # Only needed when the requested page is past the end and the window counts came back empty.
+    filtered = stmt.limit(None).offset(None).order_by(None).subquery()
+    total, notified_count = db.execute(
+        select(func.count(), func.count().filter(filtered.c.notified_at.is_not(None))).select_from(filtered)
+    ).one()
+    return total, notified_count
@@ -5,32 +5,42 @@ from datetime import timedelta
 from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
-from app.modules.customers.models import BrazilDriverLicense, Customer, NJDriverLicense, Passport
+from app.modules.customers.models import Customer
 from app.modules.dashboard.schemas import DashboardSummaryResponse
+from app.modules.dashboard.summary_cache import (
+    current_summary_generation,
+    get_cached_dashboard_summary,
+    store_dashboard_summary,
+)
 
-from .common import count_expiring_for_model, count_generated_documents_today, utc_today
+from .common import count_generated_documents_today, expiring_documents_subquery, utc_today
 
 
 def get_dashboard_summary(db: Session) -> DashboardSummaryResponse:
     today = utc_today()
+    cached = get_cached_dashboard_summary(today)
+    if cached is not None:
+        return cached
+    generation = current_summary_generation()
     plus_30 = today + timedelta(days=30)
 
-    customers_total = db.scalar(select(func.count(Customer.id)).where(Customer.active.is_(True))) or 0
-    expiring_today = _count_expiring_documents(db=db, start=today, end=today)
-    expiring_in_30_days = _count_expiring_documents(db=db, start=today + timedelta(days=1), end=plus_30)
-    documents_generated_today = count_generated_documents_today()
-
-    return DashboardSummaryResponse(
+    expiring = expiring_documents_subquery(start=today, end=plus_30)
+    customers_total_subquery = select(func.count(Customer.id)).where(Customer.active.is_(True)).scalar_subquery()
+    customers_total, expiring_today, expiring_in_30_days = db.execute(
+        select(
+            customers_total_subquery,
+            func.count().filter(expiring.c.expiration_date == today),
+            func.count().filter(expiring.c.expiration_date > today),
+        ).select_from(expiring)
+    ).one()
+    documents_generated_today = count_generated_documents_today(db)
+
+    summary = DashboardSummaryResponse(
         customers_total=customers_total,
         documents_generated_today=documents_generated_today,
         expiring_in_30_days=expiring_in_30_days,
         expiring_today=expiring_today,
     )
+    store_dashboard_summary(today, summary, generation=generation)
+    return summary
 
-
-def _count_expiring_documents(db: Session, start, end) -> int:
-    return (
-        count_expiring_for_model(db, model=NJDriverLicense, start=start, end=end)
-        + count_expiring_for_model(db, model=BrazilDriverLicense, start=start, end=end)
-        + count_expiring_for_model(db, model=Passport, start=start, end=end)
-    )
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from datetime import date
+from threading import Lock
+import time
+
+from app.core.config import settings
+from app.modules.dashboard.schemas import DashboardSummaryResponse
+
+_lock = Lock()
+_entry: tuple[date, float, DashboardSummaryResponse] | None = None
+_generation = 0
+
+
+def current_summary_generation() -> int:
+    return _generation
+
+
+def get_cached_dashboard_summary(day: date) -> DashboardSummaryResponse | None:
+    with _lock:
+        if _entry is None:
+            return None
+        cached_day, expires_at, summary = _entry
+    if cached_day != day or time.monotonic() >= expires_at:
+        return None
+    return summary
+
+
+def store_dashboard_summary(day: date, summary: DashboardSummaryResponse, *, generation: int) -> None:
+    global _entry
+    ttl = settings.DASHBOARD_SUMMARY_CACHE_TTL_SECONDS
+    if ttl <= 0:
+        return
+    with _lock:
+        # A write committed while the summary was being computed makes it stale already.
+        if generation != _generation:
+            return
+        _entry = (day, time.monotonic() + ttl, summary)
+
+
+def invalidate_dashboard_summary() -> None:
+    global _entry, _generation
+    with _lock:
+        _entry = None
+        _generation += 1
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, Integer, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class GeneratedDocument(Base):
+    __tablename__ = "generated_documents"
+    __table_args__ = (
+        Index("ix_generated_documents_generated_at_id", "generated_at", "id"),
+        Index("ix_generated_documents_customer_generated_at_id", "customer_id", "generated_at", "id"),
+        Index("ix_generated_documents_template_generated_at_id", "template_key", "generated_at", "id"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    customer_id: Mapped[int | None] = mapped_column(ForeignKey("customers.id", ondelete="SET NULL"))
+    template_key: Mapped[str | None] = mapped_column(String(40))
+    object_key: Mapped[str] = mapped_column(String(512), nullable=False, unique=True)
+    size_bytes: Mapped[int | None] = mapped_column(BigInteger)
+    generated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
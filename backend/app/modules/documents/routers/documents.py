@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_db
+from app.api.deps import get_db, get_object_read_options
+from app.deps.minio.minio_objects import ObjectNotModifiedError, ObjectRangeNotSatisfiableError, ObjectReadOptions
 from app.modules.documents.schemas import (
     GenerateDocumentRequest,
     GenerateDocumentResponse,
@@ -28,6 +28,12 @@ from app.modules.documents.service import (
     list_templates,
     prefill_document_fields,
 )
+from app.utils.object_response import (
+    immutable_cache_control,
+    not_modified_response,
+    range_not_satisfiable_error,
+    stored_object_response,
+)
 
 router = APIRouter(prefix="/documents", tags=["documents"])
 
@@ -90,17 +96,20 @@ def prefill_document(payload: PrefillDocumentRequest, db: Session = Depends(get_
 
 
 @router.get("/download")
-def download_document(object_key: str = Query(..., min_length=1)) -> StreamingResponse:
+def download_document(
+    object_key: str = Query(..., min_length=1),
+    read_options: ObjectReadOptions = Depends(get_object_read_options),
+) -> Response:
     try:
-        payload, file_name = download_generated_document(object_key)
+        stored = download_generated_document(object_key, read_options=read_options)
     except DocumentNotFoundError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    except ObjectRangeNotSatisfiableError as exc:
+        raise range_not_satisfiable_error(exc) from exc
+    except ObjectNotModifiedError as exc:
+        return not_modified_response(exc, cache_control=immutable_cache_control())
 
-    return StreamingResponse(
-        iter([payload]),
-        media_type="application/pdf",
-        headers={"Content-Disposition": f'attachment; filename="{file_name}"'},
-    )
+    return stored_object_response(stored, cache_control=immutable_cache_control())
 
 
 @router.get("/generated", response_model=GeneratedDocumentListResponse)
@@ -109,13 +118,28 @@ def list_generated_documents_route(
     template_key: TemplateKey | None = Query(default=None),
     offset: int = Query(default=0, ge=0),
     limit: int = Query(default=200, ge=1, le=1000),
+    cursor: str | None = Query(default=None, min_length=1),
+    db: Session = Depends(get_db),
 ) -> GeneratedDocumentListResponse:
-    return list_generated_documents(customer_id=customer_id, template_key=template_key, offset=offset, limit=limit)
+    try:
+        return list_generated_documents(
+            db=db,
+            customer_id=customer_id,
+            template_key=template_key,
+            offset=offset,
+            limit=limit,
+            cursor=cursor,
+        )
+    except InvalidSelectionError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
 
 
 @router.delete("/generated", status_code=status.HTTP_204_NO_CONTENT)
-def delete_generated_document_route(object_key: str = Query(..., min_length=1)) -> None:
+def delete_generated_document_route(
+    object_key: str = Query(..., min_length=1),
+    db: Session = Depends(get_db),
+) -> None:
     try:
-        delete_generated_document(object_key)
+        delete_generated_document(db, object_key)
     except DocumentNotFoundError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
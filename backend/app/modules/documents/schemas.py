@@ -63,3 +63,4 @@ class GeneratedDocumentItem(BaseModel):
 class GeneratedDocumentListResponse(BaseModel):
     items: list[GeneratedDocumentItem]
     total: int
+    next_cursor: str | None = None
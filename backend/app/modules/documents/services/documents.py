@@ -3,6 +3,7 @@ from __future__ import annotations
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
+from app.deps.minio.minio_objects import ObjectReadOptions, PresignedObject, StoredObject
 from app.modules.documents.constants import TEMPLATE_FILES
 from app.modules.documents.customer_values import build_pdf_value_map, get_active_customer
 from app.modules.documents.errors import (
@@ -55,6 +56,7 @@ def generate_document(
 
     payload, matched_fields, total_template_fields = render_template_pdf(template_key=template_key, values=values)
     object_key, generated_at = save_generated_document(
+        db=db,
         customer_id=customer.id,
         customer_name=f"{customer.first_name} {customer.last_name}",
         template_key=template_key,
@@ -93,21 +95,30 @@ def prefill_document_fields(
     return PrefillDocumentResponse(template_key=template_key, prefilled_fields=prefilled_fields)
 
 
-def download_generated_document(object_key: str) -> tuple[bytes, str]:
-    return storage_download_generated_document(object_key)
+def download_generated_document(object_key: str, read_options: ObjectReadOptions | None = None) -> StoredObject | PresignedObject:
+    return storage_download_generated_document(object_key, read_options=read_options)
 
 
 def list_generated_documents(
+    db: Session,
     customer_id: int | None = None,
     template_key: TemplateKey | None = None,
     offset: int = 0,
     limit: int = 200,
+    cursor: str | None = None,
 ) -> GeneratedDocumentListResponse:
-    return storage_list_generated_documents(customer_id=customer_id, template_key=template_key, offset=offset, limit=limit)
+    return storage_list_generated_documents(
+        db=db,
+        customer_id=customer_id,
+        template_key=template_key,
+        offset=offset,
+        limit=limit,
+        cursor=cursor,
+    )
 
 
-def delete_generated_document(object_key: str) -> None:
-    storage_delete_generated_document(object_key)
+def delete_generated_document(db: Session, object_key: str) -> None:
+    storage_delete_generated_document(db, object_key)
 
 
 __all__ = [
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from collections.abc import Iterator
 from datetime import UTC, datetime
 from io import BytesIO
 from pathlib import Path
@@ -7,15 +9,22 @@ import re
 import unicodedata
 from uuid import uuid4
 
+from minio.datatypes import Object
 from minio.error import S3Error
+from sqlalchemy import delete, func, select, tuple_
+from sqlalchemy.orm import Session
 
 from app.core.config import settings
 from app.deps.minio.minio_client import get_minio_client
-from app.modules.documents.errors import DocumentNotFoundError
+from app.deps.minio.minio_objects import ObjectReadOptions, PresignedObject, StoredObject, open_stored_object
+from app.modules.dashboard.summary_cache import invalidate_dashboard_summary
+from app.modules.documents.errors import DocumentNotFoundError, InvalidSelectionError
+from app.modules.documents.models import GeneratedDocument
 from app.modules.documents.schemas import GeneratedDocumentItem, GeneratedDocumentListResponse, TemplateKey
 
 
 def save_generated_document(
+    db: Session,
     customer_id: int,
     customer_name: str,
     template_key: TemplateKey,
@@ -37,32 +46,47 @@ def save_generated_document(
         length=len(payload),
         content_type="application/pdf",
     )
+    db.add(
+        GeneratedDocument(
+            customer_id=customer_id,
+            template_key=template_key,
+            object_key=object_key,
+            size_bytes=len(payload),
+            generated_at=now,
+        )
+    )
+    try:
+        db.commit()
+    except Exception:
+        db.rollback()
+        _remove_object_quietly(object_key)
+        raise
+    invalidate_dashboard_summary()
     return object_key, now
 
 
-def download_generated_document(object_key: str) -> tuple[bytes, str]:
+def download_generated_document(object_key: str, read_options: ObjectReadOptions | None = None) -> StoredObject | PresignedObject:
     if not object_key.startswith(f"{settings.GENERATED_DOCUMENTS_PREFIX}/"):
         raise DocumentNotFoundError("Unsupported document path")
 
-    client = get_minio_client()
-    response = None
     try:
-        response = client.get_object(settings.MINIO_BUCKET, object_key)
-        payload = response.read()
+        return open_stored_object(
+            object_key,
+            file_name=Path(object_key).name,
+            read_options=read_options,
+            disposition="attachment",
+        )
     except S3Error as exc:
         raise DocumentNotFoundError(f"Document not found: {object_key}") from exc
-    finally:
-        if response is not None:
-            response.close()
-            response.release_conn()
-    return payload, Path(object_key).name
 
 
 def list_generated_documents(
+    db: Session,
     customer_id: int | None = None,
     template_key: TemplateKey | None = None,
     offset: int = 0,
     limit: int = 200,
+    cursor: str | None = None,
 ) -> GeneratedDocumentListResponse:
     if offset < 0:
         offset = 0
@@ -71,40 +95,44 @@ def list_generated_documents(
     if limit > 1000:
         limit = 1000
 
-    client = get_minio_client()
-    prefix = f"{settings.GENERATED_DOCUMENTS_PREFIX}/"
-    objects = client.list_objects(settings.MINIO_BUCKET, prefix=prefix, recursive=True)
-
-    items: list[GeneratedDocumentItem] = []
-    for obj in objects:
-        object_key = str(getattr(obj, "object_name", ""))
-        if not object_key.endswith(".pdf"):
-            continue
-
-        parsed_customer_id, parsed_template_key, parsed_generated_at = _parse_generated_key(object_key)
-        if customer_id is not None and parsed_customer_id != customer_id:
-            continue
-        if template_key is not None and parsed_template_key != template_key:
-            continue
-
-        items.append(
-            GeneratedDocumentItem(
-                bucket=settings.MINIO_BUCKET,
-                object_key=object_key,
-                file_name=Path(object_key).name,
-                customer_id=parsed_customer_id,
-                template_key=parsed_template_key,
-                generated_at=parsed_generated_at,
-                last_modified=getattr(obj, "last_modified", None),
-                size_bytes=getattr(obj, "size", None),
-            )
-        )
+    conditions = []
+    if customer_id is not None:
+        conditions.append(GeneratedDocument.customer_id == customer_id)
+    if template_key is not None:
+        conditions.append(GeneratedDocument.template_key == template_key)
+
+    total = db.scalar(select(func.count(GeneratedDocument.id)).where(*conditions)) or 0
 
-    items.sort(key=lambda item: item.generated_at or item.last_modified or datetime.min.replace(tzinfo=UTC), reverse=True)
-    return GeneratedDocumentListResponse(items=items[offset : offset + limit], total=len(items))
+    stmt = select(GeneratedDocument).where(*conditions)
+    if cursor:
+        cursor_generated_at, cursor_id = _decode_cursor(cursor)
+        stmt = stmt.where(
+            tuple_(GeneratedDocument.generated_at, GeneratedDocument.id) < tuple_(cursor_generated_at, cursor_id)
+        )
+    elif offset:
+        stmt = stmt.offset(offset)
+    # One extra row tells us whether another page exists without a second query.
+    stmt = stmt.order_by(GeneratedDocument.generated_at.desc(), GeneratedDocument.id.desc()).limit(limit + 1)
+    rows = list(db.scalars(stmt).all())
+
+    next_cursor = _encode_cursor(rows[limit - 1]) if len(rows) > limit else None
+    items = [
+        GeneratedDocumentItem(
+            bucket=settings.MINIO_BUCKET,
+            object_key=row.object_key,
+            file_name=Path(row.object_key).name,
+            customer_id=row.customer_id,
+            template_key=row.template_key,
+            generated_at=row.generated_at,
+            last_modified=row.generated_at,
+            size_bytes=row.size_bytes,
+        )
+        for row in rows[:limit]
+    ]
+    return GeneratedDocumentListResponse(items=items, total=total, next_cursor=next_cursor)
 
 
-def delete_generated_document(object_key: str) -> None:
+def delete_generated_document(db: Session, object_key: str) -> None:
     if not object_key.startswith(f"{settings.GENERATED_DOCUMENTS_PREFIX}/"):
         raise DocumentNotFoundError("Unsupported document path")
     client = get_minio_client()
@@ -112,9 +140,23 @@ def delete_generated_document(object_key: str) -> None:
         client.remove_object(settings.MINIO_BUCKET, object_key)
     except S3Error as exc:
         raise DocumentNotFoundError(f"Document not found: {object_key}") from exc
+    db.execute(delete(GeneratedDocument).where(GeneratedDocument.object_key == object_key))
+    db.commit()
+    invalidate_dashboard_summary()
 
 
-def _parse_generated_key(object_key: str) -> tuple[int | None, TemplateKey | None, datetime | None]:
+def iter_generated_objects(customer_id: int | None = None) -> Iterator[Object]:
+    # Keys are laid out as {prefix}/{customer_id}/..., so a customer filter only lists that sub-prefix.
+    prefix = f"{settings.GENERATED_DOCUMENTS_PREFIX}/"
+    if customer_id is not None:
+        prefix = f"{prefix}{customer_id}/"
+    client = get_minio_client()
+    for obj in client.list_objects(settings.MINIO_BUCKET, prefix=prefix, recursive=True):
+        if str(obj.object_name or "").endswith(".pdf"):
+            yield obj
+
+
+def parse_generated_key(object_key: str) -> tuple[int | None, TemplateKey | None, datetime | None]:
     legacy_pattern = re.compile(
         rf"^{re.escape(settings.GENERATED_DOCUMENTS_PREFIX)}/(?P<customer_id>\d+)/"
         r"(?P<template_key>affidavit|ba208)_(?P<stamp>\d{8}_\d{6})\.pdf$"
@@ -141,6 +183,27 @@ def _parse_generated_key(object_key: str) -> tuple[int | None, TemplateKey | Non
     return customer, parsed_template, None
 
 
+def _encode_cursor(row: GeneratedDocument) -> str:
+    raw = f"{row.generated_at.isoformat()}|{row.id}"
+    return urlsafe_b64encode(raw.encode("ascii")).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        raw = urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("ascii")
+        raw_generated_at, raw_id = raw.split("|", 1)
+        return datetime.fromisoformat(raw_generated_at), int(raw_id)
+    except ValueError as exc:
+        raise InvalidSelectionError("Invalid pagination cursor") from exc
+
+
+def _remove_object_quietly(object_key: str) -> None:
+    try:
+        get_minio_client().remove_object(settings.MINIO_BUCKET, object_key)
+    except S3Error:
+        pass
+
+
 def _slugify_filename_part(value: str, fallback: str) -> str:
     normalized = unicodedata.normalize("NFKD", value or "")
     ascii_only = normalized.encode("ascii", "ignore").decode("ascii")
@@ -14,6 +14,7 @@ from app.modules.ocr.services.prefill_brazil_license_form_from_document_use_case
 from app.modules.ocr.services.prefill_customer_form_from_document_use_case import prefill_customer_form_from_document
 from app.modules.ocr.services.prefill_nj_license_form_from_document_use_case import prefill_nj_license_form_from_document
 from app.modules.ocr.services.prefill_passport_form_from_document_use_case import prefill_passport_form_from_document
+from app.utils.uploads import UploadTooLargeError, read_upload_limited
 
 router = APIRouter(prefix="/ocr", tags=["ocr"])
 
@@ -131,9 +132,10 @@ async def _read_ocr_upload(file: UploadFile) -> tuple[bytes, str | None]:
         elif ext == "heif":
             normalized_content_type = "image/heif"
 
-    payload = await file.read()
+    try:
+        payload = await read_upload_limited(file, max_bytes=MAX_OCR_UPLOAD_BYTES)
+    except UploadTooLargeError as exc:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="File too large for OCR.") from exc
     if not payload:
         raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Empty file payload.")
-    if len(payload) > MAX_OCR_UPLOAD_BYTES:
-        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="File too large for OCR.")
     return payload, normalized_content_type
@@ -0,0 +1,9 @@
+from __future__ import annotations
+
+
+class ReportJobNotFoundError(ValueError):
+    pass
+
+
+class ReportJobNotReadyError(ValueError):
+    pass
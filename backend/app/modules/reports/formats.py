@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+import csv
+from dataclasses import dataclass
+from io import StringIO
+import json
+import re
+from typing import Any, Literal
+import zlib
+
+ReportFormat = Literal["csv", "csv.gz", "jsonl"]
+
+REPORT_FLUSH_ROWS = 500
+GZIP_LEVEL = 6
+
+
+@dataclass
+class Report:
+    header: list[str]
+    rows: Iterable[list[Any]]
+    filename: str
+
+
+@dataclass
+class EncodedReport:
+    chunks: Iterator[bytes]
+    media_type: str
+    filename: str
+    content_encoding: str | None = None
+
+
+def encode_report(report: Report, report_format: ReportFormat, *, accept_encoding: str | None = None) -> EncodedReport:
+    if report_format == "csv.gz":
+        return EncodedReport(
+            chunks=gzip_chunks(iter_csv(report.header, report.rows)),
+            media_type="application/gzip",
+            filename=f"{report.filename}.csv.gz",
+        )
+
+    if report_format == "jsonl":
+        chunks = iter_jsonl(report.header, report.rows)
+        media_type = "application/x-ndjson"
+        filename = f"{report.filename}.jsonl"
+    else:
+        chunks = iter_csv(report.header, report.rows)
+        media_type = "text/csv; charset=utf-8"
+        filename = f"{report.filename}.csv"
+
+    if accepts_gzip(accept_encoding):
+        return EncodedReport(chunks=gzip_chunks(chunks), media_type=media_type, filename=filename, content_encoding="gzip")
+    return EncodedReport(chunks=chunks, media_type=media_type, filename=filename)
+
+
+def iter_csv(header: list[str], rows: Iterable[list[Any]]) -> Iterator[bytes]:
+    # Rows are rendered into a small reusable buffer and flushed every REPORT_FLUSH_ROWS, so memory stays
+    # bounded by one batch regardless of how many rows the query yields.
+    buffer = StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(header)
+    pending = 0
+    for row in rows:
+        writer.writerow(row)
+        pending += 1
+        if pending >= REPORT_FLUSH_ROWS:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    yield buffer.getvalue().encode("utf-8")
+
+
+def iter_jsonl(header: list[str], rows: Iterable[list[Any]]) -> Iterator[bytes]:
+    keys = [_json_key(label) for label in header]
+    lines: list[str] = []
+    for row in rows:
+        lines.append(json.dumps(dict(zip(keys, row)), default=str, ensure_ascii=False))
+        if len(lines) >= REPORT_FLUSH_ROWS:
+            yield ("\n".join(lines) + "\n").encode("utf-8")
+            lines.clear()
+    if lines:
+        yield ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def gzip_chunks(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def accepts_gzip(accept_encoding: str | None) -> bool:
+    qualities: dict[str, float] = {}
+    for item in (accept_encoding or "").split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        qualities[coding] = quality
+    return qualities.get("gzip", qualities.get("*", 0.0)) > 0
+
+
+def _json_key(label: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "_", label.lower()).strip("_")
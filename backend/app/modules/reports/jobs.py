@@ -0,0 +1,349 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
+import json
+import logging
+import os
+import socket
+from threading import Event, Lock, Thread
+from uuid import uuid4
+
+from minio.error import S3Error
+from sqlalchemy import and_, delete, func, or_, select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.deps.minio.minio_client import get_minio_client
+from app.deps.minio.minio_objects import ObjectReadOptions, PresignedObject, StoredObject, open_stored_object
+from app.modules.reports.errors import ReportJobNotFoundError, ReportJobNotReadyError
+from app.modules.reports.formats import Report, encode_report
+from app.modules.reports.models import ReportJob
+from app.modules.reports.schemas import ReportJobCreateRequest, ReportJobResponse
+from app.modules.reports.service import (
+    build_all_customers_csv,
+    build_customers_returned_home_country_csv,
+    build_customers_without_active_driver_license_csv,
+    build_customers_without_current_driver_license_csv,
+    build_customers_without_phone_csv,
+    build_customers_without_photo_csv,
+    build_expiring_licenses_csv,
+    build_passports_expiring_this_year_csv,
+)
+
+logger = logging.getLogger(__name__)
+
+# Results are uploaded as a multipart stream of unknown length; MinIO buffers one part (min 5 MiB) at a time.
+REPORT_UPLOAD_PART_SIZE = 8 * 1024 * 1024
+REPORT_JOB_SWEEP_BATCH = 100
+ACTIVE_JOB_STATUSES = ("queued", "running")
+# Jobs only ever run in the executor of the process that accepted them; this identifies that process.
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+
+REPORT_BUILDERS: dict[str, Callable[[Session, dict[str, int]], Report]] = {
+    "customers": lambda db, _: build_all_customers_csv(db),
+    "licenses-expiring": lambda db, params: build_expiring_licenses_csv(db, months_ahead=params["months_ahead"]),
+    "customers-without-active-driver-license": lambda db, _: build_customers_without_active_driver_license_csv(db),
+    "passports-expiring-this-year": lambda db, _: build_passports_expiring_this_year_csv(db),
+    "customers-without-photo": lambda db, _: build_customers_without_photo_csv(db),
+    "customers-without-phone": lambda db, _: build_customers_without_phone_csv(db),
+    "customers-without-current-driver-license": lambda db, _: build_customers_without_current_driver_license_csv(db),
+    "customers-outside-usa": lambda db, _: build_customers_returned_home_country_csv(db),
+}
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = Lock()
+_heartbeat_thread: Thread | None = None
+_heartbeat_stop = Event()
+
+
+def submit_report_job(db: Session, payload: ReportJobCreateRequest) -> ReportJobResponse:
+    params_key = _params_key(payload)
+    _lock_report_submissions(db, payload.report, payload.format, params_key)
+    # A queued/running job for the same report is always shared; a finished one only within the reuse window.
+    existing = _find_reusable_job(db, payload.report, payload.format, params_key, include_finished=not payload.refresh)
+    if existing is not None:
+        response = _to_response(existing, reused=True)
+        db.commit()
+        return response
+
+    now = datetime.now(UTC)
+    job = ReportJob(
+        report_key=payload.report,
+        report_format=payload.format,
+        params_key=params_key,
+        status="queued",
+        worker_id=WORKER_ID,
+        heartbeat_at=now,
+        created_at=now,
+    )
+    db.add(job)
+    db.commit()
+    _get_executor().submit(run_report_job, job.id)
+    return _to_response(job)
+
+
+def get_report_job(db: Session, job_id: int) -> ReportJobResponse:
+    return _to_response(_get_job_or_raise(db, job_id))
+
+
+def open_report_job_result(
+    db: Session,
+    job_id: int,
+    read_options: ObjectReadOptions | None = None,
+) -> StoredObject | PresignedObject:
+    job = _get_job_or_raise(db, job_id)
+    if job.status != "succeeded" or not job.object_key:
+        raise ReportJobNotReadyError(f"Report job {job_id} is {job.status}")
+    try:
+        return open_stored_object(
+            job.object_key,
+            file_name=job.file_name or job.object_key.rsplit("/", 1)[-1],
+            read_options=read_options,
+            disposition="attachment",
+        )
+    except S3Error as exc:
+        raise ReportJobNotFoundError(f"Report file not found for job {job_id}") from exc
+
+
+def run_report_job(job_id: int) -> None:
+    now = datetime.now(UTC)
+    with SessionLocal() as db:
+        # Claiming with a conditional UPDATE keeps a job from running twice if it is ever resubmitted.
+        claimed = db.execute(
+            update(ReportJob)
+            .where(ReportJob.id == job_id, ReportJob.status == "queued")
+            .values(status="running", started_at=now, worker_id=WORKER_ID, heartbeat_at=now)
+        ).rowcount
+        db.commit()
+        if not claimed:
+            return
+
+        job = db.get(ReportJob, job_id)
+        if job is None:
+            return
+        try:
+            _store_report_result(db, job)
+        except Exception as exc:
+            db.rollback()
+            logger.exception("Report job %s (%s) failed", job_id, job.report_key)
+            job.status = "failed"
+            job.error = str(exc) or exc.__class__.__name__
+            job.finished_at = datetime.now(UTC)
+            db.commit()
+            return
+
+        job.status = "succeeded"
+        job.finished_at = datetime.now(UTC)
+        db.commit()
+        _sweep_expired_jobs(db, keep_job_id=job.id)
+
+
+def fail_stale_report_jobs() -> int:
+    # A queued/running job whose owner stopped refreshing heartbeat_at (crash, restart, replica scaled away) can
+    # never finish; jobs still owned by a live process, including other workers and replicas, are left alone.
+    stale_before = datetime.now(UTC) - timedelta(seconds=settings.REPORT_JOB_STALE_SECONDS)
+    with SessionLocal() as db:
+        count = db.execute(
+            update(ReportJob)
+            .where(
+                ReportJob.status.in_(ACTIVE_JOB_STATUSES),
+                or_(ReportJob.heartbeat_at.is_(None), ReportJob.heartbeat_at < stale_before),
+            )
+            .values(status="failed", error="Interrupted: the worker stopped responding", finished_at=datetime.now(UTC))
+        ).rowcount
+        db.commit()
+        return count
+
+
+def start_report_job_heartbeat() -> None:
+    global _heartbeat_thread
+    with _executor_lock:
+        if _heartbeat_thread is not None:
+            return
+        _heartbeat_stop.clear()
+        _heartbeat_thread = Thread(target=_heartbeat_loop, name="report-job-heartbeat", daemon=True)
+        _heartbeat_thread.start()
+
+
+def shutdown_report_job_workers() -> None:
+    global _executor, _heartbeat_thread
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+        _heartbeat_stop.set()
+        _heartbeat_thread = None
+
+
+def _heartbeat_loop() -> None:
+    # Runs once at startup, so jobs orphaned by a previous process are failed promptly. Own heartbeats are
+    # refreshed before sweeping, so that after a database outage this process never fails its own live jobs.
+    while True:
+        try:
+            _refresh_heartbeats()
+            fail_stale_report_jobs()
+        except Exception:
+            logger.warning("Could not refresh report job heartbeats", exc_info=True)
+        if _heartbeat_stop.wait(max(1, settings.REPORT_JOB_HEARTBEAT_SECONDS)):
+            return
+
+
+def _refresh_heartbeats() -> None:
+    with SessionLocal() as db:
+        db.execute(
+            update(ReportJob)
+            .where(ReportJob.worker_id == WORKER_ID, ReportJob.status.in_(ACTIVE_JOB_STATUSES))
+            .values(heartbeat_at=datetime.now(UTC))
+        )
+        db.commit()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=max(1, settings.REPORT_JOB_WORKERS),
+                    thread_name_prefix="report-job",
+                )
+    return _executor
+
+
+def _store_report_result(db: Session, job: ReportJob) -> None:
+    report = REPORT_BUILDERS[job.report_key](db, json.loads(job.params_key))
+    encoded = encode_report(report, job.report_format)
+    object_key = f"{settings.REPORTS_PREFIX}/{job.report_key}/{job.id}/{encoded.filename}"
+    reader = _ChunkReader(encoded.chunks)
+    get_minio_client().put_object(
+        bucket_name=settings.MINIO_BUCKET,
+        object_name=object_key,
+        data=reader,
+        length=-1,
+        part_size=REPORT_UPLOAD_PART_SIZE,
+        content_type=encoded.media_type,
+    )
+    job.object_key = object_key
+    job.file_name = encoded.filename
+    job.content_type = encoded.media_type
+    job.size_bytes = reader.bytes_read
+
+
+def _lock_report_submissions(db: Session, report_key: str, report_format: str, params_key: str) -> None:
+    # Transaction-scoped, so it is held until the new job is committed: a concurrent POST for the same report
+    # (the month-end rush) waits here and then reuses that job instead of building the file a second time.
+    if db.get_bind().dialect.name != "postgresql":
+        return
+    lock_name = f"report-job:{report_key}:{report_format}:{params_key}"
+    db.execute(select(func.pg_advisory_xact_lock(func.hashtextextended(lock_name, 0))))
+
+
+def _find_reusable_job(
+    db: Session,
+    report_key: str,
+    report_format: str,
+    params_key: str,
+    *,
+    include_finished: bool,
+) -> ReportJob | None:
+    reusable = ReportJob.status.in_(ACTIVE_JOB_STATUSES)
+    if include_finished and settings.REPORT_JOB_REUSE_SECONDS > 0:
+        fresh_after = datetime.now(UTC) - timedelta(seconds=settings.REPORT_JOB_REUSE_SECONDS)
+        reusable = or_(reusable, and_(ReportJob.status == "succeeded", ReportJob.finished_at >= fresh_after))
+    stmt = (
+        select(ReportJob)
+        .where(
+            ReportJob.report_key == report_key,
+            ReportJob.report_format == report_format,
+            ReportJob.params_key == params_key,
+            reusable,
+        )
+        .order_by(ReportJob.created_at.desc())
+        .limit(1)
+    )
+    return db.scalar(stmt)
+
+
+def _sweep_expired_jobs(db: Session, *, keep_job_id: int) -> None:
+    retention_seconds = max(settings.REPORT_JOB_RETENTION_SECONDS, settings.REPORT_JOB_REUSE_SECONDS)
+    expired_before = datetime.now(UTC) - timedelta(seconds=retention_seconds)
+    expired = db.scalars(
+        select(ReportJob)
+        .where(
+            ReportJob.status.in_(("succeeded", "failed")),
+            ReportJob.finished_at < expired_before,
+            ReportJob.id != keep_job_id,
+        )
+        .order_by(ReportJob.finished_at)
+        .limit(REPORT_JOB_SWEEP_BATCH)
+    ).all()
+    if not expired:
+        return
+
+    client = get_minio_client()
+    removed_ids = []
+    for job in expired:
+        if job.object_key:
+            try:
+                client.remove_object(settings.MINIO_BUCKET, job.object_key)
+            except S3Error:
+                logger.warning("Could not remove expired report object %s", job.object_key)
+                continue
+        removed_ids.append(job.id)
+    if removed_ids:
+        db.execute(delete(ReportJob).where(ReportJob.id.in_(removed_ids)))
+        db.commit()
+
+
+def _get_job_or_raise(db: Session, job_id: int) -> ReportJob:
+    job = db.get(ReportJob, job_id)
+    if job is None:
+        raise ReportJobNotFoundError(f"Report job not found: {job_id}")
+    return job
+
+
+def _params_key(payload: ReportJobCreateRequest) -> str:
+    # Only parameters the builder actually reads are part of the key, so they never split the reuse cache.
+    params = {"months_ahead": payload.months_ahead} if payload.report == "licenses-expiring" else {}
+    return json.dumps(params, sort_keys=True)
+
+
+def _to_response(job: ReportJob, *, reused: bool = False) -> ReportJobResponse:
+    return ReportJobResponse(
+        id=job.id,
+        report=job.report_key,
+        format=job.report_format,
+        status=job.status,
+        reused=reused,
+        file_name=job.file_name,
+        size_bytes=job.size_bytes,
+        error=job.error,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+    )
+
+
+class _ChunkReader:
+    # Minimal file-like view over the encoded chunks for put_object(length=-1); it hands out at most one
+    # chunk per read() and MinIO's part reader keeps calling until a part is full.
+    def __init__(self, chunks: Iterator[bytes]) -> None:
+        self._chunks = chunks
+        self._pending = b""
+        self.bytes_read = 0
+
+    def read(self, size: int = -1) -> bytes:
+        while not self._pending:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return b""
+            self._pending = chunk
+        if size < 0 or size >= len(self._pending):
+            data, self._pending = self._pending, b""
+        else:
+            data, self._pending = self._pending[:size], self._pending[size:]
+        self.bytes_read += len(data)
+        return data
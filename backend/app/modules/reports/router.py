@@ -1,10 +1,17 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, Query
-from fastapi.responses import Response
+from dataclasses import dataclass
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_db
+from app.api.deps import get_db, get_object_read_options
+from app.deps.minio.minio_objects import ObjectNotModifiedError, ObjectRangeNotSatisfiableError, ObjectReadOptions
+from app.modules.reports.errors import ReportJobNotFoundError, ReportJobNotReadyError
+from app.modules.reports.formats import Report, ReportFormat, encode_report
+from app.modules.reports.jobs import get_report_job, open_report_job_result, submit_report_job
+from app.modules.reports.schemas import ReportJobCreateRequest, ReportJobResponse
 from app.modules.reports.service import (
     build_all_customers_csv,
     build_customers_returned_home_country_csv,
@@ -15,88 +22,133 @@ from app.modules.reports.service import (
     build_expiring_licenses_csv,
     build_passports_expiring_this_year_csv,
 )
+from app.utils.object_response import (
+    immutable_cache_control,
+    not_modified_response,
+    range_not_satisfiable_error,
+    stored_object_response,
+)
 
 router = APIRouter(prefix="/reports", tags=["reports"])
 
 
+@dataclass(frozen=True)
+class ReportOptions:
+    report_format: ReportFormat
+    accept_encoding: str | None
+
+
+def get_report_options(
+    report_format: ReportFormat = Query(default="csv", alias="format"),
+    accept_encoding: str | None = Header(default=None),
+) -> ReportOptions:
+    return ReportOptions(report_format=report_format, accept_encoding=accept_encoding)
+
+
 @router.get("/customers.csv")
-def export_all_customers_csv(db: Session = Depends(get_db)) -> Response:
-    content, filename = build_all_customers_csv(db)
-    return Response(
-        content=content,
-        media_type="text/csv; charset=utf-8",
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
-    )
+def export_all_customers_csv(
+    db: Session = Depends(get_db),
+    options: ReportOptions = Depends(get_report_options),
+) -> StreamingResponse:
+    return _report_response(build_all_customers_csv(db), options)
 
 
 @router.get("/licenses-expiring.csv")
 def export_expiring_licenses_csv(
     db: Session = Depends(get_db),
     months_ahead: int = Query(default=3, ge=1, le=12),
-) -> Response:
-    content, filename = build_expiring_licenses_csv(db, months_ahead=months_ahead)
-    return Response(
-        content=content,
-        media_type="text/csv; charset=utf-8",
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
-    )
+    options: ReportOptions = Depends(get_report_options),
+) -> StreamingResponse:
+    return _report_response(build_expiring_licenses_csv(db, months_ahead=months_ahead), options)
 
 
 @router.get("/customers-without-active-driver-license.csv")
-def export_customers_without_active_driver_license_csv(db: Session = Depends(get_db)) -> Response:
-    content, filename = build_customers_without_active_driver_license_csv(db)
-    return Response(
-        content=content,
-        media_type="text/csv; charset=utf-8",
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
-    )
+def export_customers_without_active_driver_license_csv(
+    db: Session = Depends(get_db),
+    options: ReportOptions = Depends(get_report_options),
+) -> StreamingResponse:
+    return _report_response(build_customers_without_active_driver_license_csv(db), options)
 
 
 @router.get("/passports-expiring-this-year.csv")
-def export_passports_expiring_this_year_csv(db: Session = Depends(get_db)) -> Response:
-    content, filename = build_passports_expiring_this_year_csv(db)
-    return Response(
-        content=content,
-        media_type="text/csv; charset=utf-8",
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
-    )
+def export_passports_expiring_this_year_csv(
+    db: Session = Depends(get_db),
+    options: ReportOptions = Depends(get_report_options),
+) -> StreamingResponse:
+    return _report_response(build_passports_expiring_this_year_csv(db), options)
 
 
 @router.get("/customers-without-photo.csv")
-def export_customers_without_photo_csv(db: Session = Depends(get_db)) -> Response:
-    content, filename = build_customers_without_photo_csv(db)
-    return Response(
-        content=content,
-        media_type="text/csv; charset=utf-8",
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
-    )
+def export_customers_without_photo_csv(
+    db: Session = Depends(get_db),
+    options: ReportOptions = Depends(get_report_options),
+) -> StreamingResponse:
+    return _report_response(build_customers_without_photo_csv(db), options)
 
 
 @router.get("/customers-without-phone.csv")
-def export_customers_without_phone_csv(db: Session = Depends(get_db)) -> Response:
-    content, filename = build_customers_without_phone_csv(db)
-    return Response(
-        content=content,
-        media_type="text/csv; charset=utf-8",
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
-    )
+def export_customers_without_phone_csv(
+    db: Session = Depends(get_db),
+    options: ReportOptions = Depends(get_report_options),
+) -> StreamingResponse:
+    return _report_response(build_customers_without_phone_csv(db), options)
 
 
 @router.get("/customers-without-current-driver-license.csv")
-def export_customers_without_current_driver_license_csv(db: Session = Depends(get_db)) -> Response:
-    content, filename = build_customers_without_current_driver_license_csv(db)
-    return Response(
-        content=content,
-        media_type="text/csv; charset=utf-8",
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
-    )
+def export_customers_without_current_driver_license_csv(
+    db: Session = Depends(get_db),
+    options: ReportOptions = Depends(get_report_options),
+) -> StreamingResponse:
+    return _report_response(build_customers_without_current_driver_license_csv(db), options)
 
 
 @router.get("/customers-outside-usa.csv")
-def export_customers_outside_usa_csv(db: Session = Depends(get_db)) -> Response:
-    content, filename = build_customers_returned_home_country_csv(db)
-    return Response(
-        content=content,
-        media_type="text/csv; charset=utf-8",
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
-    )
+def export_customers_outside_usa_csv(
+    db: Session = Depends(get_db),
+    options: ReportOptions = Depends(get_report_options),
+) -> StreamingResponse:
+    return _report_response(build_customers_returned_home_country_csv(db), options)
+
+
+@router.post("/jobs", response_model=ReportJobResponse, status_code=status.HTTP_202_ACCEPTED)
+def create_report_job_route(payload: ReportJobCreateRequest, db: Session = Depends(get_db)) -> ReportJobResponse:
+    return submit_report_job(db, payload)
+
+
+@router.get("/jobs/{job_id}", response_model=ReportJobResponse)
+def get_report_job_route(job_id: int, db: Session = Depends(get_db)) -> ReportJobResponse:
+    try:
+        return get_report_job(db, job_id)
+    except ReportJobNotFoundError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+
+
+@router.get("/jobs/{job_id}/download")
+def download_report_job_route(
+    job_id: int,
+    db: Session = Depends(get_db),
+    read_options: ObjectReadOptions = Depends(get_object_read_options),
+) -> Response:
+    try:
+        stored = open_report_job_result(db, job_id, read_options=read_options)
+    except ReportJobNotFoundError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    except ReportJobNotReadyError as exc:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc)) from exc
+    except ObjectRangeNotSatisfiableError as exc:
+        raise range_not_satisfiable_error(exc) from exc
+    except ObjectNotModifiedError as exc:
+        return not_modified_response(exc, cache_control=immutable_cache_control())
+
+    return stored_object_response(stored, cache_control=immutable_cache_control())
+
+
+def _report_response(report: Report, options: ReportOptions) -> StreamingResponse:
+    encoded = encode_report(report, options.report_format, accept_encoding=options.accept_encoding)
+    headers = {
+        "Content-Disposition": f'attachment; filename="{encoded.filename}"',
+        "Vary": "Accept-Encoding",
+    }
+    if encoded.content_encoding:
+        headers["Content-Encoding"] = encoded.content_encoding
+    return StreamingResponse(encoded.chunks, media_type=encoded.media_type, headers=headers)
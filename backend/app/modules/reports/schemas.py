@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+from app.modules.reports.formats import ReportFormat
+
+ReportKey = Literal[
+    "customers",
+    "licenses-expiring",
+    "customers-without-active-driver-license",
+    "passports-expiring-this-year",
+    "customers-without-photo",
+    "customers-without-phone",
+    "customers-without-current-driver-license",
+    "customers-outside-usa",
+]
+ReportJobStatus = Literal["queued", "running", "succeeded", "failed"]
+
+
+class ReportJobCreateRequest(BaseModel):
+    report: ReportKey
+    format: ReportFormat = "csv"
+    months_ahead: int = Field(default=3, ge=1, le=12)
+    refresh: bool = False
+
+
+class ReportJobResponse(BaseModel):
+    id: int
+    report: ReportKey
+    format: ReportFormat
+    status: ReportJobStatus
+    reused: bool = False
+    file_name: str | None = None
+    size_bytes: int | None = None
+    error: str | None = None
+    created_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
@@ -1,210 +1,318 @@
 from __future__ import annotations
 
-import csv
-from datetime import UTC, date, datetime, timedelta
-from io import StringIO
+from calendar import monthrange
+from collections.abc import Iterable, Iterator
+from datetime import UTC, date, datetime
 from typing import Any
 
-from sqlalchemy import func, or_, select
-from sqlalchemy.orm import Session, selectinload
-
-from app.modules.customers.models import BrazilDriverLicense, Customer, CustomerAddress, NJDriverLicense, Passport
-
+from sqlalchemy import (
+    ColumnElement,
+    Exists,
+    Row,
+    ScalarSelect,
+    Select,
+    String,
+    Subquery,
+    Text,
+    and_,
+    cast,
+    exists,
+    func,
+    literal,
+    literal_column,
+    or_,
+    select,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.orm import Session, aliased
+
+from app.modules.customers.models import (
+    AddressType,
+    BrazilDriverLicense,
+    Customer,
+    CustomerAddress,
+    NJDriverLicense,
+    NJDriverLicenseEndorsement,
+    NJDriverLicenseRestriction,
+    Passport,
+)
+from app.modules.reports.formats import Report
+
+REPORT_YIELD_PER = 500
+
+ALL_CUSTOMERS_HEADER = [
+    "Customer ID",
+    "First name",
+    "Middle name",
+    "Last name",
+    "Suffix",
+    "Phone",
+    "Email",
+    "Date of birth",
+    "Has no SSN",
+    "SSN/ITIN",
+    "Gender",
+    "Eye color (CLR)",
+    "Weight (lbs)",
+    "Height (feet)",
+    "Height (inches)",
+    "Created at",
+    "Updated at",
+    "Mailing street",
+    "Mailing apt",
+    "Mailing city",
+    "Mailing state",
+    "Mailing zip code",
+    "Mailing county",
+    "Residential street",
+    "Residential apt",
+    "Residential city",
+    "Residential state",
+    "Residential zip code",
+    "Residential county",
+    "Out-of-state street",
+    "Out-of-state apt",
+    "Out-of-state city",
+    "Out-of-state state",
+    "Out-of-state zip code",
+    "Out-of-state county",
+    "NJ licenses total",
+    "NJ current license number",
+    "NJ current issue date",
+    "NJ current expiration date",
+    "NJ current class",
+    "NJ current endorsements",
+    "NJ current restrictions",
+    "Brazil licenses total",
+    "Brazil current full name",
+    "Brazil current CPF",
+    "Brazil current category",
+    "Brazil current registry number",
+    "Brazil current issue date",
+    "Brazil current expiration date",
+    "Passports total",
+    "Passport current number",
+    "Passport current document type",
+    "Passport current issuing country",
+    "Passport current nationality",
+    "Passport current issue date",
+    "Passport current expiration date",
+]
+
+
+def build_all_customers_csv(db: Session) -> Report:
+    nj = _primary_document_subquery(
+        NJDriverLicense,
+        NJDriverLicense.id,
+        NJDriverLicense.license_number_encrypted,
+        NJDriverLicense.issue_date,
+        NJDriverLicense.expiration_date,
+        NJDriverLicense.license_class,
+    )
+    br = _primary_document_subquery(
+        BrazilDriverLicense,
+        BrazilDriverLicense.full_name,
+        BrazilDriverLicense.cpf_encrypted,
+        BrazilDriverLicense.category,
+        BrazilDriverLicense.registry_number,
+        BrazilDriverLicense.issue_date,
+        BrazilDriverLicense.expiration_date,
+    )
+    passport = _primary_document_subquery(
+        Passport,
+        Passport.passport_number_encrypted,
+        Passport.document_type,
+        Passport.issuing_country,
+        Passport.nationality,
+        Passport.issue_date,
+        Passport.expiration_date,
+    )
+    mailing = aliased(CustomerAddress, name="mailing_address")
+    residential = aliased(CustomerAddress, name="residential_address")
+    out_of_state = aliased(CustomerAddress, name="out_of_state_address")
 
-def build_all_customers_csv(db: Session) -> tuple[str, str]:
     stmt = (
-        select(Customer)
-        .where(Customer.active.is_(True))
-        .options(
-            selectinload(Customer.addresses),
-            selectinload(Customer.nj_driver_licenses).selectinload(NJDriverLicense.endorsements),
-            selectinload(Customer.nj_driver_licenses).selectinload(NJDriverLicense.restrictions),
-            selectinload(Customer.brazil_driver_licenses),
-            selectinload(Customer.passports),
+        select(
+            Customer.id,
+            Customer.first_name,
+            Customer.middle_name,
+            Customer.last_name,
+            Customer.suffix,
+            Customer.phone_number,
+            Customer.email,
+            Customer.date_of_birth,
+            Customer.has_no_ssn,
+            Customer.ssn_encrypted,
+            Customer.gender,
+            Customer.eye_color,
+            Customer.weight_lbs,
+            Customer.height_feet,
+            Customer.height_inches,
+            Customer.created_at,
+            Customer.updated_at,
+            *_address_columns(mailing),
+            *_address_columns(residential),
+            *_address_columns(out_of_state),
+            func.coalesce(nj.c.active_total, 0),
+            nj.c.license_number_encrypted,
+            nj.c.issue_date,
+            nj.c.expiration_date,
+            nj.c.license_class,
+            _nj_codes_subquery(NJDriverLicenseEndorsement, nj.c.id),
+            _nj_codes_subquery(NJDriverLicenseRestriction, nj.c.id),
+            func.coalesce(br.c.active_total, 0),
+            br.c.full_name,
+            br.c.cpf_encrypted,
+            br.c.category,
+            br.c.registry_number,
+            br.c.issue_date,
+            br.c.expiration_date,
+            func.coalesce(passport.c.active_total, 0),
+            passport.c.passport_number_encrypted,
+            passport.c.document_type,
+            passport.c.issuing_country,
+            passport.c.nationality,
+            passport.c.issue_date,
+            passport.c.expiration_date,
         )
+        .outerjoin(mailing, _address_join(mailing, AddressType.MAILING))
+        .outerjoin(residential, _address_join(residential, AddressType.RESIDENTIAL))
+        .outerjoin(out_of_state, _address_join(out_of_state, AddressType.OUT_OF_STATE))
+        .outerjoin(nj, and_(nj.c.customer_id == Customer.id, nj.c.rank == 1))
+        .outerjoin(br, and_(br.c.customer_id == Customer.id, br.c.rank == 1))
+        .outerjoin(passport, and_(passport.c.customer_id == Customer.id, passport.c.rank == 1))
+        .where(Customer.active.is_(True))
         .order_by(Customer.created_at.desc())
     )
-    customers = list(db.scalars(stmt).all())
-
-    buffer = StringIO()
-    writer = csv.writer(buffer)
-    writer.writerow(
-        [
-            "Customer ID",
-            "First name",
-            "Middle name",
-            "Last name",
-            "Suffix",
-            "Phone",
-            "Email",
-            "Date of birth",
-            "Has no SSN",
-            "SSN/ITIN",
-            "Gender",
-            "Eye color (CLR)",
-            "Weight (lbs)",
-            "Height (feet)",
-            "Height (inches)",
-            "Created at",
-            "Updated at",
-            "Mailing street",
-            "Mailing apt",
-            "Mailing city",
-            "Mailing state",
-            "Mailing zip code",
-            "Mailing county",
-            "Residential street",
-            "Residential apt",
-            "Residential city",
-            "Residential state",
-            "Residential zip code",
-            "Residential county",
-            "Out-of-state street",
-            "Out-of-state apt",
-            "Out-of-state city",
-            "Out-of-state state",
-            "Out-of-state zip code",
-            "Out-of-state county",
-            "NJ licenses total",
-            "NJ current license number",
-            "NJ current issue date",
-            "NJ current expiration date",
-            "NJ current class",
-            "NJ current endorsements",
-            "NJ current restrictions",
-            "Brazil licenses total",
-            "Brazil current full name",
-            "Brazil current CPF",
-            "Brazil current category",
-            "Brazil current registry number",
-            "Brazil current issue date",
-            "Brazil current expiration date",
-            "Passports total",
-            "Passport current number",
-            "Passport current document type",
-            "Passport current issuing country",
-            "Passport current nationality",
-            "Passport current issue date",
-            "Passport current expiration date",
-        ]
+    return _report(
+        header=ALL_CUSTOMERS_HEADER,
+        rows=_all_customers_rows(db, stmt),
+        filename_prefix="customers_full_export",
     )
 
-    for customer in customers:
-        addresses = {address.address_type.value: address for address in customer.addresses if address.active}
-        mailing = addresses.get("mailing")
-        residential = addresses.get("residential")
-        out_of_state = addresses.get("out_of_state")
-
-        nj_primary = _primary_document(customer.nj_driver_licenses)
-        br_primary = _primary_document(customer.brazil_driver_licenses)
-        passport_primary = _primary_document(customer.passports)
-
-        writer.writerow(
-            [
-                customer.id,
-                customer.first_name,
-                customer.middle_name,
-                customer.last_name,
-                customer.suffix,
-                customer.phone_number,
-                customer.email,
-                _format_date(customer.date_of_birth),
-                _format_bool(customer.has_no_ssn),
-                customer.ssn_encrypted,
-                customer.gender.value.upper() if customer.gender else "",
-                customer.eye_color,
-                customer.weight_lbs,
-                customer.height_feet,
-                customer.height_inches,
-                _format_datetime(customer.created_at),
-                _format_datetime(customer.updated_at),
-                _address_value(mailing, "street"),
-                _address_value(mailing, "apt"),
-                _address_value(mailing, "city"),
-                _address_value(mailing, "state"),
-                _address_value(mailing, "zip_code"),
-                _address_value(mailing, "county"),
-                _address_value(residential, "street"),
-                _address_value(residential, "apt"),
-                _address_value(residential, "city"),
-                _address_value(residential, "state"),
-                _address_value(residential, "zip_code"),
-                _address_value(residential, "county"),
-                _address_value(out_of_state, "street"),
-                _address_value(out_of_state, "apt"),
-                _address_value(out_of_state, "city"),
-                _address_value(out_of_state, "state"),
-                _address_value(out_of_state, "zip_code"),
-                _address_value(out_of_state, "county"),
-                len([item for item in customer.nj_driver_licenses if item.active]),
-                nj_primary.license_number_encrypted if nj_primary else "",
-                _format_date(nj_primary.issue_date if nj_primary else None),
-                _format_date(nj_primary.expiration_date if nj_primary else None),
-                nj_primary.license_class.value if nj_primary and nj_primary.license_class else "",
-                ", ".join(item.code.value for item in nj_primary.endorsements) if nj_primary else "",
-                ", ".join(item.code.value for item in nj_primary.restrictions) if nj_primary else "",
-                len([item for item in customer.brazil_driver_licenses if item.active]),
-                br_primary.full_name if br_primary else "",
-                br_primary.cpf_encrypted if br_primary else "",
-                br_primary.category if br_primary else "",
-                br_primary.registry_number if br_primary else "",
-                _format_date(br_primary.issue_date if br_primary else None),
-                _format_date(br_primary.expiration_date if br_primary else None),
-                len([item for item in customer.passports if item.active]),
-                passport_primary.passport_number_encrypted if passport_primary else "",
-                passport_primary.document_type if passport_primary else "",
-                passport_primary.issuing_country if passport_primary else "",
-                passport_primary.nationality if passport_primary else "",
-                _format_date(passport_primary.issue_date if passport_primary else None),
-                _format_date(passport_primary.expiration_date if passport_primary else None),
-            ]
-        )
 
-    content = buffer.getvalue()
-    filename = f"customers_full_export_{datetime.now(UTC).strftime('%Y%m%d_%H%M%S')}.csv"
-    return content, filename
+def _all_customers_rows(db: Session, stmt: Select) -> Iterator[list[Any]]:
+    for row in db.execute(stmt.execution_options(yield_per=REPORT_YIELD_PER)).tuples():
+        (
+            customer_id,
+            first_name,
+            middle_name,
+            last_name,
+            suffix,
+            phone_number,
+            email,
+            date_of_birth,
+            has_no_ssn,
+            ssn_encrypted,
+            gender,
+            eye_color,
+            weight_lbs,
+            height_feet,
+            height_inches,
+            created_at,
+            updated_at,
+        ) = row[:17]
+        addresses = row[17:35]
+        (
+            nj_total,
+            nj_number,
+            nj_issue_date,
+            nj_expiration_date,
+            nj_class,
+            nj_endorsements,
+            nj_restrictions,
+            br_total,
+            br_full_name,
+            br_cpf,
+            br_category,
+            br_registry_number,
+            br_issue_date,
+            br_expiration_date,
+            passport_total,
+            passport_number,
+            passport_document_type,
+            passport_issuing_country,
+            passport_nationality,
+            passport_issue_date,
+            passport_expiration_date,
+        ) = row[35:]
+        yield [
+            customer_id,
+            first_name,
+            middle_name,
+            last_name,
+            suffix,
+            phone_number,
+            email,
+            _format_date(date_of_birth),
+            _format_bool(has_no_ssn),
+            ssn_encrypted,
+            gender.value.upper() if gender else "",
+            eye_color,
+            weight_lbs,
+            height_feet,
+            height_inches,
+            _format_datetime(created_at),
+            _format_datetime(updated_at),
+            *(str(value or "") for value in addresses),
+            nj_total,
+            nj_number or "",
+            _format_date(nj_issue_date),
+            _format_date(nj_expiration_date),
+            nj_class.value if nj_class else "",
+            nj_endorsements or "",
+            nj_restrictions or "",
+            br_total,
+            br_full_name or "",
+            br_cpf or "",
+            br_category or "",
+            br_registry_number or "",
+            _format_date(br_issue_date),
+            _format_date(br_expiration_date),
+            passport_total,
+            passport_number or "",
+            passport_document_type or "",
+            passport_issuing_country or "",
+            passport_nationality or "",
+            _format_date(passport_issue_date),
+            _format_date(passport_expiration_date),
+        ]
 
 
-def build_expiring_licenses_csv(db: Session, months_ahead: int = 3) -> tuple[str, str]:
+def build_expiring_licenses_csv(db: Session, months_ahead: int = 3) -> Report:
     months_ahead = max(1, months_ahead)
     today = datetime.now(UTC).date()
     horizon = _add_months(today, months_ahead)
 
-    nj_stmt = (
-        select(Customer, NJDriverLicense)
-        .join(NJDriverLicense, NJDriverLicense.customer_id == Customer.id)
-        .where(
-            Customer.active.is_(True),
-            NJDriverLicense.active.is_(True),
-            NJDriverLicense.is_current.is_(True),
-            NJDriverLicense.expiration_date.is_not(None),
-            NJDriverLicense.expiration_date >= today,
-            NJDriverLicense.expiration_date <= horizon,
+    documents = _expiring_documents_subquery(start=today, end=horizon)
+    stmt = (
+        select(
+            Customer.id,
+            Customer.first_name,
+            Customer.last_name,
+            Customer.email,
+            Customer.phone_number,
+            Customer.created_at,
+            documents.c.document_label,
+            documents.c.document_id,
+            documents.c.identifier,
+            documents.c.issue_date,
+            documents.c.expiration_date,
         )
-        .order_by(NJDriverLicense.expiration_date.asc(), Customer.last_name.asc(), Customer.first_name.asc())
-    )
-
-    br_stmt = (
-        select(Customer, BrazilDriverLicense)
-        .join(BrazilDriverLicense, BrazilDriverLicense.customer_id == Customer.id)
-        .where(
-            Customer.active.is_(True),
-            BrazilDriverLicense.active.is_(True),
-            BrazilDriverLicense.is_current.is_(True),
-            BrazilDriverLicense.expiration_date.is_not(None),
-            BrazilDriverLicense.expiration_date >= today,
-            BrazilDriverLicense.expiration_date <= horizon,
+        .join(Customer, Customer.id == documents.c.customer_id)
+        .where(Customer.active.is_(True))
+        .order_by(
+            documents.c.expiration_date.asc(),
+            Customer.last_name.asc(),
+            Customer.first_name.asc(),
+            documents.c.document_rank.asc(),
+            documents.c.document_id.asc(),
         )
-        .order_by(BrazilDriverLicense.expiration_date.asc(), Customer.last_name.asc(), Customer.first_name.asc())
     )
 
-    nj_rows = db.execute(nj_stmt).all()
-    br_rows = db.execute(br_stmt).all()
-
-    buffer = StringIO()
-    writer = csv.writer(buffer)
-    writer.writerow(
-        [
+    return _report(
+        header=[
             "Customer ID",
             "Customer name",
             "Email",
@@ -216,71 +324,61 @@ def build_expiring_licenses_csv(db: Session, months_ahead: int = 3) -> tuple[str
             "Expiration date",
             "Days until expiration",
             "Customer created at",
-        ]
+        ],
+        rows=_expiring_license_rows(db, stmt, today=today),
+        filename_prefix=f"licenses_expiring_{months_ahead}m",
     )
 
-    for customer, license_obj in nj_rows:
-        expiration_date = license_obj.expiration_date
-        writer.writerow(
-            [
-                customer.id,
-                f"{customer.first_name} {customer.last_name}".strip(),
-                customer.email,
-                customer.phone_number,
-                "NJ Driver License",
-                license_obj.id,
-                license_obj.license_number_encrypted,
-                _format_date(license_obj.issue_date),
-                _format_date(expiration_date),
-                (expiration_date - today).days if expiration_date else None,
-                _format_datetime(customer.created_at),
-            ]
-        )
 
-    for customer, license_obj in br_rows:
-        expiration_date = license_obj.expiration_date
-        writer.writerow(
-            [
-                customer.id,
-                f"{customer.first_name} {customer.last_name}".strip(),
-                customer.email,
-                customer.phone_number,
-                "Brazil Driver License",
-                license_obj.id,
-                license_obj.registry_number,
-                _format_date(license_obj.issue_date),
-                _format_date(expiration_date),
-                (expiration_date - today).days if expiration_date else None,
-                _format_datetime(customer.created_at),
-            ]
-        )
+def _expiring_license_rows(db: Session, stmt: Select, *, today: date) -> Iterator[list[Any]]:
+    for row in db.execute(stmt.execution_options(yield_per=REPORT_YIELD_PER)):
+        yield [
+            row.id,
+            f"{row.first_name} {row.last_name}".strip(),
+            row.email,
+            row.phone_number,
+            row.document_label,
+            row.document_id,
+            row.identifier,
+            _format_date(row.issue_date),
+            _format_date(row.expiration_date),
+            (row.expiration_date - today).days,
+            _format_datetime(row.created_at),
+        ]
+
 
-    content = buffer.getvalue()
-    filename = f"licenses_expiring_{months_ahead}m_{datetime.now(UTC).strftime('%Y%m%d_%H%M%S')}.csv"
-    return content, filename
-
-
-def build_customers_without_active_driver_license_csv(db: Session) -> tuple[str, str]:
-    customers = list(_select_active_customers(db))
-    rows = []
-    for customer in customers:
-        active_nj = [item for item in customer.nj_driver_licenses if item.active]
-        active_br = [item for item in customer.brazil_driver_licenses if item.active]
-        if active_nj or active_br:
-            continue
-        rows.append(
-            [
-                customer.id,
-                f"{customer.first_name} {customer.last_name}".strip(),
-                customer.email or "",
-                customer.phone_number or "",
-                0,
-                0,
-                _format_datetime(customer.created_at),
-                _format_datetime(customer.updated_at),
-            ]
+def _expiring_documents_subquery(*, start: date, end: date) -> Subquery:
+    # One UNION ALL arm per document model; each arm is served by its current-expiration partial index and
+    # the merged set is ordered once in SQL. document_rank keeps the previous NJ/Brazil/passport order on ties.
+    selects = [
+        select(
+            cast(literal(label), String(40)).label("document_label"),
+            literal(rank).label("document_rank"),
+            model.id.label("document_id"),
+            model.customer_id.label("customer_id"),
+            identifier.label("identifier"),
+            model.issue_date.label("issue_date"),
+            model.expiration_date.label("expiration_date"),
+        ).where(
+            model.active.is_(True),
+            model.is_current.is_(True),
+            model.expiration_date.is_not(None),
+            model.expiration_date >= start,
+            model.expiration_date <= end,
+        )
+        for rank, (label, model, identifier) in enumerate(
+            (
+                ("NJ Driver License", NJDriverLicense, NJDriverLicense.license_number_encrypted),
+                ("Brazil Driver License", BrazilDriverLicense, BrazilDriverLicense.registry_number),
+                ("Passport", Passport, Passport.passport_number_encrypted),
+            )
         )
-    return _csv_report(
+    ]
+    return union_all(*selects).subquery("expiring_documents")
+
+
+def build_customers_without_active_driver_license_csv(db: Session) -> Report:
+    return _report(
         header=[
             "Customer ID",
             "Customer name",
@@ -291,12 +389,27 @@ def build_customers_without_active_driver_license_csv(db: Session) -> tuple[str,
             "Created at",
             "Updated at",
         ],
-        rows=rows,
+        rows=_customers_without_active_driver_license_rows(db),
         filename_prefix="customers_without_active_driver_license",
     )
 
 
-def build_passports_expiring_this_year_csv(db: Session) -> tuple[str, str]:
+def _customers_without_active_driver_license_rows(db: Session) -> Iterator[list[Any]]:
+    # Both license counts are zero by definition, so only the matching customers' own columns are read.
+    stmt = (
+        select(*_CUSTOMER_LICENSE_COLUMNS)
+        .where(
+            Customer.active.is_(True),
+            ~_has_license(NJDriverLicense),
+            ~_has_license(BrazilDriverLicense),
+        )
+        .order_by(Customer.last_name.asc(), Customer.first_name.asc())
+    )
+    for row in db.execute(stmt.execution_options(yield_per=REPORT_YIELD_PER)):
+        yield _customer_license_row(row, active_nj=0, active_br=0)
+
+
+def build_passports_expiring_this_year_csv(db: Session) -> Report:
     today = datetime.now(UTC).date()
     start = date(today.year, 1, 1)
     end = date(today.year, 12, 31)
@@ -312,27 +425,7 @@ def build_passports_expiring_this_year_csv(db: Session) -> tuple[str, str]:
         )
         .order_by(Passport.expiration_date.asc(), Customer.last_name.asc(), Customer.first_name.asc())
     )
-    rows = []
-    for customer, passport in db.execute(stmt).all():
-        expiration_date = passport.expiration_date
-        rows.append(
-            [
-                customer.id,
-                f"{customer.first_name} {customer.last_name}".strip(),
-                customer.email or "",
-                customer.phone_number or "",
-                passport.id,
-                _format_bool(passport.is_current),
-                passport.passport_number_encrypted or "",
-                passport.document_type or "",
-                passport.issuing_country or "",
-                passport.nationality or "",
-                _format_date(passport.issue_date),
-                _format_date(expiration_date),
-                (expiration_date - today).days if expiration_date else "",
-            ]
-        )
-    return _csv_report(
+    return _report(
         header=[
             "Customer ID",
             "Customer name",
@@ -348,12 +441,32 @@ def build_passports_expiring_this_year_csv(db: Session) -> tuple[str, str]:
             "Expiration date",
             "Days until expiration",
         ],
-        rows=rows,
+        rows=_passports_expiring_rows(db, stmt, today=today),
         filename_prefix=f"passports_expiring_{today.year}",
     )
 
 
-def build_customers_without_photo_csv(db: Session) -> tuple[str, str]:
+def _passports_expiring_rows(db: Session, stmt: Select, *, today: date) -> Iterator[list[Any]]:
+    for customer, passport in db.execute(stmt.execution_options(yield_per=REPORT_YIELD_PER)):
+        expiration_date = passport.expiration_date
+        yield [
+            customer.id,
+            f"{customer.first_name} {customer.last_name}".strip(),
+            customer.email or "",
+            customer.phone_number or "",
+            passport.id,
+            _format_bool(passport.is_current),
+            passport.passport_number_encrypted or "",
+            passport.document_type or "",
+            passport.issuing_country or "",
+            passport.nationality or "",
+            _format_date(passport.issue_date),
+            _format_date(expiration_date),
+            (expiration_date - today).days if expiration_date else "",
+        ]
+
+
+def build_customers_without_photo_csv(db: Session) -> Report:
     stmt = (
         select(Customer)
         .where(
@@ -365,15 +478,14 @@ def build_customers_without_photo_csv(db: Session) -> tuple[str, str]:
         )
         .order_by(Customer.last_name.asc(), Customer.first_name.asc())
     )
-    rows = [_customer_basic_row(customer) for customer in db.scalars(stmt).all()]
-    return _csv_report(
+    return _report(
         header=_customer_basic_header(),
-        rows=rows,
+        rows=map(_customer_basic_row, db.scalars(stmt.execution_options(yield_per=REPORT_YIELD_PER))),
         filename_prefix="customers_without_photo",
     )
 
 
-def build_customers_without_phone_csv(db: Session) -> tuple[str, str]:
+def build_customers_without_phone_csv(db: Session) -> Report:
     stmt = (
         select(Customer)
         .where(
@@ -385,36 +497,15 @@ def build_customers_without_phone_csv(db: Session) -> tuple[str, str]:
         )
         .order_by(Customer.last_name.asc(), Customer.first_name.asc())
     )
-    rows = [_customer_basic_row(customer) for customer in db.scalars(stmt).all()]
-    return _csv_report(
+    return _report(
         header=_customer_basic_header(),
-        rows=rows,
+        rows=map(_customer_basic_row, db.scalars(stmt.execution_options(yield_per=REPORT_YIELD_PER))),
         filename_prefix="customers_without_phone",
     )
 
 
-def build_customers_without_current_driver_license_csv(db: Session) -> tuple[str, str]:
-    customers = list(_select_active_customers(db))
-    rows = []
-    for customer in customers:
-        active_nj = [item for item in customer.nj_driver_licenses if item.active]
-        active_br = [item for item in customer.brazil_driver_licenses if item.active]
-        has_current = any(item.is_current for item in active_nj) or any(item.is_current for item in active_br)
-        if has_current:
-            continue
-        rows.append(
-            [
-                customer.id,
-                f"{customer.first_name} {customer.last_name}".strip(),
-                customer.email or "",
-                customer.phone_number or "",
-                len(active_nj),
-                len(active_br),
-                _format_datetime(customer.created_at),
-                _format_datetime(customer.updated_at),
-            ]
-        )
-    return _csv_report(
+def build_customers_without_current_driver_license_csv(db: Session) -> Report:
+    return _report(
         header=[
             "Customer ID",
             "Customer name",
@@ -425,12 +516,28 @@ def build_customers_without_current_driver_license_csv(db: Session) -> tuple[str
             "Created at",
             "Updated at",
         ],
-        rows=rows,
+        rows=_customers_without_current_driver_license_rows(db),
         filename_prefix="customers_without_current_driver_license",
     )
 
 
-def build_customers_returned_home_country_csv(db: Session) -> tuple[str, str]:
+def _customers_without_current_driver_license_rows(db: Session) -> Iterator[list[Any]]:
+    active_nj = _count_licenses(NJDriverLicense)
+    active_br = _count_licenses(BrazilDriverLicense)
+    stmt = (
+        select(*_CUSTOMER_LICENSE_COLUMNS, active_nj.label("active_nj"), active_br.label("active_br"))
+        .where(
+            Customer.active.is_(True),
+            ~_has_license(NJDriverLicense, current_only=True),
+            ~_has_license(BrazilDriverLicense, current_only=True),
+        )
+        .order_by(Customer.last_name.asc(), Customer.first_name.asc())
+    )
+    for row in db.execute(stmt.execution_options(yield_per=REPORT_YIELD_PER)):
+        yield _customer_license_row(row, active_nj=row.active_nj, active_br=row.active_br)
+
+
+def build_customers_returned_home_country_csv(db: Session) -> Report:
     stmt = (
         select(Customer)
         .where(
@@ -439,7 +546,7 @@ def build_customers_returned_home_country_csv(db: Session) -> tuple[str, str]:
         )
         .order_by(Customer.last_name.asc(), Customer.first_name.asc())
     )
-    rows = [
+    rows = (
         [
             customer.id,
             f"{customer.first_name} {customer.last_name}".strip(),
@@ -449,9 +556,9 @@ def build_customers_returned_home_country_csv(db: Session) -> tuple[str, str]:
             _format_datetime(customer.created_at),
             _format_datetime(customer.updated_at),
         ]
-        for customer in db.scalars(stmt).all()
-    ]
-    return _csv_report(
+        for customer in db.scalars(stmt.execution_options(yield_per=REPORT_YIELD_PER))
+    )
+    return _report(
         header=[
             "Customer ID",
             "Customer name",
@@ -467,20 +574,51 @@ def build_customers_returned_home_country_csv(db: Session) -> tuple[str, str]:
 
 
 def _add_months(initial_date: date, months: int) -> date:
-    return initial_date + timedelta(days=31 * months)
+    # Same day of month, clamped to the last day of shorter months (Jan 31 + 1 month -> Feb 28/29).
+    month_index = initial_date.month - 1 + months
+    year = initial_date.year + month_index // 12
+    month = month_index % 12 + 1
+    return date(year, month, min(initial_date.day, monthrange(year, month)[1]))
+
+
+_CUSTOMER_LICENSE_COLUMNS = (
+    Customer.id,
+    Customer.first_name,
+    Customer.last_name,
+    Customer.email,
+    Customer.phone_number,
+    Customer.created_at,
+    Customer.updated_at,
+)
+
+
+def _has_license(model: type, *, current_only: bool = False) -> Exists:
+    conditions = [model.customer_id == Customer.id, model.active.is_(True)]
+    if current_only:
+        conditions.append(model.is_current.is_(True))
+    return exists().where(*conditions)
+
+
+def _count_licenses(model: type) -> ScalarSelect:
+    # Correlated per output row, so it only runs for customers that already passed the NOT EXISTS filters.
+    return (
+        select(func.count(model.id))
+        .where(model.customer_id == Customer.id, model.active.is_(True))
+        .scalar_subquery()
+    )
 
 
-def _select_active_customers(db: Session) -> list[Customer]:
-    stmt = (
-        select(Customer)
-        .where(Customer.active.is_(True))
-        .options(
-            selectinload(Customer.nj_driver_licenses),
-            selectinload(Customer.brazil_driver_licenses),
-        )
-        .order_by(Customer.last_name.asc(), Customer.first_name.asc())
-    )
-    return list(db.scalars(stmt).all())
+def _customer_license_row(row: Row, *, active_nj: int, active_br: int) -> list[Any]:
+    return [
+        row.id,
+        f"{row.first_name} {row.last_name}".strip(),
+        row.email or "",
+        row.phone_number or "",
+        active_nj,
+        active_br,
+        _format_datetime(row.created_at),
+        _format_datetime(row.updated_at),
+    ]
 
 
 def _customer_basic_header() -> list[str]:
@@ -509,14 +647,12 @@ def _customer_basic_row(customer: Customer) -> list[Any]:
     ]
 
 
-def _csv_report(header: list[str], rows: list[list[Any]], filename_prefix: str) -> tuple[str, str]:
-    buffer = StringIO()
-    writer = csv.writer(buffer)
-    writer.writerow(header)
-    writer.writerows(rows)
-    content = buffer.getvalue()
-    filename = f"{filename_prefix}_{datetime.now(UTC).strftime('%Y%m%d_%H%M%S')}.csv"
-    return content, filename
+def _report(header: list[str], rows: Iterable[list[Any]], filename_prefix: str) -> Report:
+    return Report(
+        header=header,
+        rows=rows,
+        filename=f"{filename_prefix}_{datetime.now(UTC).strftime('%Y%m%d_%H%M%S')}",
+    )
 
 
 def _format_date(value: date | None) -> str:
@@ -535,19 +671,41 @@ def _format_bool(value: bool) -> str:
     return "Yes" if value else "No"
 
 
-def _address_value(address: CustomerAddress | None, field: str) -> str:
-    if not address:
-        return ""
-    return str(getattr(address, field) or "")
-
-
-def _primary_document(items: list[Any]):
-    active_items = [item for item in items if item.active]
-    if not active_items:
-        return None
-    current = [item for item in active_items if getattr(item, "is_current", False)]
-    if current:
-        current.sort(key=lambda item: (item.updated_at or datetime.min.replace(tzinfo=UTC), item.id), reverse=True)
-        return current[0]
-    active_items.sort(key=lambda item: (item.updated_at or datetime.min.replace(tzinfo=UTC), item.id), reverse=True)
-    return active_items[0]
+def _primary_document_subquery(model: type, *columns: Any) -> Subquery:
+    # Ranks each customer's active documents (current first, then most recently updated) so rank 1 is the
+    # primary document; active_total is the per-customer count the export reports alongside it.
+    return (
+        select(
+            model.customer_id.label("customer_id"),
+            *columns,
+            func.count().over(partition_by=model.customer_id).label("active_total"),
+            func.row_number()
+            .over(
+                partition_by=model.customer_id,
+                order_by=(model.is_current.desc(), model.updated_at.desc(), model.id.desc()),
+            )
+            .label("rank"),
+        )
+        .where(model.active.is_(True))
+        .subquery(f"primary_{model.__tablename__}")
+    )
+
+
+def _nj_codes_subquery(model: type, nj_driver_license_id: Any) -> ScalarSelect:
+    return (
+        select(func.string_agg(model.code, aggregate_order_by(literal_column("', '"), model.id), type_=Text))
+        .where(model.nj_driver_license_id == nj_driver_license_id)
+        .scalar_subquery()
+    )
+
+
+def _address_join(address: Any, address_type: AddressType) -> ColumnElement[bool]:
+    return and_(
+        address.customer_id == Customer.id,
+        address.address_type == address_type,
+        address.active.is_(True),
+    )
+
+
+def _address_columns(address: Any) -> list[Any]:
+    return [address.street, address.apt, address.city, address.state, address.zip_code, address.county]
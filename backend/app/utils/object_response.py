@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from fastapi import HTTPException, Response, status
+from fastapi.responses import RedirectResponse, StreamingResponse
+from starlette.background import BackgroundTask
+
+from app.core.config import settings
+from app.deps.minio.minio_objects import (
+    ObjectNotModifiedError,
+    ObjectRangeNotSatisfiableError,
+    PresignedObject,
+    StoredObject,
+)
+
+# Routes addressed by a record id (photo, record file) can point at a new object after a replace,
+# so browsers must revalidate; the ETag turns that into a cheap 304.
+REVALIDATE_CACHE_CONTROL = "private, no-cache"
+
+
+def immutable_cache_control() -> str:
+    # For routes addressed by object key: keys embed a timestamp and random suffix and are never rewritten.
+    return f"private, max-age={settings.STORED_OBJECT_CACHE_MAX_AGE_SECONDS}, immutable"
+
+
+def stored_object_response(
+    stored: StoredObject | PresignedObject,
+    *,
+    cache_control: str = REVALIDATE_CACHE_CONTROL,
+) -> Response:
+    if isinstance(stored, PresignedObject):
+        # The redirect itself must not be cached: the signed URL expires long before the object does.
+        return RedirectResponse(
+            url=stored.url,
+            status_code=status.HTTP_307_TEMPORARY_REDIRECT,
+            headers={"Cache-Control": "no-store"},
+        )
+
+    headers = {
+        "Content-Disposition": f'{stored.disposition}; filename="{stored.file_name}"',
+        "Cache-Control": cache_control,
+        "Accept-Ranges": "bytes",
+    }
+    if stored.content_length is not None:
+        headers["Content-Length"] = str(stored.content_length)
+    if stored.content_range is not None:
+        headers["Content-Range"] = stored.content_range
+    if stored.etag is not None:
+        headers["ETag"] = stored.etag
+    if stored.last_modified is not None:
+        headers["Last-Modified"] = stored.last_modified
+    # The background close covers clients that disconnect before the body is fully consumed.
+    return StreamingResponse(
+        stored.iter_chunks(),
+        status_code=status.HTTP_206_PARTIAL_CONTENT if stored.is_partial else status.HTTP_200_OK,
+        media_type=stored.content_type,
+        headers=headers,
+        background=BackgroundTask(stored.close),
+    )
+
+
+def not_modified_response(exc: ObjectNotModifiedError, *, cache_control: str = REVALIDATE_CACHE_CONTROL) -> Response:
+    headers = {"Cache-Control": cache_control}
+    if exc.etag is not None:
+        headers["ETag"] = exc.etag
+    if exc.last_modified is not None:
+        headers["Last-Modified"] = exc.last_modified
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+
+def range_not_satisfiable_error(exc: ObjectRangeNotSatisfiableError) -> HTTPException:
+    headers = {"Content-Range": f"bytes */{exc.object_size}"} if exc.object_size is not None else None
+    return HTTPException(
+        status_code=status.HTTP_416_RANGE_NOT_SATISFIABLE,
+        detail=str(exc),
+        headers=headers,
+    )
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import BinaryIO
+
+from fastapi import UploadFile
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+class UploadTooLargeError(ValueError):
+    pass
+
+
+@dataclass
+class SpooledUpload:
+    stream: BinaryIO
+    size: int
+    file_name: str | None
+    content_type: str | None
+
+
+async def spool_upload(file: UploadFile, *, max_bytes: int) -> SpooledUpload:
+    # Starlette already spools multipart files to a temp file; this only measures it (in chunks when the
+    # size is unknown) and rewinds it, so callers can stream it to MinIO without loading it into memory.
+    size = file.size
+    if size is None:
+        size = 0
+        await file.seek(0)
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            size += len(chunk)
+            if size > max_bytes:
+                break
+    if size > max_bytes:
+        raise UploadTooLargeError(_too_large_message(max_bytes))
+    await file.seek(0)
+    return SpooledUpload(stream=file.file, size=size, file_name=file.filename, content_type=file.content_type)
+
+
+async def read_upload_limited(file: UploadFile, *, max_bytes: int) -> bytes:
+    # For consumers that genuinely need the bytes (e.g. OCR providers): stop reading past the limit.
+    if file.size is not None and file.size > max_bytes:
+        raise UploadTooLargeError(_too_large_message(max_bytes))
+    buffer = bytearray()
+    await file.seek(0)
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        buffer.extend(chunk)
+        if len(buffer) > max_bytes:
+            raise UploadTooLargeError(_too_large_message(max_bytes))
+    return bytes(buffer)
+
+
+def _too_large_message(max_bytes: int) -> str:
+    return f"File is too large. Maximum allowed is {max_bytes // (1024 * 1024)}MB."
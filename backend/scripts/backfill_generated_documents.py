@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import sys
+
+BACKEND_ROOT = Path(__file__).resolve().parent.parent
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from sqlalchemy import select  # noqa: E402
+from sqlalchemy.dialects.postgresql import insert  # noqa: E402
+
+from app.core.database import SessionLocal  # noqa: E402
+from app.modules.customers.models import Customer  # noqa: E402
+from app.modules.documents.models import GeneratedDocument  # noqa: E402
+from app.modules.documents.storage import iter_generated_objects, parse_generated_key  # noqa: E402
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Import generated PDFs already stored in MinIO into the generated_documents catalog."
+    )
+    parser.add_argument("--batch-size", type=int, default=500, help="Rows inserted per transaction (default: 500).")
+    parser.add_argument(
+        "--customer-id",
+        type=int,
+        default=None,
+        help="Only import documents of this customer (lists just its sub-prefix).",
+    )
+    parser.add_argument("--dry-run", action="store_true", help="Only count importable objects; do not write.")
+    return parser.parse_args()
+
+
+def iter_catalog_rows(known_customer_ids: set[int], customer_id: int | None = None):
+    for obj in iter_generated_objects(customer_id=customer_id):
+        object_key = str(obj.object_name)
+        parsed_customer_id, template_key, generated_at = parse_generated_key(object_key)
+        generated_at = generated_at or obj.last_modified
+        if generated_at is None:
+            continue
+        yield {
+            "customer_id": parsed_customer_id if parsed_customer_id in known_customer_ids else None,
+            "template_key": template_key,
+            "object_key": object_key,
+            "size_bytes": obj.size,
+            "generated_at": generated_at,
+        }
+
+
+def main() -> int:
+    args = parse_args()
+    batch_size = max(1, args.batch_size)
+
+    with SessionLocal() as db:
+        known_customer_ids = set(db.scalars(select(Customer.id)).all())
+        seen = 0
+        inserted = 0
+        batch: list[dict] = []
+
+        def flush() -> int:
+            if not batch or args.dry_run:
+                return 0
+            stmt = insert(GeneratedDocument).values(batch).on_conflict_do_nothing(index_elements=["object_key"])
+            result = db.execute(stmt)
+            db.commit()
+            return result.rowcount or 0
+
+        for row in iter_catalog_rows(known_customer_ids, customer_id=args.customer_id):
+            seen += 1
+            batch.append(row)
+            if len(batch) >= batch_size:
+                inserted += flush()
+                batch.clear()
+        inserted += flush()
+
+    if args.dry_run:
+        print(f"Found {seen} generated documents (dry run, nothing written).")
+    else:
+        print(f"Found {seen} generated documents, imported {inserted} new catalog rows.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
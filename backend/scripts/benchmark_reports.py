@@ -0,0 +1,609 @@
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import asdict, dataclass
+from datetime import UTC, date, datetime, timedelta
+import gc
+import json
+import os
+from pathlib import Path
+import platform
+import random
+import resource
+import statistics
+import subprocess
+import sys
+from threading import Event, Thread
+import time
+from typing import Any
+
+BACKEND_ROOT = Path(__file__).resolve().parent.parent
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from sqlalchemy import Engine, create_engine, delete, event, func, insert, select, text  # noqa: E402
+from sqlalchemy.orm import Session, sessionmaker  # noqa: E402
+
+from app.core.config import settings  # noqa: E402
+from app.core.database import Base  # noqa: E402
+from app.modules.customers.models import (  # noqa: E402
+    AddressType,
+    BrazilDriverLicense,
+    Customer,
+    CustomerAddress,
+    NJDriverLicense,
+    NJDriverLicenseEndorsement,
+    NJDriverLicenseRestriction,
+    NJEndorsementCode,
+    NJLicenseClass,
+    NJRestrictionCode,
+    Passport,
+)
+from app.modules.customers.service import list_customers  # noqa: E402
+from app.modules.dashboard.models import ExpirationNotification  # noqa: E402
+from app.modules.dashboard.service import get_dashboard_summary, list_prioritized_pending  # noqa: E402
+from app.modules.dashboard.summary_cache import invalidate_dashboard_summary  # noqa: E402
+from app.modules.documents.models import GeneratedDocument  # noqa: E402
+from app.modules.reports import service as reports  # noqa: E402
+from app.modules.reports.formats import Report, iter_csv  # noqa: E402
+import app.modules.reports.models  # noqa: E402,F401
+
+FIRST_NAMES = ["Ana", "Bruno", "Carla", "Diego", "Elisa", "Fabio", "Gabriela", "Hugo", "Isabela", "João", "Luana"]
+LAST_NAMES = ["Silva", "Santos", "Oliveira", "Souza", "Pereira", "Costa", "Almeida", "Ferreira", "Johnson", "Smith"]
+SEED_BATCH_SIZE = 1000
+SEEDED_TABLES = (
+    ExpirationNotification,
+    GeneratedDocument,
+    NJDriverLicenseEndorsement,
+    NJDriverLicenseRestriction,
+    NJDriverLicense,
+    BrazilDriverLicense,
+    Passport,
+    CustomerAddress,
+    Customer,
+)
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    runs: int
+    wall_seconds_median: float
+    wall_seconds_min: float
+    wall_seconds_max: float
+    query_count: int
+    peak_rss_mb: float
+    rss_growth_mb: float
+    rows: int | None = None
+    output_bytes: int | None = None
+
+
+@dataclass
+class RunMetrics:
+    wall_seconds: float
+    query_count: int
+    peak_rss_bytes: int
+    start_rss_bytes: int
+    rows: int | None = None
+    output_bytes: int | None = None
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Seed a scratch PostgreSQL database with synthetic customers and record wall time, peak RSS and "
+            "query count for every report builder and dashboard/customer list service."
+        )
+    )
+    parser.add_argument(
+        "--database-url",
+        default=os.environ.get("BENCHMARK_DATABASE_URL"),
+        help="Scratch database to seed and query (default: $BENCHMARK_DATABASE_URL). Never the app database.",
+    )
+    parser.add_argument("--customers", type=int, default=10_000, help="Customers to seed (default: 10000).")
+    parser.add_argument("--nj-licenses", type=float, default=1.2, help="Average NJ licenses per customer.")
+    parser.add_argument("--brazil-licenses", type=float, default=0.5, help="Average Brazil licenses per customer.")
+    parser.add_argument("--passports", type=float, default=0.8, help="Average passports per customer.")
+    parser.add_argument(
+        "--notification-ratio",
+        type=float,
+        default=0.3,
+        help="Share of documents expiring within 90 days that get a notification row (default: 0.3).",
+    )
+    parser.add_argument("--generated-documents", type=int, default=1000, help="generated_documents rows to seed.")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for the synthetic data (default: 42).")
+    parser.add_argument("--reset", action="store_true", help="Delete existing rows in the seeded tables first.")
+    parser.add_argument("--skip-seed", action="store_true", help="Benchmark the data already in the database.")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per benchmark; the median is reported.")
+    parser.add_argument("--only", action="append", default=[], help="Run only benchmarks whose name contains this.")
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=None,
+        help="Result JSON path (default: benchmark-results/<timestamp>.json).",
+    )
+    parser.add_argument("--baseline", type=Path, default=None, help="Previous result JSON to compare against.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Relative slowdown of the median that counts as a regression (default: 0.2).",
+    )
+    parser.add_argument(
+        "--fail-on-regression",
+        action="store_true",
+        help="Exit with status 1 when the comparison finds a regression.",
+    )
+    return parser.parse_args()
+
+
+def seed_database(db: Session, args: argparse.Namespace) -> dict[str, int]:
+    rnd = random.Random(args.seed)
+    today = datetime.now(UTC).date()
+    now = datetime.now(UTC)
+    counts = {model.__tablename__: 0 for model in SEEDED_TABLES}
+
+    def days(lo: int, hi: int) -> date:
+        return today + timedelta(days=rnd.randint(lo, hi))
+
+    def how_many(average: float) -> int:
+        # Uniform on [0, 2 * average] keeps the requested mean without a long tail.
+        return rnd.randint(0, max(0, round(2 * average)))
+
+    def expiring_soon(expiration_date: date | None) -> bool:
+        return expiration_date is not None and -60 <= (expiration_date - today).days <= 90
+
+    remaining = args.customers
+    sequence = 0
+    while remaining > 0:
+        batch_size = min(SEED_BATCH_SIZE, remaining)
+        remaining -= batch_size
+        customer_rows = []
+        for _ in range(batch_size):
+            sequence += 1
+            first_name = rnd.choice(FIRST_NAMES)
+            last_name = rnd.choice(LAST_NAMES)
+            email = f"{first_name.lower()}.{last_name.lower()}{sequence}@example.com"
+            phone_number = f"({rnd.randint(200, 999)}) {rnd.randint(200, 999)}-{rnd.randint(0, 9999):04d}"
+            customer_rows.append(
+                {
+                    "first_name": first_name,
+                    "last_name": last_name,
+                    "email": email if rnd.random() < 0.8 else None,
+                    "phone_number": phone_number if rnd.random() < 0.85 else None,
+                    "instagram_handle": f"@{first_name.lower()}{sequence}" if rnd.random() < 0.3 else None,
+                    "date_of_birth": date(1950, 1, 1) + timedelta(days=rnd.randint(0, 20_000)),
+                    "has_no_ssn": True,
+                    "ssn_encrypted": None,
+                    "has_left_country": rnd.random() < 0.05,
+                    "customer_photo_object_key": f"customers/{sequence}/photo.webp" if rnd.random() < 0.6 else None,
+                    "active": rnd.random() < 0.95,
+                    "created_at": now - timedelta(minutes=rnd.randint(0, 3 * 365 * 24 * 60)),
+                    "updated_at": now - timedelta(minutes=rnd.randint(0, 365 * 24 * 60)),
+                }
+            )
+        customer_ids = _insert_returning_ids(db, Customer, customer_rows)
+
+        address_rows = []
+        nj_rows = []
+        brazil_rows = []
+        passport_rows = []
+        for customer_id in customer_ids:
+            for address_type in AddressType:
+                if address_type is AddressType.RESIDENTIAL or rnd.random() < 0.3:
+                    address_rows.append(
+                        {
+                            "customer_id": customer_id,
+                            "address_type": address_type,
+                            "street": f"{rnd.randint(1, 9999)} Main St",
+                            "city": "Newark",
+                            "state": "NJ",
+                            "zip_code": f"07{rnd.randint(0, 999):03d}",
+                        }
+                    )
+            for index in range(how_many(args.nj_licenses)):
+                nj_rows.append(
+                    {
+                        "customer_id": customer_id,
+                        "license_number_encrypted": f"NJ{customer_id:08d}{index}",
+                        "issue_date": days(-2000, -400),
+                        "expiration_date": days(-200, 900),
+                        "license_class": rnd.choice(list(NJLicenseClass)),
+                        "is_current": index == 0,
+                        "active": rnd.random() < 0.9,
+                    }
+                )
+            for index in range(how_many(args.brazil_licenses)):
+                brazil_rows.append(
+                    {
+                        "customer_id": customer_id,
+                        "full_name": f"Customer {customer_id}",
+                        "cpf_encrypted": f"cpf-{customer_id}",
+                        "category": rnd.choice(["A", "B", "AB"]),
+                        "registry_number": f"BR{customer_id:08d}{index}",
+                        "issue_date": days(-3000, -500),
+                        "expiration_date": days(-200, 900),
+                        "is_current": index == 0,
+                        "active": rnd.random() < 0.9,
+                    }
+                )
+            for index in range(how_many(args.passports)):
+                passport_rows.append(
+                    {
+                        "customer_id": customer_id,
+                        "passport_number_encrypted": f"P{customer_id:08d}{index}",
+                        "surname": "Benchmark",
+                        "given_name": f"Customer {customer_id}",
+                        "document_type": "P",
+                        "issuing_country": "BRA",
+                        "nationality": "BR",
+                        "issue_date": days(-3000, -500),
+                        "expiration_date": days(-200, 1500),
+                        "is_current": index == 0,
+                        "active": rnd.random() < 0.9,
+                    }
+                )
+
+        if address_rows:
+            db.execute(insert(CustomerAddress), address_rows)
+        nj_ids = _insert_returning_ids(db, NJDriverLicense, nj_rows)
+        brazil_ids = _insert_returning_ids(db, BrazilDriverLicense, brazil_rows)
+        passport_ids = _insert_returning_ids(db, Passport, passport_rows)
+
+        code_rows: dict[type, list[dict[str, Any]]] = {NJDriverLicenseEndorsement: [], NJDriverLicenseRestriction: []}
+        for nj_id in nj_ids:
+            for code in rnd.sample(list(NJEndorsementCode), rnd.randint(0, 2)):
+                code_rows[NJDriverLicenseEndorsement].append({"nj_driver_license_id": nj_id, "code": code})
+            for code in rnd.sample(list(NJRestrictionCode), rnd.randint(0, 2)):
+                code_rows[NJDriverLicenseRestriction].append({"nj_driver_license_id": nj_id, "code": code})
+        for model, rows in code_rows.items():
+            if rows:
+                db.execute(insert(model), rows)
+
+        notification_rows = []
+        for document_type, ids, rows in (
+            ("nj_driver_license", nj_ids, nj_rows),
+            ("brazil_driver_license", brazil_ids, brazil_rows),
+            ("passport", passport_ids, passport_rows),
+        ):
+            for source_document_id, row in zip(ids, rows):
+                if expiring_soon(row["expiration_date"]) and rnd.random() < args.notification_ratio:
+                    notification_rows.append(
+                        {
+                            "customer_id": row["customer_id"],
+                            "document_type": document_type,
+                            "source_document_id": source_document_id,
+                            "expiration_date": row["expiration_date"],
+                            "notified_at": now - timedelta(days=rnd.randint(0, 30)) if rnd.random() < 0.7 else None,
+                        }
+                    )
+        if notification_rows:
+            db.execute(insert(ExpirationNotification), notification_rows)
+        db.commit()
+
+        counts[Customer.__tablename__] += len(customer_ids)
+        counts[CustomerAddress.__tablename__] += len(address_rows)
+        counts[NJDriverLicense.__tablename__] += len(nj_ids)
+        counts[BrazilDriverLicense.__tablename__] += len(brazil_ids)
+        counts[Passport.__tablename__] += len(passport_ids)
+        counts[NJDriverLicenseEndorsement.__tablename__] += len(code_rows[NJDriverLicenseEndorsement])
+        counts[NJDriverLicenseRestriction.__tablename__] += len(code_rows[NJDriverLicenseRestriction])
+        counts[ExpirationNotification.__tablename__] += len(notification_rows)
+        print(f"Seeded {args.customers - remaining}/{args.customers} customers", flush=True)
+
+    customer_ids = db.scalars(select(Customer.id).order_by(Customer.id)).all()
+    document_rows = []
+    for index in range(args.generated_documents if customer_ids else 0):
+        customer_id = rnd.choice(customer_ids)
+        document_rows.append(
+            {
+                "customer_id": customer_id,
+                "template_key": "affidavit",
+                "object_key": f"{settings.GENERATED_DOCUMENTS_PREFIX}/{customer_id}/benchmark_{index}.pdf",
+                "size_bytes": rnd.randint(50_000, 500_000),
+                "generated_at": now - timedelta(minutes=rnd.randint(0, 90 * 24 * 60)),
+            }
+        )
+    for start in range(0, len(document_rows), SEED_BATCH_SIZE):
+        db.execute(insert(GeneratedDocument), document_rows[start : start + SEED_BATCH_SIZE])
+    db.commit()
+    counts[GeneratedDocument.__tablename__] = len(document_rows)
+    return counts
+
+
+def prepare_postgres(engine: Engine) -> None:
+    # Objects the models depend on that create_all() cannot emit (see the 20260304_0011 migration).
+    with engine.begin() as connection:
+        connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        connection.execute(text("CREATE EXTENSION IF NOT EXISTS unaccent WITH SCHEMA public"))
+        connection.execute(
+            text(
+                "CREATE OR REPLACE FUNCTION immutable_unaccent(text) RETURNS text "
+                "LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT "
+                "AS $$ SELECT public.unaccent('public.unaccent'::regdictionary, $1) $$"
+            )
+        )
+
+
+def reset_database(db: Session) -> None:
+    if db.get_bind().dialect.name == "postgresql":
+        tables = ", ".join(model.__tablename__ for model in SEEDED_TABLES)
+        db.execute(text(f"TRUNCATE {tables} RESTART IDENTITY CASCADE"))
+    else:
+        for model in SEEDED_TABLES:
+            db.execute(delete(model))
+    db.commit()
+
+
+def table_counts(db: Session) -> dict[str, int]:
+    return {model.__tablename__: db.scalar(select(func.count()).select_from(model)) or 0 for model in SEEDED_TABLES}
+
+
+def build_benchmarks() -> dict[str, Callable[[Session], Any]]:
+    def report(builder: Callable[[Session], Report]) -> Callable[[Session], dict[str, Any]]:
+        return lambda db: _consume_report(builder(db))
+
+    def cursor_walk(db: Session, pages: int = 10) -> None:
+        cursor = None
+        for _ in range(pages):
+            cursor = list_customers(db, size=20, cursor=cursor, count="none").next_cursor
+            if cursor is None:
+                break
+
+    def summary(db: Session) -> None:
+        invalidate_dashboard_summary()
+        get_dashboard_summary(db)
+
+    return {
+        "reports.customers": report(reports.build_all_customers_csv),
+        "reports.licenses_expiring_3m": report(lambda db: reports.build_expiring_licenses_csv(db, months_ahead=3)),
+        "reports.licenses_expiring_12m": report(lambda db: reports.build_expiring_licenses_csv(db, months_ahead=12)),
+        "reports.customers_without_active_driver_license": report(
+            reports.build_customers_without_active_driver_license_csv
+        ),
+        "reports.passports_expiring_this_year": report(reports.build_passports_expiring_this_year_csv),
+        "reports.customers_without_photo": report(reports.build_customers_without_photo_csv),
+        "reports.customers_without_phone": report(reports.build_customers_without_phone_csv),
+        "reports.customers_without_current_driver_license": report(
+            reports.build_customers_without_current_driver_license_csv
+        ),
+        "reports.customers_outside_usa": report(reports.build_customers_returned_home_country_csv),
+        "dashboard.summary": summary,
+        "dashboard.pending_30d": lambda db: list_prioritized_pending(db, days_ahead=30),
+        "dashboard.pending_90d_unnotified": lambda db: list_prioritized_pending(
+            db, days_ahead=90, include_notified=False
+        ),
+        "dashboard.pending_overdue_page": lambda db: list_prioritized_pending(
+            db, days_ahead=365, days_overdue=60, offset=200, limit=200
+        ),
+        "customers.list_first_page": lambda db: list_customers(db, page=1, size=20),
+        "customers.list_deep_page": lambda db: list_customers(db, page=200, size=20),
+        "customers.list_estimated_total": lambda db: list_customers(db, page=1, size=20, count="estimate"),
+        "customers.list_cursor_walk_10_pages": cursor_walk,
+        "customers.search_name": lambda db: list_customers(db, page=1, size=20, search="silva"),
+        "customers.search_accent_folded": lambda db: list_customers(db, page=1, size=20, search="joao"),
+        "customers.search_phone": lambda db: list_customers(db, page=1, size=20, search="555"),
+    }
+
+
+def run_benchmark(
+    engine: Engine,
+    session_factory: sessionmaker[Session],
+    name: str,
+    func_: Callable[[Session], Any],
+    repeat: int,
+) -> BenchmarkResult:
+    runs: list[RunMetrics] = []
+    for _ in range(max(1, repeat)):
+        gc.collect()
+        query_count = 0
+
+        def count_query(*_: Any) -> None:
+            nonlocal query_count
+            query_count += 1
+
+        event.listen(engine, "before_cursor_execute", count_query)
+        try:
+            with session_factory() as db, PeakRssSampler() as rss:
+                started = time.perf_counter()
+                outcome = func_(db)
+                wall_seconds = time.perf_counter() - started
+        finally:
+            event.remove(engine, "before_cursor_execute", count_query)
+        outcome = outcome if isinstance(outcome, dict) else {}
+        runs.append(
+            RunMetrics(
+                wall_seconds=wall_seconds,
+                query_count=query_count,
+                peak_rss_bytes=rss.peak_bytes,
+                start_rss_bytes=rss.start_bytes,
+                rows=outcome.get("rows"),
+                output_bytes=outcome.get("output_bytes"),
+            )
+        )
+
+    walls = [run.wall_seconds for run in runs]
+    last = runs[-1]
+    return BenchmarkResult(
+        name=name,
+        runs=len(runs),
+        wall_seconds_median=round(statistics.median(walls), 6),
+        wall_seconds_min=round(min(walls), 6),
+        wall_seconds_max=round(max(walls), 6),
+        query_count=last.query_count,
+        peak_rss_mb=round(max(run.peak_rss_bytes for run in runs) / 2**20, 2),
+        rss_growth_mb=round(max(run.peak_rss_bytes - run.start_rss_bytes for run in runs) / 2**20, 2),
+        rows=last.rows,
+        output_bytes=last.output_bytes,
+    )
+
+
+class PeakRssSampler:
+    # Polls the resident set size while a benchmark runs. ru_maxrss is a process-lifetime high-water mark,
+    # so on its own it could not attribute a peak to a single benchmark.
+    def __init__(self, interval_seconds: float = 0.005) -> None:
+        self.interval_seconds = interval_seconds
+        self.start_bytes = 0
+        self.peak_bytes = 0
+        self._stop = Event()
+        self._thread = Thread(target=self._run, name="rss-sampler", daemon=True)
+
+    def __enter__(self) -> PeakRssSampler:
+        self.start_bytes = self.peak_bytes = current_rss_bytes()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.peak_bytes = max(self.peak_bytes, current_rss_bytes())
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_seconds):
+            self.peak_bytes = max(self.peak_bytes, current_rss_bytes())
+
+
+def current_rss_bytes() -> int:
+    try:
+        with open("/proc/self/statm", encoding="ascii") as statm:
+            return int(statm.read().split()[1]) * resource.getpagesize()
+    except OSError:
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def compare_results(current: list[BenchmarkResult], baseline: dict[str, Any], threshold: float) -> list[str]:
+    previous = {item["name"]: item for item in baseline.get("results", [])}
+    regressions = []
+    print(f"\n{'benchmark':<50} {'baseline s':>11} {'current s':>11} {'change':>8} {'queries':>9}")
+    for result in current:
+        before = previous.get(result.name)
+        if before is None:
+            print(f"{result.name:<50} {'-':>11} {result.wall_seconds_median:>11.4f} {'new':>8} {result.query_count:>9}")
+            continue
+        old_median = before["wall_seconds_median"]
+        change = (result.wall_seconds_median - old_median) / old_median if old_median else 0.0
+        queries = f"{before['query_count']}->{result.query_count}"
+        flag = ""
+        # Sub-5 ms medians are mostly noise; only flag slowdowns that are both relative and absolute.
+        if change > threshold and result.wall_seconds_median - old_median > 0.005:
+            flag = "  REGRESSION"
+            regressions.append(result.name)
+        elif result.query_count > before["query_count"]:
+            flag = "  MORE QUERIES"
+            regressions.append(result.name)
+        print(
+            f"{result.name:<50} {old_median:>11.4f} {result.wall_seconds_median:>11.4f} "
+            f"{change:>+8.1%} {queries:>9}{flag}"
+        )
+    return regressions
+
+
+def main() -> int:
+    args = parse_args()
+    if not args.database_url:
+        print("Pass --database-url or set BENCHMARK_DATABASE_URL to a scratch database.", file=sys.stderr)
+        return 2
+    if args.database_url == settings.DATABASE_URL:
+        print("Refusing to seed the application database; use a separate scratch database.", file=sys.stderr)
+        return 2
+
+    engine = create_engine(args.database_url, pool_pre_ping=True)
+    session_factory = sessionmaker(bind=engine, autocommit=False, autoflush=False, expire_on_commit=False)
+    if engine.dialect.name == "postgresql":
+        prepare_postgres(engine)
+    Base.metadata.create_all(engine)
+
+    with session_factory() as db:
+        if args.reset:
+            reset_database(db)
+        if not args.skip_seed:
+            if db.scalar(select(func.count()).select_from(Customer)):
+                print("Database already has customers; pass --reset to reseed or --skip-seed.", file=sys.stderr)
+                return 2
+            started = time.perf_counter()
+            seed_database(db, args)
+            print(f"Seeding took {time.perf_counter() - started:.1f}s", flush=True)
+        if engine.dialect.name == "postgresql":
+            db.execute(text("ANALYZE"))
+            db.commit()
+        dataset = table_counts(db)
+
+    benchmarks = build_benchmarks()
+    if args.only:
+        benchmarks = {name: fn for name, fn in benchmarks.items() if any(part in name for part in args.only)}
+
+    results = []
+    for name, fn in benchmarks.items():
+        result = run_benchmark(engine, session_factory, name, fn, args.repeat)
+        results.append(result)
+        print(
+            f"{name:<50} {result.wall_seconds_median:>9.4f}s  queries={result.query_count:<4} "
+            f"peak_rss={result.peak_rss_mb:.1f}MB (+{result.rss_growth_mb:.1f})",
+            flush=True,
+        )
+
+    output = args.output or Path("benchmark-results") / f"{datetime.now(UTC).strftime('%Y%m%d_%H%M%S')}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "meta": {
+            "created_at": datetime.now(UTC).isoformat(),
+            "git_revision": _git_revision(),
+            "python": platform.python_version(),
+            "database": engine.dialect.name,
+            "database_version": ".".join(str(part) for part in engine.dialect.server_version_info or ()),
+            "repeat": args.repeat,
+            "seed": args.seed,
+            "dataset": dataset,
+        },
+        "results": [asdict(result) for result in results],
+    }
+    output.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    print(f"\nWrote {output}")
+
+    if args.baseline:
+        regressions = compare_results(results, json.loads(args.baseline.read_text(encoding="utf-8")), args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")
+            if args.fail_on_regression:
+                return 1
+    engine.dispose()
+    return 0
+
+
+def _insert_returning_ids(db: Session, model: type, rows: list[dict[str, Any]]) -> list[int]:
+    if not rows:
+        return []
+    stmt = insert(model).returning(model.id, sort_by_parameter_order=True)
+    return list(db.scalars(stmt, rows).all())
+
+
+def _consume_report(report: Report) -> dict[str, Any]:
+    rows = 0
+
+    def counted(source: Iterable[list[Any]]) -> Iterator[list[Any]]:
+        nonlocal rows
+        for row in source:
+            rows += 1
+            yield row
+
+    output_bytes = sum(len(chunk) for chunk in iter_csv(report.header, counted(report.rows)))
+    return {"rows": rows, "output_bytes": output_bytes}
+
+
+def _git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=BACKEND_ROOT,
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
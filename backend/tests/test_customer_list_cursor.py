@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import unittest
+from base64 import urlsafe_b64encode
+from datetime import UTC, datetime
+from types import SimpleNamespace
+
+from app.modules.customers.errors import InvalidCustomerCursorError
+from app.modules.customers.services.customers import _decode_cursor, _encode_cursor, _search_fingerprint
+
+CREATED_AT = datetime(2026, 3, 4, 15, 30, 12, 345678, tzinfo=UTC)
+
+
+def _raw_cursor(raw: str) -> str:
+    return urlsafe_b64encode(raw.encode("ascii")).decode("ascii").rstrip("=")
+
+
+class CustomerListCursorTests(unittest.TestCase):
+    def test_unfiltered_cursor_round_trips(self) -> None:
+        cursor = _encode_cursor(SimpleNamespace(created_at=CREATED_AT, id=42), "")
+
+        self.assertEqual(_decode_cursor(cursor, ""), (CREATED_AT, 42))
+        self.assertNotIn("=", cursor)
+
+    def test_search_cursor_round_trips_the_exact_rank(self) -> None:
+        rank = 0.1 + 0.2
+        cursor = _encode_cursor(SimpleNamespace(search_rank=rank, created_at=CREATED_AT, id=7), "Ana")
+
+        self.assertEqual(_decode_cursor(cursor, "Ana"), (rank, CREATED_AT, 7))
+        self.assertEqual(_decode_cursor(cursor, "ana"), (rank, CREATED_AT, 7))
+
+    def test_cursor_from_another_search_is_rejected(self) -> None:
+        ana = _encode_cursor(SimpleNamespace(search_rank=0.5, created_at=CREATED_AT, id=7), "ana")
+        unfiltered = _encode_cursor(SimpleNamespace(created_at=CREATED_AT, id=7), "")
+
+        for cursor, term in ((ana, "bruno"), (ana, ""), (unfiltered, "ana")):
+            with self.subTest(term=term), self.assertRaises(InvalidCustomerCursorError):
+                _decode_cursor(cursor, term)
+
+    def test_malformed_cursors_are_rejected(self) -> None:
+        fingerprint = _search_fingerprint("")
+
+        for cursor in (
+            "not base64!",
+            _raw_cursor("only-one-field"),
+            _raw_cursor(f"{CREATED_AT.isoformat()}|42"),
+            _raw_cursor(f"{fingerprint}|yesterday|42"),
+            _raw_cursor(f"{fingerprint}|{CREATED_AT.isoformat()}|forty-two"),
+            _raw_cursor(f"{fingerprint}|0.5|{CREATED_AT.isoformat()}|42"),
+            urlsafe_b64encode("é|x".encode("utf-8")).decode("ascii"),
+        ):
+            with self.subTest(cursor=cursor), self.assertRaises(InvalidCustomerCursorError):
+                _decode_cursor(cursor, "")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import unittest
+from unittest import mock
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.deps import get_db
+from app.modules.dashboard.routers import dashboard as dashboard_router
+from app.modules.dashboard.schemas import DashboardPendingListResponse
+from app.modules.dashboard.service import DEFAULT_DAYS_OVERDUE
+
+
+class PendingRouteTests(unittest.TestCase):
+    def setUp(self) -> None:
+        app = FastAPI()
+        app.include_router(dashboard_router.router)
+        app.dependency_overrides[get_db] = lambda: mock.Mock()
+        self.client = TestClient(app)
+        empty = DashboardPendingListResponse(items=[], total=0, pending_count=0, notified_count=0)
+        patcher = mock.patch.object(dashboard_router, "list_prioritized_pending", return_value=empty)
+        self.list_pending = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _days_overdue(self, query: str) -> int | None:
+        self.client.get(f"/dashboard/pending{query}")
+        return self.list_pending.call_args.kwargs["days_overdue"]
+
+    def test_overdue_history_is_bounded_by_default(self) -> None:
+        self.assertEqual(self._days_overdue(""), DEFAULT_DAYS_OVERDUE)
+        self.assertEqual(self._days_overdue("?days_overdue=30"), 30)
+
+    def test_full_overdue_history_is_an_explicit_opt_in(self) -> None:
+        self.assertIsNone(self._days_overdue("?all_overdue=true"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import unittest
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from unittest import mock
+
+from minio.error import S3Error
+
+from app.core.config import settings
+from app.deps.minio.minio_client import get_minio_client, reset_minio_client
+from app.deps.minio.minio_objects import (
+    ObjectRangeNotSatisfiableError,
+    ObjectReadOptions,
+    StoredObject,
+    format_etag,
+    is_not_modified,
+    normalize_byte_range,
+    open_stored_object,
+    to_public_presigned_url,
+)
+from app.utils.object_response import range_not_satisfiable_error
+
+
+class _FakeResponse:
+    def __init__(self, payload: bytes) -> None:
+        self._payload = payload
+        self.closed = 0
+        self.released = 0
+
+    def stream(self, amt: int):
+        for start in range(0, len(self._payload), amt):
+            yield self._payload[start : start + amt]
+
+    def close(self) -> None:
+        self.closed += 1
+
+    def release_conn(self) -> None:
+        self.released += 1
+
+
+def _stored(response: _FakeResponse) -> StoredObject:
+    return StoredObject(
+        object_key="customer-photos/1/photo.webp",
+        file_name="photo.webp",
+        content_type="image/webp",
+        content_length=len(response._payload),
+        response=response,  # type: ignore[arg-type]
+    )
+
+
+class MinioClientPoolTests(unittest.TestCase):
+    def tearDown(self) -> None:
+        reset_minio_client()
+
+    def test_client_is_shared_across_calls(self) -> None:
+        self.assertIs(get_minio_client(), get_minio_client())
+
+    def test_reset_builds_a_new_client(self) -> None:
+        first = get_minio_client()
+        reset_minio_client()
+        self.assertIsNot(first, get_minio_client())
+
+    def test_pool_uses_configured_limits(self) -> None:
+        http = get_minio_client()._http
+        self.assertEqual(http.connection_pool_kw["maxsize"], settings.MINIO_POOL_MAXSIZE)
+        self.assertEqual(http.connection_pool_kw["timeout"].connect_timeout, settings.MINIO_CONNECT_TIMEOUT_SECONDS)
+        self.assertEqual(http.connection_pool_kw["retries"].total, settings.MINIO_MAX_RETRIES)
+
+
+class StoredObjectTests(unittest.TestCase):
+    def test_iter_chunks_streams_in_bounded_chunks_and_releases(self) -> None:
+        payload = b"x" * (settings.MINIO_STREAM_CHUNK_SIZE * 2 + 10)
+        response = _FakeResponse(payload)
+        chunks = list(_stored(response).iter_chunks())
+
+        self.assertEqual(b"".join(chunks), payload)
+        self.assertTrue(all(len(chunk) <= settings.MINIO_STREAM_CHUNK_SIZE for chunk in chunks))
+        self.assertEqual((response.closed, response.released), (1, 1))
+
+    def test_close_is_idempotent_when_client_disconnects_early(self) -> None:
+        response = _FakeResponse(b"x" * (settings.MINIO_STREAM_CHUNK_SIZE * 3))
+        stored = _stored(response)
+        chunks = stored.iter_chunks()
+        next(chunks)
+        chunks.close()
+        stored.close()
+
+        self.assertEqual((response.closed, response.released), (1, 1))
+
+
+    def test_normalize_byte_range_forwards_only_single_ranges(self) -> None:
+        self.assertEqual(normalize_byte_range("bytes=0-1023"), "bytes=0-1023")
+        self.assertEqual(normalize_byte_range("bytes=2048-"), "bytes=2048-")
+        self.assertEqual(normalize_byte_range("bytes=-500"), "bytes=-500")
+        self.assertIsNone(normalize_byte_range("bytes=0-10,20-30"))
+        self.assertIsNone(normalize_byte_range("bytes=10-5"))
+        self.assertIsNone(normalize_byte_range("items=0-10"))
+        self.assertIsNone(normalize_byte_range(None))
+
+
+    def test_is_not_modified_matches_etag_before_date(self) -> None:
+        modified = datetime(2026, 2, 1, 12, 0, 0, tzinfo=UTC)
+        etag = format_etag("abc123")
+
+        self.assertEqual(etag, '"abc123"')
+        self.assertTrue(is_not_modified(etag=etag, last_modified=modified, if_none_match='"x", W/"abc123"', if_modified_since=None))
+        self.assertTrue(is_not_modified(etag=etag, last_modified=modified, if_none_match="*", if_modified_since=None))
+        self.assertFalse(
+            is_not_modified(
+                etag=etag,
+                last_modified=modified,
+                if_none_match='"other"',
+                if_modified_since="Sun, 01 Feb 2026 12:00:00 GMT",
+            )
+        )
+
+    def test_is_not_modified_compares_http_dates(self) -> None:
+        modified = datetime(2026, 2, 1, 12, 0, 0, 500000, tzinfo=UTC)
+
+        self.assertTrue(
+            is_not_modified(etag=None, last_modified=modified, if_none_match=None, if_modified_since="Sun, 01 Feb 2026 12:00:00 GMT")
+        )
+        self.assertFalse(
+            is_not_modified(etag=None, last_modified=modified, if_none_match=None, if_modified_since="Sat, 31 Jan 2026 12:00:00 GMT")
+        )
+        self.assertFalse(is_not_modified(etag=None, last_modified=modified, if_none_match=None, if_modified_since="garbage"))
+
+    def test_unsatisfiable_range_reports_object_size(self) -> None:
+        client = mock.Mock()
+        client.get_object.side_effect = S3Error(None, "InvalidRange", "range", "key", "req", "host")  # type: ignore[arg-type]
+        client.stat_object.return_value = SimpleNamespace(size=1234)
+
+        with (
+            mock.patch.object(settings, "MINIO_PRESIGNED_DOWNLOADS", False),
+            mock.patch("app.deps.minio.minio_objects.get_minio_client", return_value=client),
+            self.assertRaises(ObjectRangeNotSatisfiableError) as raised,
+        ):
+            open_stored_object(
+                "customer-photos/1/photo.webp",
+                file_name="photo.webp",
+                read_options=ObjectReadOptions(byte_range="bytes=5000-"),
+            )
+
+        self.assertEqual(raised.exception.object_size, 1234)
+        error = range_not_satisfiable_error(raised.exception)
+        self.assertEqual(error.status_code, 416)
+        self.assertEqual(error.headers, {"Content-Range": "bytes */1234"})
+
+    def test_unsatisfiable_conditional_range_reuses_the_validator_head(self) -> None:
+        client = mock.Mock()
+        client.get_object.side_effect = S3Error(None, "InvalidRange", "range", "key", "req", "host")  # type: ignore[arg-type]
+        client.stat_object.return_value = SimpleNamespace(
+            size=1234,
+            etag="abc",
+            last_modified=datetime(2026, 2, 1, 12, 0, tzinfo=UTC),
+        )
+
+        with (
+            mock.patch.object(settings, "MINIO_PRESIGNED_DOWNLOADS", False),
+            mock.patch("app.deps.minio.minio_objects.get_minio_client", return_value=client),
+            self.assertRaises(ObjectRangeNotSatisfiableError) as raised,
+        ):
+            open_stored_object(
+                "customer-photos/1/photo.webp",
+                file_name="photo.webp",
+                read_options=ObjectReadOptions(byte_range="bytes=5000-", if_none_match='"other"'),
+            )
+
+        self.assertEqual(raised.exception.object_size, 1234)
+        client.stat_object.assert_called_once()
+
+    def test_presigned_url_is_rewritten_to_public_base(self) -> None:
+        url = "http://minio:9000/driverthru/customer-photos/1/a.webp?X-Amz-Signature=abc&X-Amz-Expires=300"
+
+        self.assertEqual(
+            to_public_presigned_url(url),
+            f"{settings.MINIO_PRESIGNED_PUBLIC_BASE_URL.rstrip('/')}/driverthru/customer-photos/1/a.webp"
+            "?X-Amz-Signature=abc&X-Amz-Expires=300",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import gzip
+import importlib
+import json
+import unittest
+from datetime import date
+from unittest import mock
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.deps import get_db
+from app.modules.reports.formats import (
+    REPORT_FLUSH_ROWS,
+    Report,
+    accepts_gzip,
+    encode_report,
+    gzip_chunks,
+    iter_csv,
+    iter_jsonl,
+)
+
+# app.modules.reports re-exports the APIRouter as `router`, which shadows the submodule of the same name.
+reports_router = importlib.import_module("app.modules.reports.router")
+
+HEADER = ["Customer ID", "Full Name", "Date of Birth"]
+
+
+def _rows(count: int = REPORT_FLUSH_ROWS * 2 + 7) -> list[list[object]]:
+    return [[index, f"João Ñandú {index}", date(1990, 1, 1 + index % 28)] for index in range(count)]
+
+
+class ReportFormatTests(unittest.TestCase):
+    def test_gzip_output_decompresses_to_the_plain_csv(self) -> None:
+        plain = b"".join(iter_csv(HEADER, _rows()))
+        compressed = b"".join(gzip_chunks(iter_csv(HEADER, _rows())))
+
+        self.assertEqual(gzip.decompress(compressed), plain)
+        self.assertLess(len(compressed), len(plain))
+
+    def test_csv_gz_format_and_negotiated_gzip_encode_the_same_csv(self) -> None:
+        plain = b"".join(iter_csv(HEADER, _rows()))
+        download = encode_report(Report(HEADER, _rows(), "customers"), "csv.gz")
+        negotiated = encode_report(Report(HEADER, _rows(), "customers"), "csv", accept_encoding="gzip")
+
+        self.assertEqual((download.filename, download.media_type, download.content_encoding), ("customers.csv.gz", "application/gzip", None))
+        self.assertEqual(gzip.decompress(b"".join(download.chunks)), plain)
+        self.assertEqual((negotiated.filename, negotiated.content_encoding), ("customers.csv", "gzip"))
+        self.assertEqual(gzip.decompress(b"".join(negotiated.chunks)), plain)
+
+    def test_iter_jsonl_writes_one_object_per_row_with_snake_case_keys(self) -> None:
+        rows = _rows()
+        lines = b"".join(iter_jsonl(HEADER, rows)).decode("utf-8").splitlines()
+
+        self.assertEqual(len(lines), len(rows))
+        self.assertEqual(
+            json.loads(lines[1]),
+            {"customer_id": 1, "full_name": "João Ñandú 1", "date_of_birth": "1990-01-02"},
+        )
+        self.assertEqual(list(iter_jsonl(HEADER, [])), [])
+
+    def test_accepts_gzip_honours_quality_values_and_wildcards(self) -> None:
+        cases = {
+            None: False,
+            "": False,
+            "identity": False,
+            "gzip": True,
+            "GZIP;q=0.5": True,
+            "deflate, gzip; q=0.1": True,
+            "gzip;q=0": False,
+            "gzip;q=0.0, br": False,
+            "gzip;q=abc": False,
+            "*": True,
+            "*;q=0": False,
+            "br, *;q=0.5": True,
+            "gzip;q=0, *": False,
+            "gzip, *;q=0": True,
+        }
+        for header, expected in cases.items():
+            with self.subTest(header=header):
+                self.assertIs(accepts_gzip(header), expected)
+
+
+class ReportRouteTests(unittest.TestCase):
+    def setUp(self) -> None:
+        app = FastAPI()
+        app.include_router(reports_router.router)
+        app.dependency_overrides[get_db] = lambda: mock.Mock()
+        self.client = TestClient(app)
+        patcher = mock.patch.object(
+            reports_router,
+            "build_all_customers_csv",
+            side_effect=lambda db: Report(HEADER, _rows(), "customers"),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_csv_is_gzip_encoded_only_when_the_client_accepts_it(self) -> None:
+        plain = b"".join(iter_csv(HEADER, _rows()))
+
+        encoded = self.client.get("/reports/customers.csv", headers={"Accept-Encoding": "gzip"})
+        identity = self.client.get("/reports/customers.csv", headers={"Accept-Encoding": "identity"})
+
+        self.assertEqual(encoded.headers["content-encoding"], "gzip")
+        self.assertEqual(encoded.content, plain)
+        self.assertNotIn("content-encoding", identity.headers)
+        self.assertEqual(identity.content, plain)
+        for response in (encoded, identity):
+            self.assertEqual(response.headers["vary"], "Accept-Encoding")
+            self.assertEqual(response.headers["content-disposition"], 'attachment; filename="customers.csv"')
+
+    def test_format_query_selects_jsonl_and_csv_gz(self) -> None:
+        jsonl = self.client.get("/reports/customers.csv?format=jsonl", headers={"Accept-Encoding": "identity"})
+        csv_gz = self.client.get("/reports/customers.csv?format=csv.gz", headers={"Accept-Encoding": "gzip"})
+        invalid = self.client.get("/reports/customers.csv?format=xlsx")
+
+        self.assertEqual(jsonl.headers["content-type"], "application/x-ndjson")
+        self.assertEqual(len(jsonl.text.splitlines()), len(_rows()))
+        self.assertEqual(csv_gz.headers["content-type"], "application/gzip")
+        self.assertNotIn("content-encoding", csv_gz.headers)
+        self.assertEqual(gzip.decompress(csv_gz.content), b"".join(iter_csv(HEADER, _rows())))
+        self.assertEqual(invalid.status_code, 422)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import unittest
+from datetime import UTC, datetime, timedelta
+from unittest import mock
+
+from sqlalchemy import create_engine
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.config import settings
+from app.modules.reports import jobs
+from app.modules.reports.models import ReportJob
+from app.modules.reports.schemas import ReportJobCreateRequest
+
+
+class ReportJobHeartbeatTests(unittest.TestCase):
+    def setUp(self) -> None:
+        engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+        ReportJob.__table__.create(engine)
+        self.session_factory = sessionmaker(bind=engine, expire_on_commit=False)
+        patcher = mock.patch.object(jobs, "SessionLocal", self.session_factory)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(engine.dispose)
+
+    def _add_job(self, status: str, worker_id: str | None, heartbeat_age: timedelta | None) -> int:
+        now = datetime.now(UTC)
+        with self.session_factory() as db:
+            job = ReportJob(
+                report_key="customers",
+                report_format="csv",
+                params_key="{}",
+                status=status,
+                worker_id=worker_id,
+                heartbeat_at=None if heartbeat_age is None else now - heartbeat_age,
+                created_at=now,
+            )
+            db.add(job)
+            db.commit()
+            return job.id
+
+    def _status(self, job_id: int) -> str:
+        with self.session_factory() as db:
+            return db.get(ReportJob, job_id).status
+
+    def test_only_jobs_with_a_stale_or_missing_heartbeat_are_failed(self) -> None:
+        stale = timedelta(seconds=settings.REPORT_JOB_STALE_SECONDS + 60)
+        live_elsewhere = self._add_job("running", "other-replica:1:abc", timedelta(seconds=5))
+        queued_elsewhere = self._add_job("queued", "other-replica:1:abc", timedelta(seconds=5))
+        orphaned = self._add_job("running", "old-process:9:def", stale)
+        legacy = self._add_job("queued", None, None)
+        finished = self._add_job("succeeded", "old-process:9:def", stale)
+
+        self.assertEqual(jobs.fail_stale_report_jobs(), 2)
+
+        self.assertEqual(self._status(live_elsewhere), "running")
+        self.assertEqual(self._status(queued_elsewhere), "queued")
+        self.assertEqual(self._status(orphaned), "failed")
+        self.assertEqual(self._status(legacy), "failed")
+        self.assertEqual(self._status(finished), "succeeded")
+
+    def test_refresh_keeps_this_process_jobs_alive(self) -> None:
+        stale = timedelta(seconds=settings.REPORT_JOB_STALE_SECONDS + 60)
+        own = self._add_job("running", jobs.WORKER_ID, stale)
+        foreign = self._add_job("running", "old-process:9:def", stale)
+
+        jobs._refresh_heartbeats()
+        jobs.fail_stale_report_jobs()
+
+        self.assertEqual(self._status(own), "running")
+        self.assertEqual(self._status(foreign), "failed")
+
+
+class ReportJobSubmissionTests(unittest.TestCase):
+    def test_postgres_submissions_lock_the_report_key_before_looking_for_a_reusable_job(self) -> None:
+        db = mock.Mock()
+        db.get_bind.return_value.dialect = postgresql.dialect()
+        existing = ReportJob(
+            id=5,
+            report_key="customers",
+            report_format="csv.gz",
+            params_key="{}",
+            status="running",
+            created_at=datetime.now(UTC),
+        )
+        calls: list[str] = []
+        db.execute.side_effect = lambda stmt: calls.append(str(stmt.compile(dialect=postgresql.dialect())))
+
+        def find_reusable_job(*args: object, **kwargs: object) -> ReportJob:
+            calls.append("lookup")
+            return existing
+
+        with mock.patch.object(jobs, "_find_reusable_job", side_effect=find_reusable_job):
+            response = jobs.submit_report_job(db, ReportJobCreateRequest(report="customers", format="csv.gz"))
+
+        self.assertEqual(len(calls), 2)
+        self.assertIn("pg_advisory_xact_lock(hashtextextended(", calls[0])
+        self.assertEqual(calls[1], "lookup")
+        self.assertTrue(response.reused)
+        db.commit.assert_called_once()
+        db.add.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
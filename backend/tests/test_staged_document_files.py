@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.deps import get_db
+from app.modules.customers.errors import CustomerNotFoundError
+from app.modules.customers.routers import passports as passports_router
+from app.modules.customers.schemas import PassportCreate
+from app.modules.customers.services import passports as passports_service
+from app.modules.customers.services.document_files import STAGED_DOC_FILES_PREFIX
+
+STAGED_KEY = f"{STAGED_DOC_FILES_PREFIX}/passport/7/scan.html"
+PASSPORT_PAYLOAD = {
+    "surname": "SILVA",
+    "given_name": "ANA",
+    "passport_number_encrypted": "FX123456",
+    "is_current": False,
+    "staged_document_file_object_key": STAGED_KEY,
+}
+
+
+class StagedDocumentFinalizeTests(unittest.TestCase):
+    def test_rejected_staged_file_rolls_back_the_new_record(self) -> None:
+        db = mock.Mock()
+        client = mock.Mock()
+        client.stat_object.return_value = SimpleNamespace(content_type="text/html", size=512)
+
+        with (
+            mock.patch.object(passports_service, "get_customer_or_404"),
+            mock.patch("app.modules.customers.services.document_files.get_minio_client", return_value=client),
+            self.assertRaisesRegex(ValueError, "Unsupported file type"),
+        ):
+            passports_service.create_passport(db, 7, PassportCreate(**PASSPORT_PAYLOAD))
+
+        db.flush.assert_called_once()
+        db.rollback.assert_called_once()
+        db.commit.assert_not_called()
+        client.copy_object.assert_not_called()
+
+    def test_write_routes_map_rejected_input_to_422_and_missing_records_to_404(self) -> None:
+        app = FastAPI()
+        app.include_router(passports_router.router, prefix="/customers")
+        db = mock.Mock()
+        app.dependency_overrides[get_db] = lambda: db
+        client = TestClient(app)
+
+        with mock.patch.object(passports_router, "create_passport", side_effect=ValueError("Document payload is empty.")):
+            response = client.post("/customers/7/passports", json=PASSPORT_PAYLOAD)
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(response.json()["detail"], "Document payload is empty.")
+        db.rollback.assert_called_once()
+
+        with mock.patch.object(passports_router, "create_passport", side_effect=CustomerNotFoundError("Customer 7 not found")):
+            response = client.post("/customers/7/passports", json=PASSPORT_PAYLOAD)
+        self.assertEqual(response.status_code, 404)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import asyncio
+import unittest
+from io import BytesIO
+from unittest import mock
+
+from fastapi import UploadFile
+
+from app.utils import uploads
+from app.utils.uploads import UploadTooLargeError, read_upload_limited, spool_upload
+
+MAX_BYTES = 1024
+
+
+def _upload(payload: bytes, *, known_size: bool) -> UploadFile:
+    return UploadFile(
+        file=BytesIO(payload),
+        size=len(payload) if known_size else None,
+        filename="scan.pdf",
+        headers={"content-type": "application/pdf"},  # type: ignore[arg-type]
+    )
+
+
+class SpoolUploadTests(unittest.TestCase):
+    def test_upload_at_the_limit_is_measured_and_rewound(self) -> None:
+        payload = b"x" * MAX_BYTES
+        for known_size in (True, False):
+            with self.subTest(known_size=known_size):
+                upload = asyncio.run(spool_upload(_upload(payload, known_size=known_size), max_bytes=MAX_BYTES))
+
+                self.assertEqual(upload.size, MAX_BYTES)
+                self.assertEqual(upload.stream.read(), payload)
+                self.assertEqual((upload.file_name, upload.content_type), ("scan.pdf", "application/pdf"))
+
+    def test_upload_over_the_limit_is_rejected(self) -> None:
+        for known_size in (True, False):
+            with self.subTest(known_size=known_size), self.assertRaises(UploadTooLargeError):
+                asyncio.run(spool_upload(_upload(b"x" * (MAX_BYTES + 1), known_size=known_size), max_bytes=MAX_BYTES))
+
+    def test_unknown_size_stops_measuring_past_the_limit(self) -> None:
+        file = _upload(b"x" * (MAX_BYTES * 10), known_size=False)
+        with mock.patch.object(uploads, "UPLOAD_CHUNK_SIZE", MAX_BYTES // 2), self.assertRaises(UploadTooLargeError):
+            asyncio.run(spool_upload(file, max_bytes=MAX_BYTES))
+
+        self.assertLessEqual(file.file.tell(), MAX_BYTES + MAX_BYTES // 2)
+
+
+class ReadUploadLimitedTests(unittest.TestCase):
+    def test_returns_the_bytes_within_the_limit(self) -> None:
+        payload = b"%PDF" + b"x" * (MAX_BYTES - 4)
+        for known_size in (True, False):
+            with self.subTest(known_size=known_size):
+                self.assertEqual(
+                    asyncio.run(read_upload_limited(_upload(payload, known_size=known_size), max_bytes=MAX_BYTES)),
+                    payload,
+                )
+
+    def test_known_oversized_upload_is_rejected_without_reading(self) -> None:
+        file = _upload(b"x" * (MAX_BYTES + 1), known_size=True)
+        with self.assertRaises(UploadTooLargeError):
+            asyncio.run(read_upload_limited(file, max_bytes=MAX_BYTES))
+
+        self.assertEqual(file.file.tell(), 0)
+
+    def test_unknown_size_upload_stops_reading_past_the_limit(self) -> None:
+        file = _upload(b"x" * (MAX_BYTES * 10), known_size=False)
+        with mock.patch.object(uploads, "UPLOAD_CHUNK_SIZE", MAX_BYTES // 2), self.assertRaises(UploadTooLargeError):
+            asyncio.run(read_upload_limited(file, max_bytes=MAX_BYTES))
+
+        self.assertLessEqual(file.file.tell(), MAX_BYTES + MAX_BYTES // 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -111,6 +111,8 @@ export default function Customers() {
     setSearch,
     loadingList,
     listError,
+    hasMoreCustomers,
+    loadingMore,
     selectedCustomerId,
     selectedCustomer,
     selectedCustomerName,
@@ -125,6 +127,7 @@ export default function Customers() {
     deletingPhoto,
     photoError,
     loadCustomers,
+    loadMoreCustomers,
     handleSelectCustomer,
     beginCreateCustomer,
     submitCustomer,
@@ -1681,6 +1684,18 @@ export default function Customers() {
             </tbody>
           </table>
         </div>
+        {!loadingList && hasMoreCustomers ? (
+          <div className="mt-3 flex justify-center">
+            <button
+              type="button"
+              onClick={() => void loadMoreCustomers()}
+              disabled={loadingMore}
+              className="rounded-xl border border-slate-300 px-3 py-2 text-sm font-medium text-slate-700 transition hover:bg-slate-50 disabled:opacity-60"
+            >
+              {loadingMore ? "Loading..." : "Load more"}
+            </button>
+          </div>
+        ) : null}
       </section>
 
       {editorOpen ? (
@@ -6,7 +6,6 @@ import { apiFetch } from "../../../lib/api";
 import {
   defaultCustomerForm,
   formatDateForForm,
-  fullName,
   mapAddressForm,
   normalizeDate,
   normalizeEyeColor,
@@ -20,6 +19,8 @@ type UseCustomerCoreResult = {
   setSearch: (value: string) => void;
   loadingList: boolean;
   listError: string | null;
+  hasMoreCustomers: boolean;
+  loadingMore: boolean;
   selectedCustomerId: number | null;
   selectedCustomer: CustomerRead | null;
   selectedCustomerName: string;
@@ -34,6 +35,7 @@ type UseCustomerCoreResult = {
   deletingPhoto: boolean;
   photoError: string | null;
   loadCustomers: (queryOverride?: string, options?: { skipAutoSelect?: boolean }) => Promise<void>;
+  loadMoreCustomers: () => Promise<void>;
   handleSelectCustomer: (customerId: number) => Promise<void>;
   beginCreateCustomer: () => void;
   submitCustomer: (event: FormEvent) => Promise<void>;
@@ -42,6 +44,20 @@ type UseCustomerCoreResult = {
   deleteCustomerPhoto: () => Promise<void>;
 };
 
+const CUSTOMER_PAGE_SIZE = 100;
+
+// Search and paging run on the server; count=none skips the total and next_cursor keeps every page equally cheap.
+async function fetchCustomerPage(query: string, cursor?: string): Promise<CustomerListResponse> {
+  const params = new URLSearchParams({ size: String(CUSTOMER_PAGE_SIZE), count: "none" });
+  if (query) params.set("search", query);
+  if (cursor) params.set("cursor", cursor);
+  const response = await apiFetch(`/customers?${params.toString()}`);
+  if (!response.ok) {
+    throw new Error(`Failed to list customers: ${response.status}`);
+  }
+  return (await response.json()) as CustomerListResponse;
+}
+
 export function useCustomerCore(): UseCustomerCoreResult {
   return useCustomerCoreWithOptions();
 }
@@ -56,6 +72,9 @@ export function useCustomerCoreWithOptions(options: UseCustomerCoreOptions = {})
   const [search, setSearch] = useState("");
   const [loadingList, setLoadingList] = useState(true);
   const [listError, setListError] = useState<string | null>(null);
+  const [listQuery, setListQuery] = useState("");
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
 
   const [selectedCustomerId, setSelectedCustomerId] = useState<number | null>(null);
   const [selectedCustomer, setSelectedCustomer] = useState<CustomerRead | null>(null);
@@ -97,27 +116,12 @@ export function useCustomerCoreWithOptions(options: UseCustomerCoreOptions = {})
     setListError(null);
     try {
       const query = (queryOverride ?? search).trim();
-      const suffix = "?size=100";
-      const response = await apiFetch(`/customers${suffix}`);
-      if (!response.ok) {
-        throw new Error(`Failed to list customers: ${response.status}`);
-      }
-      const data = (await response.json()) as CustomerListResponse;
-
-      const normalizedQuery = query.toLowerCase();
-      const items = normalizedQuery
-        ? data.items.filter((item) => {
-            const normalizedName = fullName(item).toLowerCase();
-            return (
-              normalizedName.includes(normalizedQuery) ||
-              (item.email ?? "").toLowerCase().includes(normalizedQuery) ||
-              (item.phone_number ?? "").toLowerCase().includes(normalizedQuery) ||
-              (item.instagram_handle ?? "").toLowerCase().includes(normalizedQuery)
-            );
-          })
-        : data.items;
+      const data = await fetchCustomerPage(query);
+      const items = data.items;
 
       setCustomers(items);
+      setListQuery(query);
+      setNextCursor(data.next_cursor);
       if (!skipAutoSelect && !selectedCustomerId && items.length > 0) {
         await handleSelectCustomer(items[0].id);
       }
@@ -134,6 +138,21 @@ export function useCustomerCoreWithOptions(options: UseCustomerCoreOptions = {})
     }
   }
 
+  async function loadMoreCustomers() {
+    if (!nextCursor || loadingMore) return;
+    setLoadingMore(true);
+    setListError(null);
+    try {
+      const data = await fetchCustomerPage(listQuery, nextCursor);
+      setCustomers((prev) => [...prev, ...data.items]);
+      setNextCursor(data.next_cursor);
+    } catch {
+      setListError("Could not load more customers.");
+    } finally {
+      setLoadingMore(false);
+    }
+  }
+
   async function handleSelectCustomer(customerId: number) {
     setSelectedCustomerId(customerId);
     setCustomerError(null);
@@ -411,6 +430,8 @@ export function useCustomerCoreWithOptions(options: UseCustomerCoreOptions = {})
     setSearch,
     loadingList,
     listError,
+    hasMoreCustomers: nextCursor !== null,
+    loadingMore,
     selectedCustomerId,
     selectedCustomer,
     selectedCustomerName,
@@ -425,6 +446,7 @@ export function useCustomerCoreWithOptions(options: UseCustomerCoreOptions = {})
     deletingPhoto,
     photoError,
     loadCustomers,
+    loadMoreCustomers,
     handleSelectCustomer,
     beginCreateCustomer,
     submitCustomer,
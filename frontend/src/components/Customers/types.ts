@@ -76,20 +76,25 @@ export type CustomerListItem = {
   id: number;
   first_name: string;
   middle_name: string | null;
-  customer_photo_object_key: string | null;
   last_name: string;
+  suffix: string | null;
+  customer_photo_object_key: string | null;
   phone_number: string | null;
-  instagram_handle: string | null;
   email: string | null;
   date_of_birth: string;
+  has_left_country: boolean;
+  has_no_ssn: boolean;
   active: boolean;
+  created_at: string;
 };
 
 export type CustomerListResponse = {
   items: CustomerListItem[];
-  total: number;
+  total: number | null;
+  total_is_estimate: boolean;
   page: number;
   size: number;
+  next_cursor: string | null;
 };
 
 export type CustomerRead = {
@@ -25,8 +25,11 @@ type PendingItem = {
 };
 type PendingResponse = {
   items: PendingItem[];
+  total: number;
 };
 
+const PENDING_PAGE_SIZE = 1000;
+
 function extractFileName(contentDisposition: string | null, fallback: string): string {
   if (!contentDisposition) {
     return fallback;
@@ -108,16 +111,24 @@ export default function Reports() {
     async function loadExpiringRows() {
       setLoadingTable(true);
       try {
-        const response = await apiFetch("/dashboard/pending?days_ahead=90&include_notified=true");
-        if (!response.ok) {
-          throw new Error(`Failed to load pending rows: ${response.status}`);
+        const rows: PendingItem[] = [];
+        // The endpoint caps limit at 1000, so page until every row is loaded.
+        for (;;) {
+          const response = await apiFetch(
+            "/dashboard/pending?days_ahead=90&include_notified=true" +
+              "&document_type=nj_driver_license&document_type=brazil_driver_license" +
+              `&limit=${PENDING_PAGE_SIZE}&offset=${rows.length}`,
+          );
+          if (!response.ok) {
+            throw new Error(`Failed to load pending rows: ${response.status}`);
+          }
+          const data = (await response.json()) as PendingResponse;
+          rows.push(...data.items);
+          if (data.items.length === 0 || rows.length >= data.total) {
+            break;
+          }
         }
-        const data = (await response.json()) as PendingResponse;
-        setPendingRows(
-          data.items.filter(
-            (item) => item.document_type === "nj_driver_license" || item.document_type === "brazil_driver_license",
-          ),
-        );
+        setPendingRows(rows);
       } catch {
         setPendingRows([]);
       } finally {